@@ -7,7 +7,9 @@ import streamlit as st
 from config.config import Config
 from llm.llm_setup import LLMFactory
 from tennis.tennis_core import TennisMappingTools, TennisPromptBuilder
+from tennis.schema_digest import read_schema_digest, read_full_info_tokens, estimate_tokens
 from graph.langgraph_builder import LangGraphBuilder
+from services.sql_result_cache import SQLResultCache
 
 
 @st.cache_resource
@@ -45,19 +47,34 @@ def setup_langgraph_agent():
     base_tools = toolkit.get_tools()
     
     # Add cached tennis mapping tools for better performance
-    tennis_tools = TennisMappingTools.create_all_mapping_tools()
+    tennis_tools = TennisMappingTools.create_all_mapping_tools(db_config["db_path"])
     all_tools = base_tools + tennis_tools
     
-    # Create optimized prompt
-    db_schema = db.get_table_info()
-    system_prompt = TennisPromptBuilder.create_system_prompt(db_schema)
+    # Create optimized prompt: the compact schema digest precomputed by load_data is
+    # resent on every agent turn; databases built before it use the full table info
+    schema_digest = read_schema_digest(db_config["db_path"])
+    system_prompt = TennisPromptBuilder.create_system_prompt(schema_digest or db.get_table_info())
+    if schema_digest:
+        # The full table info is never generated here: load_data stored its token estimate
+        prompt_tokens = estimate_tokens(system_prompt)
+        full_info_tokens = read_full_info_tokens(db_config["db_path"])
+        if full_info_tokens is not None:
+            full_prompt_tokens = prompt_tokens - estimate_tokens(schema_digest) + full_info_tokens
+            print(f"System prompt: ~{prompt_tokens:,} tokens with the schema digest "
+                  f"(~{full_prompt_tokens:,} with full table info)")
+        else:
+            print(f"System prompt: ~{prompt_tokens:,} tokens with the schema digest")
+    else:
+        print(f"System prompt: ~{estimate_tokens(system_prompt):,} tokens "
+              "(no schema digest in the database - rebuild it with load_data to shorten the prompt)")
     prompt = TennisPromptBuilder.create_optimized_prompt_template(system_prompt)
     
     # Bind tools to LLM
     llm_with_tools = llm.bind_tools(all_tools)
     
-    # Build graph
-    graph_builder = LangGraphBuilder(all_tools, llm_with_tools, prompt)
+    # Build graph (identical SQL across turns and sessions is answered from the result cache)
+    sql_result_cache = SQLResultCache(db_config["db_path"])
+    graph_builder = LangGraphBuilder(all_tools, llm_with_tools, prompt, sql_result_cache)
     runnable_graph = graph_builder.build_graph()
     
     print("--- LangGraph Agent Compiled Successfully with Gemini ---")
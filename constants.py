@@ -9,11 +9,31 @@ DEFAULT_DB_PATH = "sqlite:///tennis_data.db"
 # LLM Configuration
 DEFAULT_MODEL = "gemini-2.5-flash-lite"
 DEFAULT_TEMPERATURE = 0
+# Tool calls of one agent turn run concurrently on up to this many threads
+TOOL_NODE_MAX_WORKERS = 8
 
 # Application Configuration
 APP_TITLE = "🎾 AskTennis: The Advanced AI Engine"
 APP_SUBTITLE = "#### Powered by Gemini & LangGraph (Stateful Agent)"
 
+# Filter panel: player suggestions shown for a search (see DatabaseService.search_players)
+PLAYER_SUGGESTION_LIMIT = 50
+
+# Query Cache Configuration (services/query_cache.py)
+# Results are invalidated when the database file changes, not after a TTL
+QUERY_CACHE_MAX_ENTRIES = 512
+QUERY_CACHE_MAX_BYTES = 256 * 1024 * 1024
+# Log hit/miss counters every this many lookups (0 disables)
+QUERY_CACHE_STATS_INTERVAL = 100
+# Answers kept by the agent answer cache (services/answer_cache.py)
+ANSWER_CACHE_MAX_ENTRIES = 1000
+# Player search indexes kept (one per database file, rebuilt with the database)
+PLAYER_SEARCH_INDEX_CACHE_ENTRIES = 4
+# sql_db_query results kept by the agent's SQL result cache (services/sql_result_cache.py)
+SQL_RESULT_CACHE_MAX_ENTRIES = 512
+SQL_RESULT_CACHE_MAX_BYTES = 64 * 1024 * 1024
+# Larger results are returned but not cached
+SQL_RESULT_CACHE_MAX_ENTRY_BYTES = 1024 * 1024
 
 # Logging Configuration
 LOG_FORMAT = "%(asctime)s - %(levelname)s - %(message)s"
@@ -5,11 +5,14 @@ Extracted from agent_setup.py for better modularity.
 
 from langgraph.graph import StateGraph, END
 from langgraph.checkpoint.memory import MemorySaver
-from langchain_core.messages import AIMessage
+from langchain_core.messages import AIMessage, ToolMessage
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from constants import TOOL_NODE_MAX_WORKERS
 from tennis_logging.simplified_factory import log_tool_usage, log_database_query, log_error
 from agent.agent_state import AgentState
-from typing import List, Any
+from services.sql_result_cache import SQLResultCache
+from typing import List, Any, Optional
 
 
 class LangGraphBuilder:
@@ -22,10 +25,11 @@ class LangGraphBuilder:
     2. build_graph() - Main entry point, builds and compiles the graph
     3. create_agent_node() - Creates agent node (called by build_graph)
     4. create_tool_node() - Creates tool node (called by build_graph)
+       execute_tool_call() - Runs one tool call (called by the tool node)
     5. create_conditional_edges() - Creates routing logic (called by build_graph)
     """
     
-    def __init__(self, tools: List[Any], llm_with_tools, prompt):
+    def __init__(self, tools: List[Any], llm_with_tools, prompt, sql_result_cache: Optional[SQLResultCache] = None):
         """
         Initialize the graph builder.
         
@@ -33,10 +37,13 @@ class LangGraphBuilder:
             tools: List of tools available to the agent
             llm_with_tools: LLM instance with bound tools
             prompt: Prompt template for the agent
+            sql_result_cache: Cache for sql_db_query results (None disables caching)
         """
         self.tools = tools
         self.llm_with_tools = llm_with_tools
         self.prompt = prompt
+        self.sql_result_cache = sql_result_cache
+        self.tools_by_name = {tool.name: tool for tool in tools}
     
     def build_graph(self):
         """
@@ -92,6 +99,9 @@ class LangGraphBuilder:
         """
         Create the tool node that executes tools with logging.
         
+        All tool calls of an agent turn run concurrently, so a question needing
+        several lookups costs one LLM round trip instead of one per lookup.
+        
         Returns:
             Tool node function
         """
@@ -100,81 +110,113 @@ class LangGraphBuilder:
             messages = state["messages"]
             last_message = messages[-1]
             
-            if hasattr(last_message, 'tool_calls') and last_message.tool_calls:
-                for tool_call in last_message.tool_calls:
-                    tool_name = tool_call["name"]
-                    tool_input = tool_call["args"]
-                    
-                    # Loop detection: Check if sql_db_query_checker was just called with the same query
-                    if tool_name == "sql_db_query_checker":
-                        query = tool_input.get("query", "")
-                        # Check recent AIMessages for tool_calls with the same query
-                        recent_checker_calls = 0
-                        for msg in messages[-10:]:
-                            if isinstance(msg, AIMessage) and hasattr(msg, 'tool_calls') and msg.tool_calls:
-                                for tc in msg.tool_calls:
-                                    if isinstance(tc, dict) and tc.get("name") == "sql_db_query_checker":
-                                        tc_args = tc.get("args", {})
-                                        if isinstance(tc_args, dict) and tc_args.get("query") == query:
-                                            recent_checker_calls += 1
-                        if recent_checker_calls > 0:
-                            # Query was already validated - log warning
-                            log_error(
-                                ValueError("Query validation loop detected - query already validated"),
-                                f"sql_db_query_checker called multiple times for same query. Use sql_db_query to execute.",
-                                component="langgraph_builder"
-                            )
-                            # Still execute the checker, but log the warning
-                    
-                    # Log tool usage start
-                    log_tool_usage(tool_name, tool_input, "Executing...", None, component="langgraph_builder")
-                    
-                    # Find the tool and execute it
-                    for tool in self.tools:
-                        if tool.name == tool_name:
-                            try:
-                                start_time = datetime.now()
-                                result = tool.invoke(tool_input)
-                                end_time = datetime.now()
-                                execution_time = (end_time - start_time).total_seconds()
-                                
-                                # Log tool result
-                                log_tool_usage(tool_name, tool_input, result, execution_time, component="langgraph_builder")
-                                
-                                # If it's a database query, log it separately
-                                if tool_name == "sql_db_query":
-                                    log_database_query(
-                                        tool_input.get("query", ""), 
-                                        result, 
-                                        execution_time,
-                                        component="langgraph_builder"
-                                    )
-                                
-                                # If sql_db_query_checker returned formatted SQL, add a hint to execute
-                                if tool_name == "sql_db_query_checker" and result and "SELECT" in str(result).upper():
-                                    result_str = str(result)
-                                    # Extract SQL from markdown code blocks if present
-                                    if "```" in result_str:
-                                        # Add hint message
-                                        hint = "\n\n[Note: Query validation successful. Use sql_db_query with this exact query to retrieve data.]"
-                                        result = result_str + hint
-                                
-                                return {"messages": [AIMessage(content=str(result), tool_calls=[])]}
-                            except Exception as e:
-                                log_error(e, f"Tool execution failed: {tool_name}", component="langgraph_builder")
-                                return {
-                                    "messages": [
-                                        AIMessage(
-                                            content=f"Error executing {tool_name}: {str(e)}", 
-                                            tool_calls=[]
-                                        )
-                                    ]
-                                }
+            if not (hasattr(last_message, 'tool_calls') and last_message.tool_calls):
+                return {"messages": []}
+            
+            tool_calls = last_message.tool_calls
+            if len(tool_calls) == 1:
+                return {"messages": [self.execute_tool_call(tool_calls[0], messages)]}
             
-            return {"messages": []}
+            # Independent calls (e.g. several mapping lookups plus a query) run in parallel;
+            # results keep the order of the calls
+            with ThreadPoolExecutor(max_workers=min(len(tool_calls), TOOL_NODE_MAX_WORKERS)) as executor:
+                results = list(executor.map(
+                    lambda indexed: self.execute_tool_call(indexed[1], messages, indexed[0]),
+                    enumerate(tool_calls)
+                ))
+            return {"messages": results}
         
         return logged_tool_node
     
+    def execute_tool_call(self, tool_call: dict, messages: List[Any], index: int = 0) -> ToolMessage:
+        """
+        Execute one tool call with logging.
+        
+        Args:
+            tool_call: Tool call from the agent's AIMessage
+            messages: Conversation so far (for loop detection)
+            index: Position of the call in the AIMessage (names calls without an id)
+            
+        Returns:
+            ToolMessage answering the call (errors are reported in its content)
+        """
+        tool_name = tool_call["name"]
+        tool_input = tool_call["args"]
+        # Calls without an id get one unique within the turn, so parallel calls
+        # of the same tool do not share a tool_call_id
+        tool_call_id = tool_call.get("id") or f"{tool_name}_{index}"
+        
+        # Loop detection: Check if sql_db_query_checker was just called with the same query
+        if tool_name == "sql_db_query_checker":
+            query = tool_input.get("query", "")
+            # Check recent AIMessages for tool_calls with the same query
+            recent_checker_calls = 0
+            for msg in messages[-10:]:
+                if isinstance(msg, AIMessage) and hasattr(msg, 'tool_calls') and msg.tool_calls:
+                    for tc in msg.tool_calls:
+                        if isinstance(tc, dict) and tc.get("name") == "sql_db_query_checker":
+                            tc_args = tc.get("args", {})
+                            if isinstance(tc_args, dict) and tc_args.get("query") == query:
+                                recent_checker_calls += 1
+            if recent_checker_calls > 0:
+                # Query was already validated - log warning
+                log_error(
+                    ValueError("Query validation loop detected - query already validated"),
+                    f"sql_db_query_checker called multiple times for same query. Use sql_db_query to execute.",
+                    component="langgraph_builder"
+                )
+                # Still execute the checker, but log the warning
+        
+        # Log tool usage start
+        log_tool_usage(tool_name, tool_input, "Executing...", None, component="langgraph_builder")
+        
+        tool = self.tools_by_name.get(tool_name)
+        if tool is None:
+            log_error(KeyError(tool_name), f"Unknown tool requested: {tool_name}", component="langgraph_builder")
+            return ToolMessage(content=f"Error: unknown tool {tool_name}", name=tool_name,
+                               tool_call_id=tool_call_id, status="error")
+        
+        try:
+            start_time = datetime.now()
+            cache_details = None
+            if tool_name == "sql_db_query" and self.sql_result_cache is not None:
+                result, cache_details = self.sql_result_cache.run(
+                    tool_input.get("query", ""),
+                    lambda: tool.invoke(tool_input)
+                )
+            else:
+                result = tool.invoke(tool_input)
+            end_time = datetime.now()
+            execution_time = (end_time - start_time).total_seconds()
+            
+            # Log tool result
+            log_tool_usage(tool_name, tool_input, result, execution_time,
+                           component="langgraph_builder", cache=cache_details)
+            
+            # If it's a database query, log it separately
+            if tool_name == "sql_db_query":
+                log_database_query(
+                    tool_input.get("query", ""), 
+                    result, 
+                    execution_time,
+                    component="langgraph_builder"
+                )
+            
+            # If sql_db_query_checker returned formatted SQL, add a hint to execute
+            if tool_name == "sql_db_query_checker" and result and "SELECT" in str(result).upper():
+                result_str = str(result)
+                # Extract SQL from markdown code blocks if present
+                if "```" in result_str:
+                    # Add hint message
+                    hint = "\n\n[Note: Query validation successful. Use sql_db_query with this exact query to retrieve data.]"
+                    result = result_str + hint
+            
+            return ToolMessage(content=str(result), name=tool_name, tool_call_id=tool_call_id)
+        except Exception as e:
+            log_error(e, f"Tool execution failed: {tool_name}", component="langgraph_builder")
+            return ToolMessage(content=f"Error executing {tool_name}: {str(e)}", name=tool_name,
+                               tool_call_id=tool_call_id, status="error")
+    
     def create_conditional_edges(self):
         """
         Create the conditional edges function for the graph.
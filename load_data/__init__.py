@@ -5,8 +5,13 @@ This package contains modules for:
 - Configuration (config.py)
 - Data loading (data_loaders.py)
 - Data transformation (data_transformers.py)
+- Table schemas (schema.py)
+- Vectorized score parsing (score_parser.py)
+- In-memory dtype plan for loaded frames (dtypes.py)
 - Database building (database_builder.py)
 - Database verification (database_verifier.py)
+- Source file manifest for incremental rebuilds (manifest.py)
+- Columnar staging cache for parsed source CSVs (staging.py)
 - Utilities (utils.py)
 """
 
@@ -47,4 +47,44 @@ LOAD_FED_CUP = True                # Fed Cup (BJK Cup) matches
 CREATE_TABLE_MATCHES = True          # Create matches table
 CREATE_TABLE_PLAYERS = True          # Create players table
 CREATE_TABLE_RANKINGS = True         # Create rankings table
+CREATE_TABLE_PLAYER_MATCHES = True   # Create player_matches (one row per player per match, needs matches)
+CREATE_TABLE_PLAYER_AGGREGATES = True  # Create player_aggregates (per-player counters by year/surface/level, needs player_matches)
+CREATE_TABLE_PLAYER_NAMES = True    # Create player_names (normalized name -> tour/player_id index, needs players and/or matches)
+
+# Index Creation Switch
+CREATE_INDEXES = True                # Build the declared indexes (load_data/schema.py) after loading
+
+# --- Bulk Write Configuration ---
+# Rows converted and sent to executemany per batch (bounds peak memory while writing)
+BULK_INSERT_CHUNK_SIZE = 50_000
+# SQLite page cache used during the build, in KiB (passed as a negative cache_size)
+BUILD_CACHE_SIZE_KB = 512 * 1024
+
+# --- Incremental Build Configuration ---
+# When True, a rerun compares every source CSV against the manifest stored in the
+# database and only reloads the rows of files that changed (see load_data/manifest.py).
+# A database without a manifest always gets a full build.
+INCREMENTAL_BUILD = False
+
+# --- Staging Cache Configuration ---
+# Keep a typed, uncompressed Arrow (Feather) copy of every parsed source CSV in
+# STAGING_DIR next to a fingerprint of the source file (see load_data/staging.py).
+# Unchanged files are then memory-mapped and converted instead of parsed again. Needs pyarrow;
+# without it (or with USE_STAGING_CACHE = False) the CSVs are always parsed.
+USE_STAGING_CACHE = True
+STAGING_DIR = os.path.join(PROJECT_ROOT, "data", ".staging")
+
+# --- Rankings Streaming Configuration ---
+# When True, the rankings decades are not concatenated in memory: each file is
+# read in chunks of RANKINGS_CHUNK_SIZE rows, enriched, name-joined and appended
+# straight into its SQLite table, so peak memory is bounded by the chunk size.
+STREAM_RANKINGS = True
+RANKINGS_CHUNK_SIZE = 250_000
+
+# --- Parallel Loading Configuration ---
+# Parse the per-year and per-decade source CSVs concurrently in a process pool.
+# Results are always concatenated in the same file order as a sequential load.
+# Set PARALLEL_LOADING to False to read the files one after another.
+PARALLEL_LOADING = True
+LOAD_WORKERS = os.cpu_count() or 1   # Worker processes used for CSV parsing
 
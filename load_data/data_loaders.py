@@ -5,9 +5,11 @@ This module contains functions that load tennis data from CSV files,
 including players, rankings, and matches data.
 """
 
+import numpy as np
 import pandas as pd
 import glob
 import os
+from concurrent.futures import ProcessPoolExecutor
 
 # Import configuration
 from .config import (
@@ -16,13 +18,244 @@ from .config import (
     LOAD_ATP_RANKINGS, LOAD_WTA_RANKINGS,
     LOAD_MAIN_TOUR_MATCHES, LOAD_AMATEUR_MATCHES,
     LOAD_ATP_QUALIFYING, LOAD_ATP_CHALLENGER, LOAD_ATP_CHALLENGER_QUAL,
-    LOAD_ATP_FUTURES, LOAD_WTA_QUALIFYING, LOAD_WTA_ITF
+    LOAD_ATP_FUTURES, LOAD_WTA_QUALIFYING, LOAD_WTA_ITF,
+    PARALLEL_LOADING, LOAD_WORKERS
 )
 
 # Import utilities
 from .utils import ProgressTracker
+from .dtypes import (
+    MATCHES_READ_DTYPES, PLAYERS_READ_DTYPES, RANKINGS_READ_DTYPES,
+    apply_dtypes, concat_frames, report_frame_memory
+)
+from .staging import read_staged, write_staged, iter_staged_chunks
+
+
+# ============================================================================
+# Source File Readers
+# ============================================================================
+
+# Qualifying/challenger/futures/ITF files may be skipped when they fail to
+# parse; a main tour, amateur or rankings file that fails stops the build
+OPTIONAL_SOURCE_PATTERNS = ("_matches_qual_chall_", "_matches_futures_", "_matches_qual_itf_")
+
+
+def is_optional_source_file(file_path):
+    """Return True if a source file may be skipped when it cannot be read."""
+    name = os.path.basename(file_path)
+    return any(pattern in name for pattern in OPTIONAL_SOURCE_PATTERNS)
+
+
+def parse_source_csv(file_path, read_kwargs=None):
+    """
+    Parse a source CSV, honoring its dtype plan where the file allows.
+    
+    Args:
+        file_path: Path to the CSV file
+        read_kwargs: Extra keyword arguments passed to pd.read_csv. A 'dtype'
+            plan (see dtypes.py) that the file does not fit falls back to
+            inferred dtypes, converting each planned column that does fit
+    
+    Returns:
+        Parsed DataFrame
+    """
+    read_kwargs = read_kwargs or {}
+    try:
+        return pd.read_csv(file_path, index_col=False, **read_kwargs)
+    except (TypeError, ValueError) as e:
+        if 'dtype' not in read_kwargs:
+            raise
+        print(f"  Note: {os.path.basename(file_path)} does not fit its dtype plan ({e}), "
+              f"reading with inferred dtypes")
+        fallback_kwargs = {key: value for key, value in read_kwargs.items() if key != 'dtype'}
+        df = pd.read_csv(file_path, index_col=False, **fallback_kwargs)
+        failed = apply_dtypes(df, read_kwargs['dtype'])
+        if failed:
+            print(f"  Note: {os.path.basename(file_path)} keeps inferred dtypes for {failed}")
+        return df
+
+
+def read_csv_staged(file_path, read_kwargs=None):
+    """
+    Load a source CSV from its staged Arrow copy, or parse and stage it.
+    
+    Args:
+        file_path: Path to the CSV file
+        read_kwargs: Extra keyword arguments passed to pd.read_csv
+    
+    Returns:
+        Parsed DataFrame
+    """
+    df = read_staged(file_path, read_kwargs)
+    if df is None:
+        df = parse_source_csv(file_path, read_kwargs)
+        write_staged(file_path, df, read_kwargs)
+    return df
+
+
+def iter_source_chunks(file_path, chunk_size, dtype_plan=None):
+    """
+    Read a source CSV in chunks of at most chunk_size rows.
+    
+    A current staged copy (see staging.py) is streamed from its memory map;
+    otherwise the CSV is parsed chunk by chunk. Chunks are parsed with inferred
+    dtypes and then converted column by column, so a value that does not fit
+    the plan halfway through the file cannot abort a partly written stream.
+    
+    Args:
+        file_path: Path to the CSV file
+        chunk_size: Maximum rows per chunk
+        dtype_plan: Optional dict of column -> dtype (see dtypes.py)
+    
+    Yields:
+        DataFrames with a _source_file column added
+    """
+    chunks = iter_staged_chunks(file_path, chunk_size, {'dtype': dtype_plan} if dtype_plan else None)
+    if chunks is None:
+        chunks = pd.read_csv(file_path, index_col=False, chunksize=chunk_size)
+    for chunk in chunks:
+        if dtype_plan:
+            apply_dtypes(chunk, dtype_plan)
+        chunk['_source_file'] = pd.Categorical.from_codes(
+            np.zeros(len(chunk), dtype=np.int8), categories=[file_path]
+        )
+        yield chunk
+
+
+def read_source_file(file_path, tour=None, read_kwargs=None):
+    """
+    Read a single source CSV and tag it with its tour and source file.
+    
+    This is a module-level function so it can be pickled into worker processes.
+    Unchanged files are loaded from the staging cache (see staging.py).
+    
+    Args:
+        file_path: Path to the CSV file
+        tour: Tour name ('ATP' or 'WTA') to add as a column, or None to skip
+        read_kwargs: Extra keyword arguments passed to pd.read_csv
+    
+    Returns:
+        DataFrame with tour (if given) and _source_file columns added
+    """
+    df = read_csv_staged(file_path, read_kwargs)
+    if tour is not None:
+        # Add tour column directly (CSV files don't have tour column)
+        df['tour'] = tour
+    # One category per file instead of a path string per row
+    df['_source_file'] = pd.Categorical.from_codes(np.zeros(len(df), dtype=np.int8), categories=[file_path])
+    return df
+
+
+def _read_source_file_safe(spec):
+    """
+    Worker entry point: read one (file_path, tour, read_kwargs) spec.
+    
+    Returns:
+        Tuple of (file_path, DataFrame or None, exception or None)
+    """
+    file_path, tour, read_kwargs = spec
+    try:
+        return file_path, read_source_file(file_path, tour, read_kwargs), None
+    except Exception as e:
+        return file_path, None, e
 
 
+def read_source_files(file_specs, step_name="Loading"):
+    """
+    Read many source CSVs, in a process pool when PARALLEL_LOADING is enabled.
+    
+    Results are returned in the same order as file_specs regardless of which
+    worker finishes first, so concatenating them is deterministic and identical
+    to a sequential load. Optional files (see is_optional_source_file) that
+    fail to parse are reported and skipped.
+    
+    Args:
+        file_specs: List of (file_path, tour, read_kwargs) tuples
+        step_name: Label for the progress tracker
+    
+    Returns:
+        List of (file_path, DataFrame) tuples in file_specs order
+    
+    Raises:
+        Exception: The read error of the first required file that failed to parse
+    """
+    if not file_specs:
+        return []
+    
+    workers = min(LOAD_WORKERS, len(file_specs)) if PARALLEL_LOADING else 1
+    progress = ProgressTracker(len(file_specs), step_name)
+    
+    if workers > 1:
+        print(f"Reading {len(file_specs)} files with {workers} worker processes...")
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # executor.map yields results in submission order
+            results = list(_collect(executor.map(_read_source_file_safe, file_specs), progress))
+    else:
+        results = list(_collect(map(_read_source_file_safe, file_specs), progress))
+    
+    progress.complete()
+    
+    frames = []
+    for file_path, df, error in results:
+        if error is None:
+            frames.append((file_path, df))
+        elif is_optional_source_file(file_path):
+            print(f"  Error loading {file_path}: {error} (skipped)")
+        else:
+            print(f"  Error loading {file_path}: {error}")
+            raise error
+    return frames
+
+
+def _collect(results, progress):
+    """Yield worker results while advancing the progress tracker."""
+    for file_path, df, error in results:
+        progress.update(1, f"Loaded {os.path.basename(file_path)}")
+        yield file_path, df, error
+
+
+
+def get_player_source_files():
+    """
+    List the player source files that exist on disk, honoring the load switches.
+    
+    Returns:
+        List of (file_path, tour) tuples, ATP first
+    """
+    player_files = []
+    for tour, enabled, relative_path in (
+        ('ATP', LOAD_ATP_PLAYERS, "data/tennis_atp/atp_players.csv"),
+        ('WTA', LOAD_WTA_PLAYERS, "data/tennis_wta/wta_players.csv"),
+    ):
+        if not enabled:
+            print(f"Skipping {tour} players (LOAD_{tour}_PLAYERS = False)")
+            continue
+        players_path = os.path.join(PROJECT_ROOT, relative_path)
+        if os.path.exists(players_path):
+            player_files.append((players_path, tour))
+        else:
+            print(f"Warning: {players_path} not found")
+    return player_files
+
+def load_players_file(players_path, tour):
+    """
+    Load a single players file and tag it with its tour.
+    
+    Args:
+        players_path: Path to atp_players.csv or wta_players.csv
+        tour: Tour name ('ATP' or 'WTA')
+    
+    Returns:
+        Raw players DataFrame with a _source column - enrichment happens in transformers
+    """
+    print(f"Reading {players_path}...")
+    players = read_csv_staged(players_path, {'dtype': PLAYERS_READ_DTYPES})
+    # Store source info for later enrichment
+    players['_source'] = tour
+    print(f"{tour} players loaded: {len(players)}")
+    report_frame_memory(players, f"{tour} players")
+    return players
+
 def load_players_data():
     """
     Loads player information from ATP and WTA player files separately.
@@ -30,48 +263,22 @@ def load_players_data():
     """
     print("--- Loading Player Information ---")
     
-    # Load ATP players
-    atp_players = pd.DataFrame()
-    if LOAD_ATP_PLAYERS:
-        atp_players_path = os.path.join(PROJECT_ROOT, "data/tennis_atp/atp_players.csv")
-        if os.path.exists(atp_players_path):
-            print(f"Reading {atp_players_path}...")
-            atp_players = pd.read_csv(atp_players_path, index_col=False)
-            # Store source info for later enrichment
-            atp_players['_source'] = 'ATP'
-            print(f"ATP players loaded: {len(atp_players)}")
-        else:
-            print(f"Warning: {atp_players_path} not found")
-    else:
-        print("Skipping ATP players (LOAD_ATP_PLAYERS = False)")
-    
-    # Load WTA players
-    wta_players = pd.DataFrame()
-    if LOAD_WTA_PLAYERS:
-        wta_players_path = os.path.join(PROJECT_ROOT, "data/tennis_wta/wta_players.csv")
-        if os.path.exists(wta_players_path):
-            print(f"Reading {wta_players_path}...")
-            wta_players = pd.read_csv(wta_players_path, index_col=False)
-            # Store source info for later enrichment
-            wta_players['_source'] = 'WTA'
-            print(f"WTA players loaded: {len(wta_players)}")
-        else:
-            print(f"Warning: {wta_players_path} not found")
-    else:
-        print("Skipping WTA players (LOAD_WTA_PLAYERS = False)")
+    players = {'ATP': pd.DataFrame(), 'WTA': pd.DataFrame()}
+    for players_path, tour in get_player_source_files():
+        players[tour] = load_players_file(players_path, tour)
+    atp_players, wta_players = players['ATP'], players['WTA']
     
     total_players = len(atp_players) + len(wta_players)
     print(f"Total players loaded: {total_players} (ATP: {len(atp_players)}, WTA: {len(wta_players)})")
     return atp_players, wta_players
 
-def load_rankings_data():
-    """
-    Loads rankings data from ATP and WTA ranking files separately.
-    Returns tuple of (atp_rankings_df, wta_rankings_df) - enrichment happens in transformers.
+def get_ranking_source_files():
     """
-    print("--- Loading Rankings Data ---")
+    List the ranking source files that exist on disk, honoring the load switches.
     
-    # Define ranking file patterns
+    Returns:
+        Tuple of (atp_ranking_files, wta_ranking_files) in load order
+    """
     atp_ranking_files = [
         os.path.join(PROJECT_ROOT, "data/tennis_atp/atp_rankings_70s.csv"),
         os.path.join(PROJECT_ROOT, "data/tennis_atp/atp_rankings_80s.csv"), 
@@ -91,87 +298,74 @@ def load_rankings_data():
         os.path.join(PROJECT_ROOT, "data/tennis_wta/wta_rankings_current.csv")
     ]
     
-    # Load ATP rankings
-    atp_rankings = []
+    existing_atp_files = []
     if LOAD_ATP_RANKINGS:
         existing_atp_files = [f for f in atp_ranking_files if os.path.exists(f)]
-        if existing_atp_files:
-            progress = ProgressTracker(len(existing_atp_files), "ATP Rankings Loading")
-            for file_path in atp_ranking_files:
-                if os.path.exists(file_path):
-                    progress.update(1, f"Loading {os.path.basename(file_path)}...")
-                    try:
-                        df = pd.read_csv(file_path, index_col=False)
-                        df['_source_file'] = file_path
-                        atp_rankings.append(df)
-                        print(f"  Loaded {len(df)} ATP ranking records")
-                    except Exception as e:
-                        print(f"  Error loading {file_path}: {e}")
-        else:
+        if not existing_atp_files:
             print("No ATP ranking files found!")
     else:
         print("Skipping ATP rankings (LOAD_ATP_RANKINGS = False)")
     
-    # Load WTA rankings
-    wta_rankings = []
+    existing_wta_files = []
     if LOAD_WTA_RANKINGS:
         existing_wta_files = [f for f in wta_ranking_files if os.path.exists(f)]
-        if existing_wta_files:
-            progress = ProgressTracker(len(existing_wta_files), "WTA Rankings Loading")
-            for file_path in wta_ranking_files:
-                if os.path.exists(file_path):
-                    progress.update(1, f"Loading {os.path.basename(file_path)}...")
-                    try:
-                        df = pd.read_csv(file_path, index_col=False)
-                        df['_source_file'] = file_path
-                        wta_rankings.append(df)
-                        print(f"  Loaded {len(df)} WTA ranking records")
-                    except Exception as e:
-                        print(f"  Error loading {file_path}: {e}")
-        else:
+        if not existing_wta_files:
             print("No WTA ranking files found!")
     else:
         print("Skipping WTA rankings (LOAD_WTA_RANKINGS = False)")
     
+    return existing_atp_files, existing_wta_files
+
+def load_rankings_data():
+    """
+    Loads rankings data from ATP and WTA ranking files separately.
+    Returns tuple of (atp_rankings_df, wta_rankings_df) - enrichment happens in transformers.
+    """
+    print("--- Loading Rankings Data ---")
+    
+    atp_ranking_files, wta_ranking_files = get_ranking_source_files()
+    
+    # Read both tours in one pool so all decade files are parsed concurrently
+    file_specs = [(f, None, {'dtype': RANKINGS_READ_DTYPES}) for f in atp_ranking_files + wta_ranking_files]
+    frames = read_source_files(file_specs, "Rankings Loading")
+    
+    atp_file_set = set(atp_ranking_files)
+    atp_rankings = [df for file_path, df in frames if file_path in atp_file_set]
+    wta_rankings = [df for file_path, df in frames if file_path not in atp_file_set]
+    
     # Combine ATP rankings
     atp_rankings_df = pd.DataFrame()
     if atp_rankings:
-        atp_rankings_df = pd.concat(atp_rankings, ignore_index=True)
+        atp_rankings_df = concat_frames(atp_rankings)
         print(f"Total ATP rankings loaded: {len(atp_rankings_df)}")
+        report_frame_memory(atp_rankings_df, "ATP rankings")
     
     # Combine WTA rankings
     wta_rankings_df = pd.DataFrame()
     if wta_rankings:
-        wta_rankings_df = pd.concat(wta_rankings, ignore_index=True)
+        wta_rankings_df = concat_frames(wta_rankings)
         print(f"Total WTA rankings loaded: {len(wta_rankings_df)}")
+        report_frame_memory(wta_rankings_df, "WTA rankings")
     
     return atp_rankings_df, wta_rankings_df
 
-def load_matches_data():
+def get_match_source_files():
     """
-    Loads match data from ATP and WTA files.
-    Returns raw DataFrames - enrichment happens in transformers.
+    List the match source files that exist on disk, honoring the load switches.
+    
+    The order is fixed (main tour ATP years, main tour WTA years, amateur,
+    ATP qualifying/challenger, ATP futures, WTA qualifying/ITF) so that the
+    combined match frame is identical between sequential and parallel loads.
+    
+    Returns:
+        List of (file_path, tour) tuples in load order
     """
-    print("--- Loading Match Data ---")
-    master_df_list = []
+    match_files = []
     
-    # Load main tour matches (ATP/WTA year files)
+    # Main tour matches (ATP/WTA year files)
     if LOAD_MAIN_TOUR_MATCHES:
-        # Calculate total files to process
-        total_files = 0
-        for data_dir in DATA_DIRS:
-            for year in YEARS_MAIN_TOUR:
-                file_pattern = os.path.join(data_dir, f"*_matches_{year}.csv")
-                if glob.glob(file_pattern):
-                    total_files += 1
-        
-        # Initialize progress tracker for match files
-        progress = ProgressTracker(total_files, "Match Loading")
-        
         # Loop through each data directory (ATP and WTA)
         for data_dir in DATA_DIRS:
-            print(f"\n--- Processing directory: {data_dir} ---")
-            
             # Determine tour based on directory
             if 'atp' in data_dir.lower():
                 tour = 'ATP'
@@ -180,50 +374,25 @@ def load_matches_data():
             else:
                 tour = 'Unknown'
             
-            df_list = []
             for year in YEARS_MAIN_TOUR:
                 # Construct the expected file path pattern for each year
                 file_pattern = os.path.join(data_dir, f"*_matches_{year}.csv")
                 matching_files = glob.glob(file_pattern)
-                
                 if matching_files:
-                    file_path = matching_files[0] # Use the first match found
-                    progress.update(1, f"Loading {os.path.basename(file_path)}...")
-                    df = pd.read_csv(file_path, low_memory=False, index_col=False)
-                    # Add tour column directly (CSV files don't have tour column)
-                    df['tour'] = tour
-                    df['_source_file'] = file_path
-                    df_list.append(df)
-                else:
-                    # This is not an error, just means data for that year/tour doesn't exist
-                    pass
-
-            if df_list:
-                # Combine all dataframes for the current tour (ATP or WTA)
-                tour_df = pd.concat(df_list, ignore_index=True)
-                master_df_list.append(tour_df)
+                    match_files.append((matching_files[0], tour))  # Use the first match found
+                # A missing year is not an error, data for that year/tour doesn't exist
     else:
         print("Skipping main tour matches (LOAD_MAIN_TOUR_MATCHES = False)")
-
-    # Load amateur tennis data (1877-1967)
+    
+    # Amateur tennis data (1877-1967)
     if LOAD_AMATEUR_MATCHES:
         amateur_file = os.path.join(PROJECT_ROOT, "data/tennis_atp/atp_matches_amateur.csv")
         if os.path.exists(amateur_file):
-            print(f"\n--- Loading Amateur Tennis Data (1877-1967) ---")
-            print(f"Reading {amateur_file}...")
-            amateur_df = pd.read_csv(amateur_file, low_memory=False, index_col=False)
-            # Add tour column directly (CSV files don't have tour column)
-            amateur_df['tour'] = 'ATP'  # Amateur data is from ATP source
-            amateur_df['_source_file'] = amateur_file
-            master_df_list.append(amateur_df)
-            print(f"Amateur matches loaded: {len(amateur_df)}")
+            match_files.append((amateur_file, 'ATP'))  # Amateur data is from ATP source
         else:
             print(f"Amateur tennis file not found: {amateur_file}")
     else:
-        print("\nSkipping amateur matches (LOAD_AMATEUR_MATCHES = False)")
-    
-    # Load qualifying/challenger/futures data
-    print(f"\n--- Loading Qualifying/Challenger/Futures Data ---")
+        print("Skipping amateur matches (LOAD_AMATEUR_MATCHES = False)")
     
     # ATP Qualifying/Challenger data (combined files)
     # Files are named: atp_matches_qual_chall_*.csv
@@ -232,29 +401,7 @@ def load_matches_data():
     if LOAD_ATP_QUALIFYING or LOAD_ATP_CHALLENGER or LOAD_ATP_CHALLENGER_QUAL:
         atp_qual_chall_files = glob.glob(os.path.join(PROJECT_ROOT, "data/tennis_atp/atp_matches_qual_chall_*.csv"))
         if atp_qual_chall_files:
-            print(f"Loading ATP Qualifying/Challenger data ({len(atp_qual_chall_files)} files)...")
-            atp_qual_chall_dfs = []
-            
-            # Initialize progress tracker for qual/chall files
-            progress = ProgressTracker(len(atp_qual_chall_files), "ATP Qual/Chall Loading")
-            
-            for file_path in sorted(atp_qual_chall_files):
-                try:
-                    progress.update(1, f"Loading {os.path.basename(file_path)}...")
-                    df = pd.read_csv(file_path, low_memory=False, index_col=False)
-                    # Add tour column directly (CSV files don't have tour column)
-                    df['tour'] = 'ATP'
-                    df['_source_file'] = file_path
-                    atp_qual_chall_dfs.append(df)
-                except Exception as e:
-                    print(f"  Error loading {file_path}: {e}")
-            
-            progress.complete()
-            
-            if atp_qual_chall_dfs:
-                atp_qual_chall_df = pd.concat(atp_qual_chall_dfs, ignore_index=True)
-                master_df_list.append(atp_qual_chall_df)
-                print(f"  ATP Qualifying/Challenger matches loaded: {len(atp_qual_chall_df)}")
+            match_files.extend((f, 'ATP') for f in sorted(atp_qual_chall_files))
         else:
             print("  No ATP Qualifying/Challenger files found (atp_matches_qual_chall_*.csv)")
     else:
@@ -263,30 +410,7 @@ def load_matches_data():
     # ATP Futures data
     if LOAD_ATP_FUTURES:
         atp_futures_files = glob.glob(os.path.join(PROJECT_ROOT, "data/tennis_atp/atp_matches_futures_*.csv"))
-        if atp_futures_files:
-            print(f"Loading ATP Futures data ({len(atp_futures_files)} files)...")
-            atp_futures_dfs = []
-            
-            # Initialize progress tracker for futures files
-            progress = ProgressTracker(len(atp_futures_files), "ATP Futures Loading")
-            
-            for file_path in sorted(atp_futures_files):
-                try:
-                    progress.update(1, f"Loading {os.path.basename(file_path)}...")
-                    df = pd.read_csv(file_path, low_memory=False, index_col=False)
-                    # Add tour column directly (CSV files don't have tour column)
-                    df['tour'] = 'ATP'
-                    df['_source_file'] = file_path
-                    atp_futures_dfs.append(df)
-                except Exception as e:
-                    print(f"  Error loading {file_path}: {e}")
-            
-            progress.complete()
-            
-            if atp_futures_dfs:
-                atp_futures_df = pd.concat(atp_futures_dfs, ignore_index=True)
-                master_df_list.append(atp_futures_df)
-                print(f"  ATP Futures matches loaded: {len(atp_futures_df)}")
+        match_files.extend((f, 'ATP') for f in sorted(atp_futures_files))
     else:
         print("Skipping ATP Futures (LOAD_ATP_FUTURES = False)")
     
@@ -297,41 +421,39 @@ def load_matches_data():
     if LOAD_WTA_QUALIFYING or LOAD_WTA_ITF:
         wta_qual_itf_files = glob.glob(os.path.join(PROJECT_ROOT, "data/tennis_wta/wta_matches_qual_itf_*.csv"))
         if wta_qual_itf_files:
-            print(f"Loading WTA Qualifying/ITF data ({len(wta_qual_itf_files)} files)...")
-            wta_qual_itf_dfs = []
-            
-            # Initialize progress tracker for WTA qual/itf files
-            progress = ProgressTracker(len(wta_qual_itf_files), "WTA Qual/ITF Loading")
-            
-            for file_path in sorted(wta_qual_itf_files):
-                try:
-                    progress.update(1, f"Loading {os.path.basename(file_path)}...")
-                    df = pd.read_csv(file_path, low_memory=False, index_col=False)
-                    # Add tour column directly (CSV files don't have tour column)
-                    df['tour'] = 'WTA'
-                    df['_source_file'] = file_path
-                    wta_qual_itf_dfs.append(df)
-                except Exception as e:
-                    print(f"  Error loading {file_path}: {e}")
-            
-            progress.complete()
-            
-            if wta_qual_itf_dfs:
-                wta_qual_itf_df = pd.concat(wta_qual_itf_dfs, ignore_index=True)
-                master_df_list.append(wta_qual_itf_df)
-                print(f"  WTA Qualifying/ITF matches loaded: {len(wta_qual_itf_df)}")
+            match_files.extend((f, 'WTA') for f in sorted(wta_qual_itf_files))
         else:
             print("  No WTA Qualifying/ITF files found (wta_matches_qual_itf_*.csv)")
     else:
         print("Skipping WTA Qualifying/ITF data (all switches set to False)")
     
+    return match_files
+
+def load_matches_data():
+    """
+    Loads match data from ATP and WTA files.
+    Returns raw DataFrames - enrichment happens in transformers.
+    """
+    print("--- Loading Match Data ---")
+    
+    match_files = get_match_source_files()
+    
+    # Parse every yearly/decade file concurrently with the declared dtype plan
+    # (low_memory=False keeps inference of the unplanned columns per file)
+    file_specs = [
+        (file_path, tour, {'low_memory': False, 'dtype': MATCHES_READ_DTYPES})
+        for file_path, tour in match_files
+    ]
+    master_df_list = [df for _, df in read_source_files(file_specs, "Match Loading")]
+    
     # Check if any data was loaded
     if not master_df_list:
         print("No match data found. Exiting.")
         return pd.DataFrame()
     
     # Combine all dataframes (raw data only - transformations happen in transformers)
-    matches_df = pd.concat(master_df_list, ignore_index=True)
+    matches_df = concat_frames(master_df_list)
 
     print(f"\nTotal matches loaded (Complete Tournament Coverage): {len(matches_df)}")
-    return matches_df
\ No newline at end of file
+    report_frame_memory(matches_df, "Matches")
+    return matches_df
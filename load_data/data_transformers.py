@@ -5,6 +5,7 @@ This module contains functions that transform and clean tennis match data,
 including date parsing, score parsing, surface inference, and tournament level standardization.
 """
 
+import numpy as np
 import pandas as pd
 import sys
 import os
@@ -20,6 +21,8 @@ try:
         LOAD_ATP_QUALIFYING, LOAD_ATP_CHALLENGER, LOAD_ATP_CHALLENGER_QUAL,
         LOAD_ATP_FUTURES, LOAD_WTA_QUALIFYING, LOAD_WTA_ITF
     )
+    from .manifest import source_key
+    from .score_parser import SET_COLUMNS, split_score_sets, parse_set_games
 except ImportError:
     # Fallback for direct execution
     sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -28,19 +31,87 @@ except ImportError:
         LOAD_ATP_QUALIFYING, LOAD_ATP_CHALLENGER, LOAD_ATP_CHALLENGER_QUAL,
         LOAD_ATP_FUTURES, LOAD_WTA_QUALIFYING, LOAD_WTA_ITF
     )
+    from load_data.manifest import source_key
+    from load_data.score_parser import SET_COLUMNS, split_score_sets, parse_set_games
+
+
+# First year of the Open Era (professionals admitted to the majors)
+OPEN_ERA_START_YEAR = 1968
+
+# Grand Slam surfaces by tournament name pattern (first match wins)
+GRAND_SLAM_SURFACES = [
+    ('wimbledon', 'Grass'),
+    ('french open', 'Clay'),
+    ('roland garros', 'Clay'),
+    ('us open', 'Hard'),
+    ('australian open', 'Hard'),
+]
+
+# Name hints for tourney_level 'G' events (later entries win)
+GRAND_SLAM_LEVEL_HINTS = [
+    ('wimbledon', 'Grass'),
+    ('french|roland', 'Clay'),
+    ('us open|australian|melbourne', 'Hard'),
+]
+
+# Values of the matches.surface_source column, in inference order
+SURFACE_SOURCES = ['recorded', 'grand_slam', 'tourney_year', 'tourney', 'tourney_level', 'era_default']
 
 
 # ============================================================================
 # Data Enrichment Functions (moved from data_loaders.py)
 # ============================================================================
 
-def enrich_players_data(df, tour=None):
+def to_source_file_keys(source_paths):
+    """
+    Convert the loader's _source_file paths into manifest keys.
+    
+    The keys are stored in the source_file column so an incremental rebuild can
+    replace exactly the rows that came from a changed file. The conversion runs
+    once per distinct file rather than once per row.
+    
+    Args:
+        source_paths: Series of source file paths
+    
+    Returns:
+        Categorical Series of source keys (paths relative to the project root)
+    """
+    source_paths = source_paths.astype('category')
+    return source_paths.cat.rename_categories(
+        [source_key(path) for path in source_paths.cat.categories]
+    )
+
+
+def tour_from_source_files(source_files):
+    """
+    Derive the tour from loader source file paths ('atp' or 'wta' in the path).
+    
+    Args:
+        source_files: Series of source file paths
+    
+    Returns:
+        Series of 'ATP', 'WTA', or 'Unknown', indexed like source_files
+    """
+    # A handful of files cover millions of rows: classify each distinct path once
+    codes, uniques = pd.factorize(source_files)
+    paths = pd.Series(uniques, dtype=object).astype(str).str.lower()
+    tours = np.select(
+        [paths.str.contains('atp', regex=False), paths.str.contains('wta', regex=False)],
+        ['ATP', 'WTA'],
+        default='Unknown'
+    )
+    # Code -1 (missing path) maps to 'Unknown' appended at the end
+    return pd.Series(np.append(tours, 'Unknown')[codes], index=source_files.index)
+
+
+def enrich_players_data(df, tour=None, inplace=False):
     """
     Enrich player data with tour information and derived columns.
     
     Args:
         df: DataFrame with player data (may have _source column from loader)
         tour: Tour name ('ATP' or 'WTA') if not already in DataFrame or _source column
+        inplace: If True, modify df in place instead of working on a copy
     
     Returns:
         DataFrame with enriched columns
@@ -48,12 +119,13 @@ def enrich_players_data(df, tour=None):
     if df.empty:
         return df
     
-    df = df.copy()
+    if not inplace:
+        df = df.copy()
     
     # Determine tour from _source column if available, otherwise use provided tour
     if '_source' in df.columns:
         df['tour'] = df['_source']
-        df = df.drop(columns=['_source'])
+        df.drop(columns=['_source'], inplace=True)
     elif tour and 'tour' not in df.columns:
         df['tour'] = tour
     
@@ -70,7 +142,7 @@ def enrich_players_data(df, tour=None):
     return df
 
 
-def enrich_rankings_data(df, tour=None, players_df=None):
+def enrich_rankings_data(df, tour=None, players_df=None, inplace=False, player_names=None):
     """
     Enrich rankings data with tour information, standardize columns, and add player names.
     
@@ -78,27 +150,31 @@ def enrich_rankings_data(df, tour=None, players_df=None):
         df: DataFrame with rankings data (may have _source_file column from loader)
         tour: Tour name ('ATP' or 'WTA') if not determinable from _source_file
         players_df: Optional DataFrame with player data to join player names
+        inplace: If True, modify df in place instead of working on a copy
+        player_names: Optional precomputed lookup from player_name_lookup()
+            (takes precedence over players_df)
     
     Returns:
-        DataFrame with enriched columns including player names if players_df provided
+        DataFrame with enriched columns including player names if names were provided
     """
     if df.empty:
         return df
     
-    df = df.copy()
+    if not inplace:
+        df = df.copy()
     
     # Determine tour from _source_file column if available
     if '_source_file' in df.columns:
-        df['tour'] = df['_source_file'].apply(
-            lambda x: 'ATP' if 'atp' in str(x).lower() else ('WTA' if 'wta' in str(x).lower() else 'Unknown')
-        )
-        df = df.drop(columns=['_source_file'])
+        df['tour'] = tour_from_source_files(df['_source_file'])
+        # Keep the originating file so incremental rebuilds can replace its rows
+        df['source_file'] = to_source_file_keys(df['_source_file'])
+        df.drop(columns=['_source_file'], inplace=True)
     elif tour and 'tour' not in df.columns:
         df['tour'] = tour
     
     # Drop 'tours' column from WTA rankings (unnecessary column)
     if 'tours' in df.columns:
-        df = df.drop(columns=['tours'])
+        df.drop(columns=['tours'], inplace=True)
     
     # Standardize data types
     if 'ranking_date' in df.columns:
@@ -113,44 +189,71 @@ def enrich_rankings_data(df, tour=None, players_df=None):
     # Remove invalid data
     required_cols = ['ranking_date', 'rank', 'player']
     if all(col in df.columns for col in required_cols):
-        df = df.dropna(subset=required_cols)
-    
-    # Add player names if players_df is provided
-    if players_df is not None and not players_df.empty and 'player' in df.columns:
-        # Create a lookup dictionary for player names
-        if 'full_name' in players_df.columns and 'player_id' in players_df.columns:
-            player_names = players_df.set_index('player_id')['full_name'].to_dict()
-            df['player_name'] = df['player'].map(player_names)
-        elif 'name_first' in players_df.columns and 'name_last' in players_df.columns and 'player_id' in players_df.columns:
-            # Create full_name if not present
-            players_df = players_df.copy()
-            players_df['full_name'] = players_df['name_first'] + ' ' + players_df['name_last']
-            player_names = players_df.set_index('player_id')['full_name'].to_dict()
-            df['player_name'] = df['player'].map(player_names)
+        df.dropna(subset=required_cols, inplace=True)
+    
+    # Integer date columns for indexed year/date filters
+    if 'ranking_date' in df.columns:
+        ranking_date = df['ranking_date'].dt
+        df['ranking_year'] = ranking_date.year.astype('Int16')
+        df['ranking_yyyymmdd'] = (
+            ranking_date.year * 10000 + ranking_date.month * 100 + ranking_date.day
+        ).astype('Int32')
+    
+    # Add player names if a lookup or players_df is provided
+    if player_names is None and players_df is not None:
+        player_names = player_name_lookup(players_df)
+    if player_names is not None and 'player' in df.columns:
+        df['player_name'] = df['player'].map(player_names)
     
     return df
 
 
-def classify_era(row):
+def player_name_lookup(players_df):
     """
-    Classify match era based on year: 1968+ = Open Era, <1968 = Closed Era.
+    Build the player_id -> full name lookup used to name-join rankings.
+    
+    Built once per tour, so chunked rankings loads can reuse it for every chunk.
     
     Args:
-        row: DataFrame row with tourney_date column
+        players_df: DataFrame with player_id and full_name (or name_first/name_last)
     
     Returns:
-        'Open Era', 'Closed Era', or 'Unknown'
+        Series of full names indexed by unique player_id (the last row wins for
+        duplicate ids), or None if players_df cannot provide names
     """
-    if pd.isna(row.get('tourney_date')):
-        return 'Unknown'
-    year = row['tourney_date'].year
-    if year >= 1968:
-        return 'Open Era'
+    if players_df is None or players_df.empty or 'player_id' not in players_df.columns:
+        return None
+    if 'full_name' in players_df.columns:
+        full_names = players_df['full_name']
+    elif 'name_first' in players_df.columns and 'name_last' in players_df.columns:
+        # Create full_name if not present
+        full_names = players_df['name_first'] + ' ' + players_df['name_last']
     else:
-        return 'Closed Era'
+        return None
+    lookup = pd.Series(full_names.to_numpy(), index=pd.Index(players_df['player_id']))
+    return lookup[~lookup.index.duplicated(keep='last')]
+
+
+def classify_era(tourney_dates):
+    """
+    Classify match era based on year: 1968+ = Open Era, <1968 = Closed Era.
+    
+    Args:
+        tourney_dates: Series of tourney dates (datetime64, NaT when unknown)
+    
+    Returns:
+        Series of 'Open Era', 'Closed Era', or 'Unknown', indexed like tourney_dates
+    """
+    years = tourney_dates.dt.year
+    era = np.select(
+        [years.isna().to_numpy(), (years >= OPEN_ERA_START_YEAR).to_numpy()],
+        ['Unknown', 'Open Era'],
+        default='Closed Era'
+    )
+    return pd.Series(era, index=tourney_dates.index)
 
 
-def categorize_match_types(df):
+def categorize_match_types(df, inplace=False):
     """
     Categorize matches into tournament types based on file source and match characteristics.
     This handles ATP Qualifying/Challenger/Futures and WTA Qualifying/ITF categorization.
@@ -159,6 +262,7 @@ def categorize_match_types(df):
     
     Args:
         df: DataFrame with match data (should already have tour column)
+        inplace: If True, modify df in place instead of working on a copy
     
     Returns:
         DataFrame with tournament_type column added
@@ -166,7 +270,8 @@ def categorize_match_types(df):
     if df.empty:
         return df
     
-    df = df.copy()
+    if not inplace:
+        df = df.copy()
     
     # Ensure required columns exist and convert to string efficiently
     if 'round' not in df.columns:
@@ -259,7 +364,7 @@ def categorize_match_types(df):
     return df
 
 
-def set_tour_column(df, tour=None):
+def set_tour_column(df, tour=None, inplace=False):
     """
     Set tour column if not already present. This is separated for optimization
     so categorize_match_types() can run before full enrichment.
@@ -267,6 +372,7 @@ def set_tour_column(df, tour=None):
     Args:
         df: DataFrame with match data (should already have tour column from loader)
         tour: Tour name ('ATP' or 'WTA') if tour column is missing
+        inplace: If True, modify df in place instead of working on a copy
     
     Returns:
         DataFrame with tour column set
@@ -274,7 +380,8 @@ def set_tour_column(df, tour=None):
     if df.empty:
         return df
     
-    df = df.copy()
+    if not inplace:
+        df = df.copy()
     
     # Tour column should already be set by loader, but handle edge cases
     if 'tour' not in df.columns:
@@ -283,9 +390,7 @@ def set_tour_column(df, tour=None):
         else:
             # Fallback: try to determine from _source_file if available
             if '_source_file' in df.columns:
-                df['tour'] = df['_source_file'].apply(
-                    lambda x: 'ATP' if 'atp' in str(x).lower() else ('WTA' if 'wta' in str(x).lower() else 'Unknown')
-                )
+                df['tour'] = tour_from_source_files(df['_source_file'])
             else:
                 df['tour'] = 'Unknown'
     
@@ -296,7 +401,7 @@ def set_tour_column(df, tour=None):
     return df
 
 
-def enrich_matches_data(df, tour=None, tournament_type=None, fill_missing_tournament_type=True):
+def enrich_matches_data(df, tour=None, tournament_type=None, fill_missing_tournament_type=True, inplace=False):
     """
     Enrich match data with tour, tournament_type, era, and other metadata.
     
@@ -305,6 +410,7 @@ def enrich_matches_data(df, tour=None, tournament_type=None, fill_missing_tourna
         tour: Tour name ('ATP' or 'WTA') if tour column is missing (fallback only)
         tournament_type: Tournament type if known (e.g., 'ATP_Futures', 'Main Tour')
         fill_missing_tournament_type: If True, fill missing tournament_type with 'Main Tour' (default: True)
+        inplace: If True, modify df in place instead of working on a copy
     
     Returns:
         DataFrame with enriched columns
@@ -312,7 +418,8 @@ def enrich_matches_data(df, tour=None, tournament_type=None, fill_missing_tourna
     if df.empty:
         return df
     
-    df = df.copy()
+    if not inplace:
+        df = df.copy()
     
     # Tour column should already be set by loader (or by set_tour_column if called earlier)
     # Just ensure any missing values are filled
@@ -323,9 +430,11 @@ def enrich_matches_data(df, tour=None, tournament_type=None, fill_missing_tourna
     if tournament_type and 'tournament_type' not in df.columns:
         df['tournament_type'] = tournament_type
     
-    # Remove _source_file column if present (used for debugging but not needed in final data)
+    # Replace the loader's _source_file path with a project-relative source_file key
+    # (used by incremental rebuilds to replace the rows of a changed file)
     if '_source_file' in df.columns:
-        df = df.drop(columns=['_source_file'])
+        df['source_file'] = to_source_file_keys(df['_source_file'])
+        df.drop(columns=['_source_file'], inplace=True)
     
     # Convert tourney_date to datetime if it exists
     if 'tourney_date' in df.columns:
@@ -333,7 +442,7 @@ def enrich_matches_data(df, tour=None, tournament_type=None, fill_missing_tourna
     
     # Apply era classification
     if 'tourney_date' in df.columns:
-        df['era'] = df.apply(classify_era, axis=1)
+        df['era'] = classify_era(df['tourney_date'])
     
     # Reclassify Davis Cup and Fed Cup matches from main tour data
     if 'tourney_name' in df.columns:
@@ -358,7 +467,7 @@ def enrich_matches_data(df, tour=None, tournament_type=None, fill_missing_tourna
     return df
 
 
-def filter_matches_by_switches(df):
+def filter_matches_by_switches(df, inplace=False):
     """
     Filter matches based on configuration switches.
     This ensures only matches for enabled tournament types are kept.
@@ -367,6 +476,8 @@ def filter_matches_by_switches(df):
     
     Args:
         df: DataFrame with tournament_type column
+        inplace: If True, drop the filtered-out rows from df itself instead of
+            returning a filtered copy
     
     Returns:
         Filtered DataFrame
@@ -400,7 +511,12 @@ def filter_matches_by_switches(df):
         allowed_types.append('WTA_ITF')
     
     # Apply filter using isin() which is more efficient than multiple OR conditions
-    return df[df['tournament_type'].isin(allowed_types)].copy()
+    keep_mask = df['tournament_type'].isin(allowed_types)
+    if inplace:
+        if not keep_mask.all():
+            df.drop(index=df.index[~keep_mask.to_numpy()], inplace=True)
+        return df
+    return df[keep_mask].copy()
 
 
 def combine_and_enrich_matches(master_df_list):
@@ -429,7 +545,7 @@ def combine_and_enrich_matches(master_df_list):
 # Existing Transformation Functions
 # ============================================================================
 
-def parse_date_components(df):
+def parse_date_components(df, inplace=False):
     """
     Parse tourney_date into event_year, event_month, event_date columns.
     Adds three new columns while keeping the original tourney_date column.
@@ -438,245 +554,155 @@ def parse_date_components(df):
     
     Args:
         df: DataFrame with tourney_date column
+        inplace: If True, modify df in place instead of working on a copy
         
     Returns:
         DataFrame with added event_year, event_month, event_date columns
     """
     print("\n--- Parsing Date Components ---")
     
-    # Create a copy to avoid modifying original
-    df_copy = df.copy()
+    if not inplace:
+        df = df.copy()
     
     # Extract date components
-    event_year = df_copy['tourney_date'].dt.year
-    event_month = df_copy['tourney_date'].dt.month
-    event_date = df_copy['tourney_date'].dt.day
+    date_components = {
+        'event_year': df['tourney_date'].dt.year,
+        'event_month': df['tourney_date'].dt.month,
+        'event_date': df['tourney_date'].dt.day,
+    }
     
     # Check if columns already exist and remove them to avoid duplicates
-    columns_to_remove = []
-    if 'event_year' in df_copy.columns:
-        columns_to_remove.append('event_year')
-    if 'event_month' in df_copy.columns:
-        columns_to_remove.append('event_month')
-    if 'event_date' in df_copy.columns:
-        columns_to_remove.append('event_date')
-    
+    columns_to_remove = [col for col in date_components if col in df.columns]
     if columns_to_remove:
-        df_copy = df_copy.drop(columns=columns_to_remove)
+        df.drop(columns=columns_to_remove, inplace=True)
         print(f"Removed existing columns to avoid duplicates: {columns_to_remove}")
     
-    # Create new column order with date components right after tourney_date
-    new_columns = []
-    for i, col in enumerate(df_copy.columns):
-        new_columns.append(col)
-        if col == 'tourney_date':
-            # Insert the 3 new columns right after tourney_date
-            new_columns.extend(['event_year', 'event_month', 'event_date'])
-    
-    # Create a new dataframe with reordered columns
-    df_reordered = df_copy.copy()
-    
-    # Add the new columns
-    df_reordered['event_year'] = event_year
-    df_reordered['event_month'] = event_month
-    df_reordered['event_date'] = event_date
-    
-    # Reorder columns to place date components right after tourney_date
-    df_reordered = df_reordered[new_columns]
+    # Insert the new columns right after tourney_date (no reordered copy of the frame)
+    position = df.columns.get_loc('tourney_date') + 1
+    for offset, (name, values) in enumerate(date_components.items()):
+        df.insert(position + offset, name, values)
     
-    print(f"Date parsing completed: {len(df_reordered)}/{len(df)} dates parsed (100.0%)")
-    print(f"Date range: {df_reordered['event_year'].min()}-{df_reordered['event_year'].max()}")
-    print(f"Year range: {df_reordered['event_year'].min()} to {df_reordered['event_year'].max()}")
+    print(f"Date parsing completed: {len(df)}/{len(df)} dates parsed (100.0%)")
+    print(f"Date range: {df['event_year'].min()}-{df['event_year'].max()}")
+    print(f"Year range: {df['event_year'].min()} to {df['event_year'].max()}")
     
-    return df_reordered
+    return df
 
 
-def parse_score_data(df):
+def parse_score_data(df, inplace=False):
     """
     Parse score column into set1, set2, set3, set4, set5 columns.
     Adds five new columns while keeping the original score column.
     Places the new columns right beside the score column.
-    Handles RET by putting 'RET' in subsequent set columns.
+    Handles W/O, DEF and RET by putting the marker in the set after the last played set.
+    
+    Also adds numeric setN_w_games, setN_l_games, setN_tiebreak columns for
+    each set and a total_games column (see load_data.score_parser).
     
     Args:
         df: DataFrame with score column
+        inplace: If True, modify df in place instead of working on a copy
         
     Returns:
-        DataFrame with added set1, set2, set3, set4, set5 columns
+        DataFrame with added set and games columns
     """
     print("\n--- Parsing Score Data ---")
     
-    # Create a copy to avoid modifying original
-    df_copy = df.copy()
+    if not inplace:
+        df = df.copy()
     
-    def parse_score(score_str):
-        """Parse a single score string into set scores."""
-        if pd.isna(score_str) or score_str == '':
-            return [None, None, None, None, None]
-        
-        score_str = str(score_str).strip()
-        
-        # Handle special cases
-        if score_str in ['W/O', 'WO', 'Walkover']:
-            return ['W/O', None, None, None, None]
-        elif score_str in ['DEF', 'Default']:
-            return ['DEF', None, None, None, None]
-        elif 'W/O' in score_str.upper() or 'WO' in score_str.upper():
-            # Handle walkover - put W/O in only the next set, rest are NULL
-            parts = score_str.split()
-            sets = []
-            wo_found = False
-            
-            for part in parts:
-                if 'W/O' in part.upper() or 'WO' in part.upper():
-                    wo_found = True
-                    # Extract score before W/O
-                    score_part = part.replace('W/O', '').replace('WO', '').replace('wo', '').strip()
-                    if score_part:
-                        sets.append(score_part)
-                    # Add W/O to the next set only
-                    sets.append('W/O')
-                    break
-                else:
-                    sets.append(part)
-            
-            # Fill remaining sets with NULL (not W/O)
-            while len(sets) < 5:
-                sets.append(None)
-            
-            return sets[:5]
-        elif 'DEF' in score_str.upper() or 'DEFAULT' in score_str.upper():
-            # Handle default - put DEF in only the next set, rest are NULL
-            parts = score_str.split()
-            sets = []
-            def_found = False
-            
-            for part in parts:
-                if 'DEF' in part.upper() or 'DEFAULT' in part.upper():
-                    def_found = True
-                    # Extract score before DEF
-                    score_part = part.replace('DEF', '').replace('DEFAULT', '').replace('def', '').strip()
-                    if score_part:
-                        sets.append(score_part)
-                    # Add DEF to the next set only
-                    sets.append('DEF')
-                    break
-                else:
-                    sets.append(part)
-            
-            # Fill remaining sets with NULL (not DEF)
-            while len(sets) < 5:
-                sets.append(None)
-            
-            return sets[:5]
-        elif 'RET' in score_str.upper():
-            # Handle retirement - put RET in only the next set, rest are NULL
-            parts = score_str.split()
-            sets = []
-            ret_found = False
-            
-            for part in parts:
-                if 'RET' in part.upper():
-                    ret_found = True
-                    # Extract score before RET
-                    score_part = part.replace('RET', '').replace('ret', '').strip()
-                    if score_part:
-                        sets.append(score_part)
-                    # Add RET to the next set only
-                    sets.append('RET')
-                    break
-                else:
-                    sets.append(part)
-            
-            # Fill remaining sets with NULL (not RET)
-            while len(sets) < 5:
-                sets.append(None)
-            
-            return sets[:5]
-        else:
-            # Normal score parsing
-            parts = score_str.split()
-            sets = parts[:5]  # Take first 5 parts
-            while len(sets) < 5:
-                sets.append(None)
-            return sets
-    
-    # Apply parsing to all scores
-    parsed_scores = df_copy['score'].apply(parse_score)
-    
-    # Extract set scores
-    set1 = [s[0] for s in parsed_scores]
-    set2 = [s[1] for s in parsed_scores]
-    set3 = [s[2] for s in parsed_scores]
-    set4 = [s[3] for s in parsed_scores]
-    set5 = [s[4] for s in parsed_scores]
-    
-    # Find the position of score column
-    score_pos = df_copy.columns.get_loc('score')
-    
-    # Create new column order with set columns right after score
-    new_columns = []
-    for i, col in enumerate(df_copy.columns):
-        new_columns.append(col)
-        if col == 'score':
-            # Insert the 5 new columns right after score
-            new_columns.extend(['set1', 'set2', 'set3', 'set4', 'set5'])
-    
-    # Create a new dataframe with reordered columns
-    df_reordered = df_copy.copy()
-    
-    # Add the new columns
-    df_reordered['set1'] = set1
-    df_reordered['set2'] = set2
-    df_reordered['set3'] = set3
-    df_reordered['set4'] = set4
-    df_reordered['set5'] = set5
-    
-    # Reorder columns to place set columns right after score
-    df_reordered = df_reordered[new_columns]
+    # Vectorized split of all score strings (no per-row Python function)
+    sets = split_score_sets(df['score'])
+    games = parse_set_games(sets)
+    
+    # Remove existing parsed columns to avoid duplicates on re-parse
+    parsed_columns = SET_COLUMNS + list(games.columns)
+    existing = [c for c in parsed_columns if c in df.columns]
+    if existing:
+        df.drop(columns=existing, inplace=True)
     
+    # Insert set and games columns right after score (no reordered copy of the frame)
     # Keep the original score column - do not remove it
+    position = df.columns.get_loc('score') + 1
+    for offset, name in enumerate(parsed_columns):
+        values = sets[name] if name in sets.columns else games[name]
+        df.insert(position + offset, name, values)
     
     # Show sample of parsed scores
-    print(f"Score parsing completed: {len(df_reordered)}/{len(df)} matches parsed (100.0%)")
+    parsed_games = games['total_games'].notna().sum()
+    print(f"Score parsing completed: {len(df)}/{len(df)} matches parsed (100.0%)")
+    print(f"Numeric games parsed: {parsed_games:,}/{len(df):,} matches")
     print("Sample parsed scores:")
-    sample_scores = df_reordered[['set1', 'set2', 'set3', 'set4', 'set5']].dropna(how='all').head(3)
+    sample_scores = sets.dropna(how='all').head(3)
     for idx, row in sample_scores.iterrows():
-        original = df.loc[idx, 'score'] if idx < len(df) else 'N/A'
+        original = df.loc[idx, 'score']
         parsed = ' | '.join([str(s) for s in row.values if pd.notna(s)])
         print(f"  Original: {original} -> Parsed: {parsed}")
     
-    return df_reordered
+    return df
 
 
-def fix_missing_surface_data(matches_df):
+def _surface_mode_lookup(recorded, keys):
     """
-    Optimized surface data inference using vectorized operations and data-driven patterns.
+    Most frequent recorded surface per key group.
     
-    Strategy:
-    1. Build lookup tables from existing surface data (tournament+year, tournament-level mode)
-    2. Use Grand Slam surface mappings (known surfaces)
-    3. Use tourney_level hints (Grand Slams have known surfaces)
-    4. Fall back to era-based defaults intelligently
+    Ties go to the alphabetically first surface, as with Series.mode().iloc[0].
+    
+    Args:
+        recorded: DataFrame of matches with a recorded surface
+        keys: Grouping columns
+    
+    Returns:
+        DataFrame with the key columns and 'surface', one row per group
+    """
+    counts = recorded.groupby(keys, observed=True)['surface'].value_counts().reset_index(name='count')
+    counts = counts[counts['count'] > 0].sort_values(['count', 'surface'], ascending=[False, True], kind='stable')
+    return counts.drop_duplicates(keys)[keys + ['surface']]
+
+
+def fix_missing_surface_data(matches_df, inplace=False):
+    """
+    Infer missing surfaces with count-based lookups and merges.
+    
+    Only the rows without a surface are worked on. Each is filled by the
+    first rule that gives an answer, recorded in the surface_source column:
+    1. grand_slam: Grand Slam tournament name (known surfaces)
+    2. tourney_year: most frequent recorded surface of the tournament that year
+    3. tourney: most frequent recorded surface of the tournament overall
+    4. tourney_level: name hints for tourney_level 'G' events
+    5. era_default: era-based default with tournament name hints
+    Rows that had a surface get surface_source 'recorded'.
     
     Args:
         matches_df: DataFrame with match data
+        inplace: If True, fill matches_df in place instead of working on a copy
         
     Returns:
-        DataFrame with missing surface data filled in
+        DataFrame with missing surface data filled in and a surface_source column
     """
     print("\n--- Fixing Missing Surface Data (Optimized) ---")
     
     # Count missing surface data
-    missing_before = len(matches_df[matches_df['surface'].isna() | (matches_df['surface'] == '')])
+    missing_mask = matches_df['surface'].isna() | (matches_df['surface'] == '')
+    missing_before = int(missing_mask.sum())
     print(f"Missing surface data before fix: {missing_before:,} matches")
     
+    # Create a copy to avoid modifying original (unless filling in place)
+    df = matches_df if inplace else matches_df.copy()
+    if 'surface_source' in df.columns:
+        df.drop(columns=['surface_source'], inplace=True)
+    sources = np.full(len(df), 'recorded', dtype=object)
+    
     if missing_before == 0:
         print("No missing surface data found!")
-        return matches_df
+        df.insert(df.columns.get_loc('surface') + 1, 'surface_source',
+                  pd.Categorical(sources, categories=SURFACE_SOURCES))
+        return df
     
-    # Create a copy to avoid modifying original
-    df = matches_df.copy()
+    # Surfaces are filled in below, which a categorical column would reject
+    # (the pipeline categorizes the column again once it is done)
+    if isinstance(df['surface'].dtype, pd.CategoricalDtype):
+        df['surface'] = df['surface'].astype(object)
     
     # Prepare date components (needed for lookup)
     if 'event_year' not in df.columns:
@@ -685,162 +711,87 @@ def fix_missing_surface_data(matches_df):
         else:
             df['event_year'] = None
     
-    # Step 1: Grand Slam surface mappings (known surfaces)
-    grand_slam_surfaces = {
-        'wimbledon': 'Grass',
-        'french open': 'Clay',
-        'roland garros': 'Clay',
-        'us open': 'Hard',
-        'australian open': 'Hard',
-    }
-    
-    # Step 2: Build lookup tables from existing surface data
-    # Tournament+Year lookup (most accurate)
-    valid_surface_mask = df['surface'].notna() & (df['surface'] != '')
-    if valid_surface_mask.sum() > 0:
-        tourney_year_lookup = (
-            df[valid_surface_mask]
-            .groupby(['tourney_name', 'event_year'])['surface']
-            .agg(lambda x: x.mode().iloc[0] if len(x.mode()) > 0 else None)
-            .to_dict()
+    # Lookups from recorded surfaces: one row per group instead of a mode() call per group
+    recorded = df.loc[~missing_mask, ['tourney_name', 'event_year', 'surface']]
+    tourney_year_lookup = _surface_mode_lookup(recorded, ['tourney_name', 'event_year'])
+    tourney_lookup = _surface_mode_lookup(recorded, ['tourney_name']).set_index('tourney_name')['surface']
+    del recorded
+    
+    # Everything below works on the rows to fill only
+    todo_columns = ['tourney_name', 'event_year'] + (['tourney_level'] if 'tourney_level' in df.columns else [])
+    todo = df.loc[missing_mask, todo_columns]
+    inferred = np.full(len(todo), None, dtype=object)
+    inferred_sources = np.full(len(todo), None, dtype=object)
+    pending = np.ones(len(todo), dtype=bool)
+    
+    def fill(candidates, source):
+        take = pending & pd.notna(candidates)
+        inferred[take] = candidates[take]
+        inferred_sources[take] = source
+        pending[take] = False
+    
+    # Name patterns are matched once per distinct tournament name
+    name_codes, names = pd.factorize(todo['tourney_name'])
+    names_lower = pd.Series(names, dtype=object).astype(str).str.lower()
+    
+    def name_contains(pattern):
+        hits = names_lower.str.contains(pattern, na=False).to_numpy(dtype=bool)
+        return np.append(hits, False)[name_codes]  # code -1 (missing name) -> False
+    
+    # Step 1: Grand Slam surface mappings
+    for pattern, surface in GRAND_SLAM_SURFACES:
+        fill(np.where(name_contains(pattern), surface, None), 'grand_slam')
+    
+    # Step 2: Tournament+Year lookup (left merge keeps the row order)
+    if pending.any() and not tourney_year_lookup.empty:
+        merged = todo[['tourney_name', 'event_year']].merge(
+            tourney_year_lookup, on=['tourney_name', 'event_year'], how='left'
         )
-    else:
-        tourney_year_lookup = {}
-    
-    # Tournament-level lookup (fallback when year-specific data unavailable)
-    if valid_surface_mask.sum() > 0:
-        tourney_lookup = (
-            df[valid_surface_mask]
-            .groupby('tourney_name')['surface']
-            .agg(lambda x: x.mode().iloc[0] if len(x.mode()) > 0 else None)
-            .to_dict()
+        fill(merged['surface'].to_numpy(dtype=object), 'tourney_year')
+    
+    # Step 3: Tournament-level lookup (fallback when year-specific data unavailable)
+    if pending.any() and not tourney_lookup.empty:
+        fill(todo['tourney_name'].map(tourney_lookup).to_numpy(dtype=object), 'tourney')
+    
+    # Step 4: Tourney-level hints (Grand Slams have known surfaces)
+    if pending.any() and 'tourney_level' in todo.columns:
+        grand_slam_level = (todo['tourney_level'] == 'G').to_numpy(dtype=bool)
+        candidates = np.full(len(todo), None, dtype=object)
+        for pattern, surface in GRAND_SLAM_LEVEL_HINTS:
+            candidates = np.where(grand_slam_level & name_contains(pattern), surface, candidates)
+        fill(candidates, 'tourney_level')
+    
+    # Step 5: Era-based defaults with name hints (rows without a year get 'Hard')
+    if pending.any():
+        year = pd.to_numeric(todo['event_year'], errors='coerce').to_numpy(dtype=float, na_value=np.nan)
+        grass = name_contains('grass|lawn')
+        clay = name_contains('clay|dirt|red|terre')
+        pre_1970 = np.where(clay, 'Clay', 'Grass')
+        # 1970s-1980s: introduction of hard courts
+        era_70_90 = np.select(
+            [name_contains('hard|concrete|asphalt'), clay, grass], ['Hard', 'Clay', 'Grass'], 'Hard'
         )
-    else:
-        tourney_lookup = {}
-    
-    # Step 3: Vectorized Grand Slam inference
-    missing_mask = df['surface'].isna() | (df['surface'] == '')
-    tourney_name_lower = df['tourney_name'].astype(str).str.lower()
-    
-    # Grand Slam pattern matching (vectorized)
-    for gs_pattern, surface in grand_slam_surfaces.items():
-        gs_mask = tourney_name_lower.str.contains(gs_pattern, case=False, na=False) & missing_mask
-        if gs_mask.sum() > 0:
-            df.loc[gs_mask, 'surface'] = surface
-            missing_mask = df['surface'].isna() | (df['surface'] == '')
-    
-    # Step 4: Tournament+Year lookup (vectorized merge)
-    missing_mask = df['surface'].isna() | (df['surface'] == '')
-    if missing_mask.sum() > 0 and tourney_year_lookup:
-        # Create lookup Series indexed by (tourney_name, event_year) tuple
-        lookup_series = pd.Series(tourney_year_lookup)
-        
-        # Create a temporary key column for matching
-        df_temp = df.loc[missing_mask, ['tourney_name', 'event_year']].copy()
-        df_temp['lookup_key'] = list(zip(df_temp['tourney_name'], df_temp['event_year']))
-        
-        # Map surfaces using the lookup
-        inferred_surfaces = df_temp['lookup_key'].map(lookup_series)
-        inferred_mask = inferred_surfaces.notna()
-        
-        if inferred_mask.sum() > 0:
-            df.loc[df_temp.index[inferred_mask], 'surface'] = inferred_surfaces[inferred_mask]
-            missing_mask = df['surface'].isna() | (df['surface'] == '')
-    
-    # Step 5: Tournament-level lookup (vectorized)
-    missing_mask = df['surface'].isna() | (df['surface'] == '')
-    if missing_mask.sum() > 0 and tourney_lookup:
-        df.loc[missing_mask, 'surface'] = df.loc[missing_mask, 'tourney_name'].map(
-            lambda x: tourney_lookup.get(x) if x in tourney_lookup else None
+        # 1990s+: mostly hard courts
+        modern = np.select(
+            [name_contains('carpet|indoor'), clay | name_contains('french'), grass | name_contains('wimbledon')],
+            ['Carpet', 'Clay', 'Grass'], 'Hard'
         )
-        missing_mask = df['surface'].isna() | (df['surface'] == '')
-    
-    # Step 6: Tourney-level hints (Grand Slams have known surfaces)
-    missing_mask = df['surface'].isna() | (df['surface'] == '')
-    if missing_mask.sum() > 0 and 'tourney_level' in df.columns:
-        # Grand Slam level inference
-        gs_level_mask = (df['tourney_level'] == 'G') & missing_mask
-        if gs_level_mask.sum() > 0:
-            # For Grand Slams, infer from tournament name
-            gs_tourney_mask = gs_level_mask & (
-                tourney_name_lower.str.contains('wimbledon', case=False, na=False)
-            )
-            if gs_tourney_mask.sum() > 0:
-                df.loc[gs_tourney_mask, 'surface'] = 'Grass'
-            
-            gs_tourney_mask = gs_level_mask & (
-                tourney_name_lower.str.contains('french|roland', case=False, na=False)
-            )
-            if gs_tourney_mask.sum() > 0:
-                df.loc[gs_tourney_mask, 'surface'] = 'Clay'
-            
-            gs_tourney_mask = gs_level_mask & (
-                tourney_name_lower.str.contains('us open|australian|melbourne', case=False, na=False)
-            )
-            if gs_tourney_mask.sum() > 0:
-                df.loc[gs_tourney_mask, 'surface'] = 'Hard'
-        
-        missing_mask = df['surface'].isna() | (df['surface'] == '')
-    
-    # Step 7: Era-based defaults (smart fallback)
-    missing_mask = df['surface'].isna() | (df['surface'] == '')
-    if missing_mask.sum() > 0 and 'event_year' in df.columns:
-        year_mask = df['event_year'].notna()
-        
-        # Pre-1970s: Mostly grass (vectorized)
-        pre_1970_mask = missing_mask & (df['event_year'] < 1970) & year_mask
-        if pre_1970_mask.sum() > 0:
-            # Check for clay indicators in tournament name
-            clay_indicator = tourney_name_lower.str.contains('clay|dirt|red|terre', case=False, na=False)
-            df.loc[pre_1970_mask & clay_indicator, 'surface'] = 'Clay'
-            df.loc[pre_1970_mask & ~clay_indicator, 'surface'] = 'Grass'
-        
-        # 1970s-1980s: Introduction of hard courts
-        era_70_90_mask = missing_mask & (df['event_year'] >= 1970) & (df['event_year'] < 1990) & year_mask
-        if era_70_90_mask.sum() > 0:
-            grass_indicator = tourney_name_lower.str.contains('grass|lawn', case=False, na=False)
-            clay_indicator = tourney_name_lower.str.contains('clay|dirt|red|terre', case=False, na=False)
-            hard_indicator = tourney_name_lower.str.contains('hard|concrete|asphalt', case=False, na=False)
-            
-            df.loc[era_70_90_mask & grass_indicator, 'surface'] = 'Grass'
-            df.loc[era_70_90_mask & clay_indicator, 'surface'] = 'Clay'
-            df.loc[era_70_90_mask & hard_indicator, 'surface'] = 'Hard'
-            df.loc[era_70_90_mask & ~(grass_indicator | clay_indicator | hard_indicator), 'surface'] = 'Hard'
-        
-        # 1990s+: Mostly hard courts
-        modern_era_mask = missing_mask & (df['event_year'] >= 1990) & year_mask
-        if modern_era_mask.sum() > 0:
-            grass_indicator = tourney_name_lower.str.contains('grass|lawn|wimbledon', case=False, na=False)
-            clay_indicator = tourney_name_lower.str.contains('clay|dirt|red|terre|french', case=False, na=False)
-            carpet_indicator = tourney_name_lower.str.contains('carpet|indoor', case=False, na=False)
-            
-            df.loc[modern_era_mask & grass_indicator, 'surface'] = 'Grass'
-            df.loc[modern_era_mask & clay_indicator, 'surface'] = 'Clay'
-            df.loc[modern_era_mask & carpet_indicator, 'surface'] = 'Carpet'
-            df.loc[modern_era_mask & ~(grass_indicator | clay_indicator | carpet_indicator), 'surface'] = 'Hard'
-        
-        # Final fallback for any remaining missing
-        missing_mask = df['surface'].isna() | (df['surface'] == '')
-        if missing_mask.sum() > 0:
-            df.loc[missing_mask, 'surface'] = 'Hard'
-    
-    # Count remaining missing surface data
-    missing_after = len(df[df['surface'].isna() | (df['surface'] == '')])
-    fixed_count = missing_before - missing_after
+        fill(np.select([year < 1970, year < 1990, year >= 1990], [pre_1970, era_70_90, modern], 'Hard'),
+             'era_default')
     
-    print(f"Fixed surface data: {fixed_count:,} matches")
-    print(f"Remaining missing surface data: {missing_after:,} matches")
+    df.loc[missing_mask, 'surface'] = inferred
+    sources[missing_mask.to_numpy(dtype=bool)] = inferred_sources
+    df.insert(df.columns.get_loc('surface') + 1, 'surface_source',
+              pd.Categorical(sources, categories=SURFACE_SOURCES))
     
-    if missing_after > 0:
-        print("Surface distribution after fix:")
-        surface_dist = df['surface'].value_counts()
-        for surface, count in surface_dist.items():
-            print(f"  {surface}: {count:,} matches")
+    print(f"Fixed surface data: {missing_before:,} matches")
+    for source, count in pd.Series(inferred_sources).value_counts().reindex(SURFACE_SOURCES[1:]).dropna().items():
+        print(f"  {source}: {int(count):,} matches")
     
     return df
 
 
-def standardize_tourney_levels(df, tour_name):
+def standardize_tourney_levels(df, tour_name, inplace=False):
     """
     Apply tourney level standardization to a dataframe using vectorized operations.
     Optimized version that uses map() instead of apply() for better performance.
@@ -848,6 +799,7 @@ def standardize_tourney_levels(df, tour_name):
     Args:
         df: DataFrame with tourney_level column
         tour_name: Tour name for context (ATP, WTA, Mixed, etc.)
+        inplace: If True, modify df in place instead of working on a copy
     
     Returns:
         DataFrame with standardized tourney_level values
@@ -867,8 +819,9 @@ def standardize_tourney_levels(df, tour_name):
     # Apply standardization using vectorized operations
     print("Applying standardization...")
     
-    # Create a copy to avoid modifying original
-    df = df.copy()
+    # Create a copy to avoid modifying original (unless standardizing in place)
+    if not inplace:
+        df = df.copy()
     
     # Handle missing/empty values
     mask_not_na = df['tourney_level'].notna() & (df['tourney_level'] != '')
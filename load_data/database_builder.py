@@ -5,16 +5,184 @@ This module contains functions that create SQLite database structure
 and write data to tables.
 """
 
+import os
 import sqlite3
+import sys
+import time
 import pandas as pd
 
+# Add the parent directory to Python path to import tennis module
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from tennis.player_names import PLAYER_NAMES_TABLE, normalize_player_name
+from tennis.schema_digest import write_schema_digest, estimate_tokens, SCHEMA_DIGEST_TABLE
+from tennis.tennis_mapping_dicts import PLAYER_NAME_ALIASES
+
 # Import configuration
 from .config import (
     DB_FILE,
-    CREATE_TABLE_MATCHES, CREATE_TABLE_PLAYERS, CREATE_TABLE_RANKINGS
+    CREATE_TABLE_MATCHES, CREATE_TABLE_PLAYERS, CREATE_TABLE_RANKINGS,
+    CREATE_TABLE_PLAYER_MATCHES, CREATE_TABLE_PLAYER_AGGREGATES, CREATE_TABLE_PLAYER_NAMES,
+    BULK_INSERT_CHUNK_SIZE, BUILD_CACHE_SIZE_KB
+)
+from .schema import (
+    DATE_FORMAT, INDEXES, PLAYER_MATCHES_COLUMNS, PLAYER_MATCHES_SCHEMA,
+    PLAYER_AGGREGATES_KEYS, PLAYER_AGGREGATES_COUNTERS, PLAYER_AGGREGATES_SCHEMA,
+    resolve_columns, create_table_sql, create_index_sql
 )
 
 
+# ============================================================================
+# Bulk Writer
+# ============================================================================
+
+def apply_bulk_load_pragmas(conn):
+    """
+    Configure a connection for a one-off bulk build.
+    
+    The rollback journal and fsyncs are switched off: a build that dies
+    half-way is simply rerun, so durability buys nothing here.
+    """
+    conn.execute("PRAGMA journal_mode = OFF")
+    conn.execute("PRAGMA synchronous = OFF")
+    conn.execute(f"PRAGMA cache_size = -{BUILD_CACHE_SIZE_KB}")
+    conn.execute("PRAGMA temp_store = MEMORY")
+
+
+def _column_values(series):
+    """Convert a column to a list of sqlite3-compatible Python values (NaN -> None)."""
+    if pd.api.types.is_datetime64_any_dtype(series):
+        series = series.dt.strftime(DATE_FORMAT)
+    values = series.astype(object)
+    return values.where(series.notna(), None).tolist()
+
+
+def iter_row_chunks(df, column_names, chunk_size=BULK_INSERT_CHUNK_SIZE):
+    """
+    Yield the rows of a DataFrame as lists of tuples, one chunk at a time.
+    
+    Converting column-by-column per chunk keeps peak memory bounded to one
+    chunk of Python objects instead of the whole table.
+    
+    Args:
+        df: Source DataFrame
+        column_names: Columns to emit, in order (missing columns become NULL)
+        chunk_size: Rows per chunk
+    
+    Yields:
+        List of row tuples
+    """
+    for start in range(0, len(df), chunk_size):
+        chunk = df.iloc[start:start + chunk_size]
+        columns = [
+            _column_values(chunk[name]) if name in chunk.columns else [None] * len(chunk)
+            for name in column_names
+        ]
+        yield list(zip(*columns))
+
+
+def insert_rows(conn, table, df, column_names):
+    """
+    Insert DataFrame rows into an existing table with executemany.
+    
+    Args:
+        conn: SQLite connection
+        table: Target table name
+        df: DataFrame of rows
+        column_names: Table columns to fill, in order
+    
+    Returns:
+        Number of rows inserted
+    """
+    quoted = ', '.join(f'"{name}"' for name in column_names)
+    placeholders = ', '.join('?' for _ in column_names)
+    sql = f'INSERT INTO "{table}" ({quoted}) VALUES ({placeholders})'
+    for rows in iter_row_chunks(df, column_names):
+        conn.executemany(sql, rows)
+    return len(df)
+
+
+def write_table(conn, table, df):
+    """
+    (Re)create a table from its declared schema and bulk-insert a DataFrame.
+    
+    Args:
+        conn: SQLite connection
+        table: Table name (typed via load_data.schema)
+        df: DataFrame to write
+    
+    Returns:
+        Number of rows written
+    """
+    start_time = time.time()
+    columns = resolve_columns(table, df)
+    conn.execute(f'DROP TABLE IF EXISTS "{table}"')
+    conn.execute(create_table_sql(table, columns))
+    written = insert_rows(conn, table, df, [name for name, _ in columns])
+    elapsed = time.time() - start_time
+    rate = written / elapsed if elapsed > 0 else float(written)
+    print(f"  {table}: {written:,} rows in {elapsed:.2f}s ({rate:,.0f} rows/sec)")
+    return written
+
+
+def stream_table(conn, table, chunks):
+    """
+    (Re)create a table from the first chunk of a stream and append every chunk.
+    
+    Only one chunk is held in memory at a time. Nothing is created if the
+    stream yields no rows.
+    
+    Args:
+        conn: SQLite connection
+        table: Table name (typed via load_data.schema)
+        chunks: Iterable of DataFrames with the same columns
+    
+    Returns:
+        Number of rows written
+    """
+    start_time = time.time()
+    column_names = None
+    written = 0
+    for chunk in chunks:
+        if chunk.empty:
+            continue
+        if column_names is None:
+            columns = resolve_columns(table, chunk)
+            conn.execute(f'DROP TABLE IF EXISTS "{table}"')
+            conn.execute(create_table_sql(table, columns))
+            column_names = [name for name, _ in columns]
+        written += insert_rows(conn, table, chunk, column_names)
+    elapsed = time.time() - start_time
+    rate = written / elapsed if elapsed > 0 else float(written)
+    print(f"  {table}: {written:,} rows streamed in {elapsed:.2f}s ({rate:,.0f} rows/sec)")
+    return written
+
+
+def write_rankings_table(conn, table, rankings):
+    """
+    Write a rankings table from a DataFrame or from a stream of chunks.
+    
+    The previous table is dropped first, so a build without rankings rows
+    (an empty stream or DataFrame) does not keep the rows of an older build.
+    
+    Args:
+        conn: SQLite connection
+        table: atp_rankings or wta_rankings
+        rankings: Enriched rankings DataFrame, or an iterable of enriched
+            DataFrame chunks (STREAM_RANKINGS mode)
+    
+    Returns:
+        Number of rows written
+    """
+    conn.execute(f'DROP TABLE IF EXISTS "{table}"')
+    if isinstance(rankings, pd.DataFrame):
+        if rankings.empty:
+            print(f"No {table} data to write.")
+            return 0
+        # Remove 'tour' column if present (not needed in separate table)
+        return write_table(conn, table, rankings.drop(columns=['tour'], errors='ignore'))
+    return stream_table(conn, table, (chunk.drop(columns=['tour'], errors='ignore') for chunk in rankings))
+
+
 def build_database(matches_df, atp_players_df, wta_players_df, atp_rankings_df, wta_rankings_df):
     """
     Builds SQLite database with matches, players, and rankings data.
@@ -23,16 +191,25 @@ def build_database(matches_df, atp_players_df, wta_players_df, atp_rankings_df,
         matches_df: DataFrame with match data
         atp_players_df: DataFrame with ATP player data
         wta_players_df: DataFrame with WTA player data
-        atp_rankings_df: DataFrame with ATP rankings data
-        wta_rankings_df: DataFrame with WTA rankings data
+        atp_rankings_df: DataFrame with ATP rankings data, or an iterable of chunks to stream
+        wta_rankings_df: DataFrame with WTA rankings data, or an iterable of chunks to stream
     """
     print("\n--- Creating Enhanced Database ---")
-    conn = sqlite3.connect(DB_FILE)
+    build_start = time.time()
+    conn = sqlite3.connect(DB_FILE, isolation_level=None)
+    apply_bulk_load_pragmas(conn)
+    conn.execute("BEGIN")
     
     # Write matches data
     if CREATE_TABLE_MATCHES:
         print("Writing matches data...")
-        matches_df.to_sql('matches', conn, if_exists='replace', index=False)
+        write_table(conn, 'matches', matches_df)
+        if CREATE_TABLE_PLAYER_MATCHES:
+            print("Writing player-match table...")
+            populate_player_matches(conn)
+            if CREATE_TABLE_PLAYER_AGGREGATES:
+                print("Writing player aggregates table...")
+                populate_player_aggregates(conn)
     else:
         print("Skipping matches table creation (CREATE_TABLE_MATCHES = False)")
     
@@ -42,7 +219,7 @@ def build_database(matches_df, atp_players_df, wta_players_df, atp_rankings_df,
             print("Writing ATP players data...")
             # Remove 'tour' column if present (not needed in separate table)
             atp_players_clean = atp_players_df.drop(columns=['tour'], errors='ignore')
-            atp_players_clean.to_sql('atp_players', conn, if_exists='replace', index=False)
+            write_table(conn, 'atp_players', atp_players_clean)
             print(f"ATP players written: {len(atp_players_clean)}")
         else:
             print("No ATP players data to write.")
@@ -51,44 +228,40 @@ def build_database(matches_df, atp_players_df, wta_players_df, atp_rankings_df,
             print("Writing WTA players data...")
             # Remove 'tour' column if present (not needed in separate table)
             wta_players_clean = wta_players_df.drop(columns=['tour'], errors='ignore')
-            wta_players_clean.to_sql('wta_players', conn, if_exists='replace', index=False)
+            write_table(conn, 'wta_players', wta_players_clean)
             print(f"WTA players written: {len(wta_players_clean)}")
         else:
             print("No WTA players data to write.")
     else:
         print("Skipping players table creation (CREATE_TABLE_PLAYERS = False)")
     
-    # Write ATP rankings data
+    # Write rankings data - separate tables for ATP and WTA
+    atp_rankings_written = wta_rankings_written = 0
     if CREATE_TABLE_RANKINGS:
-        if not atp_rankings_df.empty:
-            print("Writing ATP rankings data...")
-            # Remove 'tour' column if present (not needed in separate table)
-            atp_df = atp_rankings_df.drop(columns=['tour'], errors='ignore')
-            atp_df.to_sql('atp_rankings', conn, if_exists='replace', index=False)
-        else:
-            print("No ATP rankings data to write.")
-        
-        # Write WTA rankings data
-        if not wta_rankings_df.empty:
-            print("Writing WTA rankings data...")
-            # Remove 'tour' column if present (not needed in separate table)
-            wta_df = wta_rankings_df.drop(columns=['tour'], errors='ignore')
-            wta_df.to_sql('wta_rankings', conn, if_exists='replace', index=False)
-        else:
-            print("No WTA rankings data to write.")
+        print("Writing ATP rankings data...")
+        atp_rankings_written = write_rankings_table(conn, 'atp_rankings', atp_rankings_df)
+        print("Writing WTA rankings data...")
+        wta_rankings_written = write_rankings_table(conn, 'wta_rankings', wta_rankings_df)
     else:
         print("Skipping rankings table creation (CREATE_TABLE_RANKINGS = False)")
     
+    # Name resolution index over the players and matches written above
+    if CREATE_TABLE_PLAYER_NAMES:
+        print("Writing player name index...")
+        populate_player_names(conn)
+    
+    conn.execute("COMMIT")
     conn.close()
+    print(f"Database written in {time.time() - build_start:.2f}s")
     
     total_players = len(atp_players_df) + len(wta_players_df)
     print(f"\n✅ Successfully created enhanced database '{DB_FILE}' with:")
     print(f"   - {len(matches_df)} singles matches (COMPLETE tournament coverage: 1877-2024)")
     print(f"   - {total_players} players (ATP: {len(atp_players_df)}, WTA: {len(wta_players_df)})")
-    if not atp_rankings_df.empty:
-        print(f"   - {len(atp_rankings_df)} ATP ranking records")
-    if not wta_rankings_df.empty:
-        print(f"   - {len(wta_rankings_df)} WTA ranking records")
+    if atp_rankings_written:
+        print(f"   - {atp_rankings_written} ATP ranking records")
+    if wta_rankings_written:
+        print(f"   - {wta_rankings_written} WTA ranking records")
     print(f"   - Player metadata integration (separate ATP/WTA tables)")
     print(f"   - Rankings data integration (separate ATP/WTA tables)")
     print(f"   - Surface data quality fix (missing surface inference)")
@@ -97,3 +270,333 @@ def build_database(matches_df, atp_players_df, wta_players_df, atp_rankings_df,
     print(f"   - Main tour matches (Grand Slams, Masters, etc.)")
     print(f"   - Qualifying/Challenger/Futures matches")
     print(f"   - COMPLETE tennis tournament database (147 years)")
+
+
+# ============================================================================
+# Player-Match Fact Table
+# ============================================================================
+
+def populate_player_matches(conn, source_keys=None):
+    """
+    Fill player_matches from the matches table: one row per player per match.
+    
+    Each match produces a winner-perspective row and a loser-perspective row
+    (see PLAYER_MATCHES_COLUMNS), so per-player queries filter a single
+    indexed player_name column instead of "winner_name = ? OR loser_name = ?".
+    
+    Args:
+        conn: SQLite connection
+        source_keys: If given, only add rows for matches loaded from these
+                     source files (incremental update); otherwise the table is
+                     recreated from all matches.
+    
+    Returns:
+        Number of rows inserted
+    """
+    start_time = time.time()
+    if source_keys is None:
+        conn.execute('DROP TABLE IF EXISTS "player_matches"')
+        conn.execute(create_table_sql('player_matches', PLAYER_MATCHES_SCHEMA))
+        where_clause, params = "", []
+    elif not source_keys:
+        return 0
+    else:
+        where_clause = f"WHERE source_file IN ({','.join('?' for _ in source_keys)})"
+        params = list(source_keys)
+    
+    column_list = ', '.join(f'"{name}"' for name, _, _, _ in PLAYER_MATCHES_COLUMNS)
+    inserted = 0
+    for side in (2, 3):  # winner's row, then loser's row
+        select_list = ', '.join(column[side] for column in PLAYER_MATCHES_COLUMNS)
+        cursor = conn.execute(
+            f'INSERT INTO player_matches ({column_list}) SELECT {select_list} FROM matches {where_clause}',
+            params
+        )
+        inserted += cursor.rowcount
+    
+    elapsed = time.time() - start_time
+    rate = inserted / elapsed if elapsed > 0 else float(inserted)
+    print(f"  player_matches: {inserted:,} rows in {elapsed:.2f}s ({rate:,.0f} rows/sec)")
+    return inserted
+
+
+def populate_player_aggregates(conn):
+    """
+    Rebuild player_aggregates from player_matches.
+    
+    One row per (player, tour, year, surface, tourney_level) with pre-summed
+    win/loss, serve, return and break point counters (see
+    PLAYER_AGGREGATES_COUNTERS), so career and season statistics are a sum
+    over a handful of rows instead of a scan over every match.
+    
+    Args:
+        conn: SQLite connection
+    
+    Returns:
+        Number of aggregate rows written
+    """
+    if not table_exists(conn, 'player_matches'):
+        print("  player_aggregates: skipped (player_matches table not found)")
+        return 0
+    start_time = time.time()
+    conn.execute('DROP TABLE IF EXISTS "player_aggregates"')
+    conn.execute(create_table_sql('player_aggregates', PLAYER_AGGREGATES_SCHEMA))
+    
+    key_list = ', '.join(name for name, _ in PLAYER_AGGREGATES_KEYS)
+    column_list = ', '.join(f'"{name}"' for name, _ in PLAYER_AGGREGATES_SCHEMA)
+    counter_list = ', '.join(expression for _, _, expression in PLAYER_AGGREGATES_COUNTERS)
+    cursor = conn.execute(f"""
+        INSERT INTO player_aggregates ({column_list})
+        SELECT {key_list}, {counter_list}
+        FROM player_matches
+        WHERE player_name IS NOT NULL
+        GROUP BY {key_list}
+    """)
+    elapsed = time.time() - start_time
+    print(f"  player_aggregates: {cursor.rowcount:,} rows in {elapsed:.2f}s")
+    return cursor.rowcount
+
+
+# ============================================================================
+# Player Name Index
+# ============================================================================
+
+def populate_player_names(conn):
+    """
+    Rebuild player_names: normalized name -> (tour, player_id).
+    
+    Keys come from the players tables (full name and first + last name), from
+    every name a player appears under in matches, and from PLAYER_NAME_ALIASES.
+    Names are normalized once per distinct value with the same function the
+    services use for lookups. match_count (matches played) orders players
+    that share a name.
+    
+    Args:
+        conn: SQLite connection
+    
+    Returns:
+        Number of name rows written
+    """
+    start_time = time.time()
+    frames = []
+    for tour in ('ATP', 'WTA'):
+        players_table = f"{tour.lower()}_players"
+        if not table_exists(conn, players_table):
+            continue
+        players = pd.read_sql_query(f"""
+            SELECT player_id, full_name,
+                   TRIM(COALESCE(name_first, '') || ' ' || COALESCE(name_last, '')) AS first_last
+            FROM {players_table}
+            WHERE player_id IS NOT NULL
+        """, conn)
+        for column in ('full_name', 'first_last'):
+            frames.append(pd.DataFrame({
+                'tour': tour, 'player_id': players['player_id'],
+                'display_name': players[column], 'name_source': 'players',
+            }))
+    
+    match_counts = None
+    if table_exists(conn, 'matches'):
+        match_names = pd.read_sql_query("""
+            SELECT tour, winner_id AS player_id, winner_name AS display_name, COUNT(*) AS matches
+            FROM matches WHERE winner_id IS NOT NULL GROUP BY 1, 2, 3
+            UNION ALL
+            SELECT tour, loser_id, loser_name, COUNT(*)
+            FROM matches WHERE loser_id IS NOT NULL GROUP BY 1, 2, 3
+        """, conn)
+        match_counts = match_names.groupby(['tour', 'player_id'], as_index=False)['matches'].sum()
+        frames.append(match_names.drop(columns=['matches']).assign(name_source='matches'))
+    
+    if not frames:
+        print("  player_names: skipped (no players or matches tables)")
+        return 0
+    
+    names = pd.concat(frames, ignore_index=True).dropna(subset=['display_name'])
+    codes, uniques = pd.factorize(names['display_name'])
+    names['name_key'] = pd.Series(uniques, dtype=object).map(normalize_player_name).to_numpy()[codes]
+    names = names[names['name_key'] != '']
+    
+    # Aliases point at every player whose name normalizes to the alias target
+    alias_targets = pd.DataFrame(
+        [(normalize_player_name(alias), target, normalize_player_name(target))
+         for alias, target in PLAYER_NAME_ALIASES.items()],
+        columns=['alias_key', 'target', 'name_key']
+    )
+    aliases = (
+        alias_targets.merge(names[['name_key', 'tour', 'player_id']], on='name_key')
+        .drop(columns=['name_key'])
+        .rename(columns={'alias_key': 'name_key', 'target': 'display_name'})
+        .assign(name_source='alias')
+    )
+    
+    names = (
+        pd.concat([names, aliases], ignore_index=True)
+        .drop_duplicates(['name_key', 'tour', 'player_id'])
+    )
+    if match_counts is not None:
+        names = names.merge(match_counts, on=['tour', 'player_id'], how='left')
+        names['match_count'] = names.pop('matches').fillna(0).astype('int64')
+    else:
+        names['match_count'] = 0
+    
+    written = write_table(conn, PLAYER_NAMES_TABLE, names)
+    print(f"  player_names: {names['name_key'].nunique():,} distinct names in {time.time() - start_time:.2f}s")
+    return written
+
+
+# ============================================================================
+# Index Build Stage
+# ============================================================================
+
+def build_indexes(conn, tables=None, analyze=True):
+    """
+    Build the declared indexes (load_data.schema.INDEXES) and refresh statistics.
+    
+    Runs after the bulk insert: building an index over loaded rows is much
+    faster than maintaining it during every insert. Indexes whose table does
+    not exist (e.g. a table switched off in config) are skipped, and existing
+    indexes are left alone, so the stage is safe to rerun.
+    
+    Args:
+        conn: SQLite connection
+        tables: Optional iterable of table names to restrict the stage to
+        analyze: Run ANALYZE afterwards so the planner sees the new indexes
+    
+    Returns:
+        Number of indexes created
+    """
+    print("\n--- Building Indexes ---")
+    stage_start = time.time()
+    existing = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    created = 0
+    for index_name, table, columns, where in INDEXES:
+        if tables is not None and table not in tables:
+            continue
+        if index_name in existing or not table_exists(conn, table):
+            continue
+        start_time = time.time()
+        conn.execute(create_index_sql(index_name, table, columns, where))
+        created += 1
+        print(f"  {index_name}: {time.time() - start_time:.2f}s")
+    
+    if analyze:
+        start_time = time.time()
+        conn.execute("ANALYZE")
+        print(f"  ANALYZE: {time.time() - start_time:.2f}s")
+    print(f"Built {created} indexes in {time.time() - stage_start:.2f}s")
+    return created
+
+
+# ============================================================================
+# Schema Digest Stage
+# ============================================================================
+
+def build_schema_digest_stage(conn):
+    """
+    Precompute the agent's schema digest (tennis.schema_digest) for this build.
+    
+    The digest scans low-cardinality columns for their values, so it runs
+    after the indexes and is stored in the database instead of being built
+    at app startup, together with the token estimate of the full table info
+    (so startup never generates the full text).
+    
+    Args:
+        conn: SQLite connection
+    
+    Returns:
+        The stored digest text
+    """
+    print("\n--- Building Schema Digest ---")
+    start_time = time.time()
+    digest = write_schema_digest(conn)
+    full_info_tokens = conn.execute(f"SELECT full_info_tokens FROM {SCHEMA_DIGEST_TABLE}").fetchone()[0]
+    print(f"Schema digest: {len(digest):,} characters (~{estimate_tokens(digest):,} tokens, "
+          f"full table info ~{full_info_tokens:,} tokens) in {time.time() - start_time:.2f}s")
+    return digest
+
+
+# ============================================================================
+# Incremental Update Helpers
+# ============================================================================
+
+def table_exists(conn, table):
+    """Return True if the given table exists in the database."""
+    row = conn.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+    ).fetchone()
+    return row is not None
+
+
+def delete_source_rows(conn, table, source_keys):
+    """
+    Delete the rows of a table that were loaded from the given source files.
+    
+    Args:
+        conn: SQLite connection
+        table: Table name (must have a source_file column)
+        source_keys: Manifest keys of the source files to remove
+    
+    Returns:
+        Number of rows deleted
+    """
+    if not source_keys or not table_exists(conn, table):
+        return 0
+    placeholders = ','.join('?' for _ in source_keys)
+    cursor = conn.execute(f"DELETE FROM {table} WHERE source_file IN ({placeholders})", list(source_keys))
+    return cursor.rowcount
+
+
+def append_source_rows(conn, table, df):
+    """
+    Append rows to an existing table, aligning the frame to the table's columns.
+    
+    Columns the table does not have are dropped with a warning and columns the
+    frame does not have are written as NULL, so a source file that gained or
+    lost a column does not break the update.
+    
+    Args:
+        conn: SQLite connection
+        table: Target table name
+        df: DataFrame of rows to append
+    
+    Returns:
+        Number of rows appended
+    """
+    if df.empty:
+        return 0
+    if not table_exists(conn, table):
+        return write_table(conn, table, df)
+    
+    table_columns = [row[1] for row in conn.execute(f"PRAGMA table_info({table})")]
+    extra_columns = [c for c in df.columns if c not in table_columns]
+    if extra_columns:
+        print(f"  Warning: dropping columns not present in {table}: {extra_columns}")
+    return insert_rows(conn, table, df, table_columns)
+
+
+def replace_players_table(conn, table, players_df):
+    """Replace a players table with freshly enriched player data."""
+    players_clean = players_df.drop(columns=['tour'], errors='ignore')
+    write_table(conn, table, players_clean)
+
+
+def refresh_ranking_player_names(conn, rankings_table, players_table):
+    """
+    Re-derive rankings.player_name after a players table was replaced.
+    
+    Args:
+        conn: SQLite connection
+        rankings_table: Rankings table name (atp_rankings or wta_rankings)
+        players_table: Players table name (atp_players or wta_players)
+    """
+    if not (table_exists(conn, rankings_table) and table_exists(conn, players_table)):
+        return
+    # The correlated lookup needs the player_id index to avoid an O(N*M) scan
+    build_indexes(conn, tables=[players_table], analyze=False)
+    conn.execute(f"""
+        UPDATE {rankings_table}
+        SET player_name = (
+            SELECT p.full_name FROM {players_table} p WHERE p.player_id = {rankings_table}.player
+        )
+    """)
+    print(f"Refreshed player names in {rankings_table} from {players_table}")
@@ -0,0 +1,154 @@
+"""
+Declared in-memory dtypes for the loaded tennis frames.
+
+read_csv infers object columns for every string and float64 for every
+numeric column with a missing value, which makes the 1.7M-row match frame
+several times larger than it needs to be. This module declares a compact
+dtype per source column (categoricals for low-cardinality strings, nullable
+small integers for counts and ids), applied when the CSVs are read.
+
+Real-valued columns (ages) stay float64: they are written to the database
+as-is and float32 would change the stored values.
+"""
+
+import pandas as pd
+
+# Low-cardinality string columns read as categoricals
+MATCHES_CATEGORY_COLUMNS = [
+    'surface', 'tourney_level', 'round',
+    'winner_entry', 'winner_hand', 'winner_ioc',
+    'loser_entry', 'loser_hand', 'loser_ioc',
+]
+
+# Per-match counts: small nullable integers (missing stats stay <NA>, not NaN)
+MATCH_STAT_COLUMNS = [
+    f'{side}_{stat}'
+    for side in ('w', 'l')
+    for stat in ('ace', 'df', 'svpt', '1stIn', '1stWon', '2ndWon', 'SvGms', 'bpSaved', 'bpFaced')
+]
+
+MATCHES_READ_DTYPES = {
+    **{col: 'category' for col in MATCHES_CATEGORY_COLUMNS},
+    **{col: 'Int16' for col in MATCH_STAT_COLUMNS},
+    'draw_size': 'Int16',
+    'match_num': 'Int32',
+    'winner_id': 'Int32',
+    'winner_seed': 'Int16',
+    'winner_ht': 'Int16',
+    'loser_id': 'Int32',
+    'loser_seed': 'Int16',
+    'loser_ht': 'Int16',
+    'best_of': 'Int8',
+    'minutes': 'Int16',
+    'winner_rank': 'Int32',
+    'winner_rank_points': 'Int32',
+    'loser_rank': 'Int32',
+    'loser_rank_points': 'Int32',
+}
+
+# Columns added by the transformation chain that are categorized once it is
+# done (the transformers fill and rewrite them as plain strings first)
+MATCHES_FINAL_CATEGORY_COLUMNS = MATCHES_CATEGORY_COLUMNS + ['tour', 'tournament_type', 'era']
+
+PLAYERS_READ_DTYPES = {
+    'player_id': 'Int32',
+    'hand': 'category',
+    'ioc': 'category',
+    'height': 'Int16',
+}
+
+RANKINGS_READ_DTYPES = {
+    'rank': 'Int32',
+    'player': 'Int32',
+    'points': 'Int32',
+}
+
+
+def apply_dtypes(df, dtype_plan):
+    """
+    Convert the planned columns of an already loaded frame, in place.
+
+    Used when a file cannot be read with its plan directly (e.g. a stray
+    non-numeric value in a count column): each column is converted on its
+    own and keeps its inferred dtype if the conversion fails.
+
+    Args:
+        df: DataFrame to convert
+        dtype_plan: Dict of column name -> dtype
+
+    Returns:
+        List of columns that could not be converted
+    """
+    failed = []
+    for col, dtype in dtype_plan.items():
+        if col not in df.columns or df[col].dtype == dtype:
+            continue
+        try:
+            df[col] = df[col].astype(dtype)
+        except (TypeError, ValueError):
+            failed.append(col)
+    return failed
+
+
+def categorize_columns(df, columns):
+    """
+    Convert string columns to categoricals in place (skipping missing ones).
+
+    Args:
+        df: DataFrame to convert
+        columns: Column names to categorize
+    """
+    for col in columns:
+        if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].astype('category')
+
+
+def concat_frames(frames):
+    """
+    Concatenate per-file frames without losing categorical dtypes.
+
+    pd.concat falls back to object for categoricals whose categories differ
+    between frames, so the categories are unioned first.
+
+    Args:
+        frames: List of DataFrames
+
+    Returns:
+        Concatenated DataFrame (ignore_index=True)
+    """
+    categorical = set.intersection(*[
+        {col for col in df.columns if isinstance(df[col].dtype, pd.CategoricalDtype)}
+        for df in frames
+    ]) if frames else set()
+    for col in categorical:
+        categories = pd.Index([]).append([df[col].cat.categories for df in frames]).unique()
+        for df in frames:
+            df[col] = df[col].cat.set_categories(categories)
+    return pd.concat(frames, ignore_index=True)
+
+
+def _default_dtype_bytes(series):
+    """Estimated size of a column had it been read with read_csv's default dtypes."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series.astype(object).memory_usage(deep=True, index=False)
+    if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+        # int64, or float64 when the column has missing values
+        return 8 * len(series)
+    return series.memory_usage(deep=True, index=False)
+
+
+def report_frame_memory(df, table):
+    """
+    Print a frame's memory with its compact dtypes against read_csv defaults.
+
+    Args:
+        df: Loaded DataFrame
+        table: Label for the printout
+    """
+    if df.empty:
+        return
+    compact = df.memory_usage(deep=True, index=False).sum()
+    default = sum(_default_dtype_bytes(df[col]) for col in df.columns)
+    saved = (1 - compact / default) * 100 if default else 0.0
+    print(f"  {table} memory: {default / 2**20:,.1f} MB with default dtypes -> "
+          f"{compact / 2**20:,.1f} MB compact ({saved:.0f}% smaller)")
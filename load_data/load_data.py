@@ -10,11 +10,13 @@ This module orchestrates the complete data loading pipeline:
 Usage:
     python -m load_data.load_data
     or
-    python load_data/load_data.py
+    python load_data/load_data.py [--incremental]
     or
     from load_data.load_data import create_database_with_players, verify_enhancement
 """
 
+import argparse
+import sqlite3
 import pandas as pd
 
 # Handle imports for both direct execution and module import
@@ -23,11 +25,18 @@ try:
     from .data_loaders import (
         load_players_data,
         load_rankings_data,
-        load_matches_data
+        load_matches_data,
+        load_players_file,
+        read_source_files,
+        iter_source_chunks,
+        get_player_source_files,
+        get_ranking_source_files,
+        get_match_source_files
     )
     from .data_transformers import (
         enrich_players_data,
         enrich_rankings_data,
+        player_name_lookup,
         set_tour_column,
         categorize_match_types,
         enrich_matches_data,
@@ -37,10 +46,41 @@ try:
         fix_missing_surface_data,
         standardize_tourney_levels
     )
-    from .database_builder import build_database
+    from .database_builder import (
+        build_database,
+        build_indexes,
+        build_schema_digest_stage,
+        populate_player_matches,
+        populate_player_aggregates,
+        populate_player_names,
+        table_exists,
+        delete_source_rows,
+        append_source_rows,
+        replace_players_table,
+        refresh_ranking_player_names
+    )
     from .database_verifier import verify_enhancement
-    from .utils import ProgressTracker
-    from .config import DB_FILE
+    from .manifest import (
+        source_key,
+        fingerprint_files,
+        has_manifest,
+        find_changed_files,
+        record_files,
+        refresh_fingerprints,
+        forget_files,
+        tables_for_keys,
+        MANIFEST_TABLE
+    )
+    from .utils import ProgressTracker, report_peak_rss
+    from .dtypes import (
+        MATCHES_READ_DTYPES, RANKINGS_READ_DTYPES, MATCHES_FINAL_CATEGORY_COLUMNS,
+        categorize_columns, concat_frames, report_frame_memory
+    )
+    from .config import (
+        DB_FILE, INCREMENTAL_BUILD, CREATE_INDEXES,
+        CREATE_TABLE_PLAYER_MATCHES, CREATE_TABLE_PLAYER_AGGREGATES, CREATE_TABLE_PLAYER_NAMES,
+        STREAM_RANKINGS, RANKINGS_CHUNK_SIZE
+    )
 except ImportError:
     # Fall back to absolute imports (when run directly)
     import sys
@@ -50,11 +90,18 @@ except ImportError:
     from load_data.data_loaders import (
         load_players_data,
         load_rankings_data,
-        load_matches_data
+        load_matches_data,
+        load_players_file,
+        read_source_files,
+        iter_source_chunks,
+        get_player_source_files,
+        get_ranking_source_files,
+        get_match_source_files
     )
     from load_data.data_transformers import (
         enrich_players_data,
         enrich_rankings_data,
+        player_name_lookup,
         set_tour_column,
         categorize_match_types,
         enrich_matches_data,
@@ -64,13 +111,189 @@ except ImportError:
         fix_missing_surface_data,
         standardize_tourney_levels
     )
-    from load_data.database_builder import build_database
+    from load_data.database_builder import (
+        build_database,
+        build_indexes,
+        build_schema_digest_stage,
+        populate_player_matches,
+        populate_player_aggregates,
+        populate_player_names,
+        table_exists,
+        delete_source_rows,
+        append_source_rows,
+        replace_players_table,
+        refresh_ranking_player_names
+    )
     from load_data.database_verifier import verify_enhancement
-    from load_data.utils import ProgressTracker
-    from load_data.config import DB_FILE
+    from load_data.manifest import (
+        source_key,
+        fingerprint_files,
+        has_manifest,
+        find_changed_files,
+        record_files,
+        refresh_fingerprints,
+        forget_files,
+        tables_for_keys,
+        MANIFEST_TABLE
+    )
+    from load_data.utils import ProgressTracker, report_peak_rss
+    from load_data.dtypes import (
+        MATCHES_READ_DTYPES, RANKINGS_READ_DTYPES, MATCHES_FINAL_CATEGORY_COLUMNS,
+        categorize_columns, concat_frames, report_frame_memory
+    )
+    from load_data.config import (
+        DB_FILE, INCREMENTAL_BUILD, CREATE_INDEXES,
+        CREATE_TABLE_PLAYER_MATCHES, CREATE_TABLE_PLAYER_AGGREGATES, CREATE_TABLE_PLAYER_NAMES,
+        STREAM_RANKINGS, RANKINGS_CHUNK_SIZE
+    )
+
+
+def transform_matches(matches_df, progress=None):
+    """
+    Apply the full match transformation chain to raw match data.
+    
+    Shared by the full build and the incremental update so both produce
+    identical rows for the same source file.
+    
+    Every stage works in place on matches_df (the raw frame is not kept), so
+    the build never holds more than one full copy of the match data. The
+    process peak RSS is printed after each stage.
+    
+    Args:
+        matches_df: Raw match DataFrame from the loaders (modified in place)
+        progress: Optional ProgressTracker advanced once per stage
+    
+    Returns:
+        Transformed match DataFrame ready to be written
+    """
+    def step(message):
+        if progress is not None:
+            progress.update(1, message)
+    
+    step("Enriching match data...")
+    if not matches_df.empty:
+        # Optimization: Set tour column first (needed for categorization)
+        matches_df = set_tour_column(matches_df, inplace=True)
+        # Categorize matches into tournament types (needs 'tour' column)
+        matches_df = categorize_match_types(matches_df, inplace=True)
+        # Then enrich with era, dates, etc. and fill remaining tournament_type with 'Main Tour'
+        matches_df = enrich_matches_data(matches_df, fill_missing_tournament_type=True, inplace=True)
+        # Filter based on switches
+        matches_df = filter_matches_by_switches(matches_df, inplace=True)
+    report_peak_rss("match enrichment")
+    
+    # Continue with existing transformations
+    step("Fixing surface data...")
+    matches_df = fix_missing_surface_data(matches_df, inplace=True)
+    report_peak_rss("surface fix")
+    
+    # Parse date components (replace tourney_date with event_year, event_month, event_date)
+    step("Parsing date components...")
+    matches_df = parse_date_components(matches_df, inplace=True)
+    report_peak_rss("date parsing")
+    
+    # Parse score data (replace score with set1, set2, set3, set4, set5)
+    step("Parsing score data...")
+    matches_df = parse_score_data(matches_df, inplace=True)
+    report_peak_rss("score parsing")
+    
+    # Standardize tourney levels
+    step("Standardizing tourney levels...")
+    matches_df = standardize_tourney_levels(matches_df, 'Mixed', inplace=True)  # Mixed ATP/WTA data
+    report_peak_rss("tourney level standardization")
+    
+    # The transformers rewrite these as plain strings; store them compactly again
+    categorize_columns(matches_df, MATCHES_FINAL_CATEGORY_COLUMNS)
+    report_frame_memory(matches_df, "Transformed matches")
+    
+    return matches_df
 
 
-def create_database_with_players():
+def rows_per_source_file(df, file_paths):
+    """
+    Count the rows of a loaded frame per source file.
+    
+    Args:
+        df: Loaded DataFrame (with source_file column)
+        file_paths: Source file paths to count
+    
+    Returns:
+        Dict of file path -> row count (0 for files without rows)
+    """
+    counts = df['source_file'].value_counts() if 'source_file' in df.columns else pd.Series(dtype=int)
+    return {path: int(counts.get(source_key(path), 0)) for path in file_paths}
+
+
+def stream_rankings(tour, ranking_files, players_df, row_counts):
+    """
+    Yield enriched rankings chunks for one tour, file by file (STREAM_RANKINGS mode).
+    
+    The player name lookup is built once and reused for every chunk. Rows
+    are counted per source file into row_counts as the stream is consumed.
+    
+    Args:
+        tour: 'ATP' or 'WTA'
+        ranking_files: Ranking source files of the tour, in load order
+        players_df: Enriched players of the tour (for the name join)
+        row_counts: Dict filled with file path -> rows yielded
+    
+    Yields:
+        Enriched rankings DataFrames of at most RANKINGS_CHUNK_SIZE rows
+    """
+    player_names = player_name_lookup(players_df)
+    for file_path in ranking_files:
+        row_counts[file_path] = 0
+        for chunk in iter_source_chunks(file_path, RANKINGS_CHUNK_SIZE, RANKINGS_READ_DTYPES):
+            chunk = enrich_rankings_data(chunk, tour=tour, player_names=player_names, inplace=True)
+            row_counts[file_path] += len(chunk)
+            yield chunk
+
+
+def source_fingerprints():
+    """
+    Fingerprint every source file the current configuration loads.
+    
+    Taken before a full build reads the files, so the manifest describes the
+    contents that were actually loaded.
+    
+    Returns:
+        Dict of file path -> fingerprint
+    """
+    atp_ranking_files, wta_ranking_files = get_ranking_source_files()
+    paths = [players_path for players_path, _ in get_player_source_files()]
+    paths += atp_ranking_files + wta_ranking_files
+    paths += [file_path for file_path, _ in get_match_source_files()]
+    return fingerprint_files(paths)
+
+
+def record_source_manifest(matches_df, player_row_counts, ranking_row_counts, fingerprints):
+    """
+    Record the fingerprint of every loaded source file after a full build.
+    
+    Args:
+        matches_df: Transformed match data (with source_file column)
+        player_row_counts: Dict of players file path -> rows loaded
+        ranking_row_counts: Dict of rankings table -> {file path: rows loaded}
+        fingerprints: Fingerprints taken before the files were read (see source_fingerprints)
+    """
+    print("\n--- Recording Source File Manifest ---")
+    atp_ranking_files, wta_ranking_files = get_ranking_source_files()
+    
+    with sqlite3.connect(DB_FILE) as conn:
+        # A full build replaces every table, so start from an empty manifest
+        conn.execute(f"DROP TABLE IF EXISTS {MANIFEST_TABLE}")
+        for players_path, tour in get_player_source_files():
+            record_files(conn, {players_path: player_row_counts.get(players_path, 0)},
+                         f"{tour.lower()}_players", fingerprints)
+        for table, ranking_files in (('atp_rankings', atp_ranking_files), ('wta_rankings', wta_ranking_files)):
+            counts = ranking_row_counts.get(table, {})
+            record_files(conn, {path: counts.get(path, 0) for path in ranking_files}, table, fingerprints)
+        match_paths = [file_path for file_path, _ in get_match_source_files()]
+        record_files(conn, rows_per_source_file(matches_df, match_paths), 'matches', fingerprints)
+    print("Source manifest recorded.")
+
+
+def create_database_with_players(incremental=INCREMENTAL_BUILD):
     """
     Creates the enhanced database with COMPLETE tennis history (1877-2024), 
     including all tournament levels, player information, and rankings.
@@ -79,70 +302,86 @@ def create_database_with_players():
     1. Data loading from CSV files
     2. Data transformation and cleaning
     3. Database creation with tables
+    
+    Args:
+        incremental: If True and the database already has a source manifest,
+                     only reload rows from source files that changed since the
+                     last build (see update_database_incrementally).
     """
+    if incremental:
+        with sqlite3.connect(DB_FILE) as conn:
+            manifest_found = has_manifest(conn)
+        if manifest_found:
+            return update_database_incrementally()
+        print("No source manifest found in database, running a full build.")
+    
     print("=== Enhanced Data Loading with COMPLETE Tournament Coverage (1877-2024) ===")
     
     # Initialize progress tracker for main steps
-    main_steps = 10  # players_load, rankings_load, matches_load, players_enrich, rankings_enrich, matches_enrich, surface_fix, date_parsing, score_parsing, tourney_level_standardization, database_creation
+    main_steps = 12  # players_load, rankings_load, matches_load, players_enrich, rankings_enrich, matches_enrich, surface_fix, date_parsing, score_parsing, tourney_level_standardization, database_creation, index_build
     progress = ProgressTracker(main_steps, "Database Creation")
     
+    # Fingerprint the sources before reading them (recorded in the manifest)
+    fingerprints = source_fingerprints()
+    
     # 1. Load raw data
     progress.update(1, "Loading player data...")
     atp_players_df, wta_players_df = load_players_data()
+    player_row_counts = {
+        players_path: len(atp_players_df if tour == 'ATP' else wta_players_df)
+        for players_path, tour in get_player_source_files()
+    }
     
     progress.update(1, "Loading rankings data...")
-    atp_rankings_df, wta_rankings_df = load_rankings_data()
+    if STREAM_RANKINGS:
+        # Read chunk by chunk while the database is written (see stream_rankings)
+        print(f"--- Rankings will be streamed into the database in chunks of {RANKINGS_CHUNK_SIZE:,} rows ---")
+        atp_rankings_df = wta_rankings_df = pd.DataFrame()
+    else:
+        atp_rankings_df, wta_rankings_df = load_rankings_data()
     
     progress.update(1, "Loading match data...")
     matches_df = load_matches_data()
+    report_peak_rss("raw data load")
     
     # 2. Transform/enrich data
     progress.update(1, "Enriching player data...")
     if not atp_players_df.empty:
-        atp_players_df = enrich_players_data(atp_players_df, tour='ATP')
+        atp_players_df = enrich_players_data(atp_players_df, tour='ATP', inplace=True)
     if not wta_players_df.empty:
-        wta_players_df = enrich_players_data(wta_players_df, tour='WTA')
+        wta_players_df = enrich_players_data(wta_players_df, tour='WTA', inplace=True)
 
     
     progress.update(1, "Enriching rankings data...")
     # Enrich ATP rankings (with player names from ATP players)
     if not atp_rankings_df.empty:
-        atp_rankings_df = enrich_rankings_data(atp_rankings_df, tour='ATP', players_df=atp_players_df)
+        atp_rankings_df = enrich_rankings_data(atp_rankings_df, tour='ATP', players_df=atp_players_df, inplace=True)
         if 'ranking_date' in atp_rankings_df.columns:
             print(f"ATP rankings date range: {atp_rankings_df['ranking_date'].min()} to {atp_rankings_df['ranking_date'].max()}")
     
     # Enrich WTA rankings (with player names from WTA players)
     if not wta_rankings_df.empty:
-        wta_rankings_df = enrich_rankings_data(wta_rankings_df, tour='WTA', players_df=wta_players_df)
+        wta_rankings_df = enrich_rankings_data(wta_rankings_df, tour='WTA', players_df=wta_players_df, inplace=True)
         if 'ranking_date' in wta_rankings_df.columns:
             print(f"WTA rankings date range: {wta_rankings_df['ranking_date'].min()} to {wta_rankings_df['ranking_date'].max()}")
     
-    progress.update(1, "Enriching match data...")
-    if not matches_df.empty:
-        # Optimization: Set tour column first (needed for categorization)
-        matches_df = set_tour_column(matches_df)
-        # Categorize matches into tournament types (needs 'tour' column)
-        matches_df = categorize_match_types(matches_df)
-        # Then enrich with era, dates, etc. and fill remaining tournament_type with 'Main Tour'
-        matches_df = enrich_matches_data(matches_df, fill_missing_tournament_type=True)
-        # Filter based on switches
-        matches_df = filter_matches_by_switches(matches_df)
-    
-    # 3. Continue with existing transformations
-    progress.update(1, "Fixing surface data...")
-    matches_df = fix_missing_surface_data(matches_df)
+    atp_ranking_files, wta_ranking_files = get_ranking_source_files()
+    if STREAM_RANKINGS:
+        # Generators: consumed (and counted) by build_database as it writes
+        ranking_row_counts = {'atp_rankings': {}, 'wta_rankings': {}}
+        atp_rankings = stream_rankings('ATP', atp_ranking_files, atp_players_df, ranking_row_counts['atp_rankings'])
+        wta_rankings = stream_rankings('WTA', wta_ranking_files, wta_players_df, ranking_row_counts['wta_rankings'])
+    else:
+        ranking_row_counts = {
+            'atp_rankings': rows_per_source_file(atp_rankings_df, atp_ranking_files),
+            'wta_rankings': rows_per_source_file(wta_rankings_df, wta_ranking_files),
+        }
+        atp_rankings, wta_rankings = atp_rankings_df, wta_rankings_df
     
-    # Parse date components (replace tourney_date with event_year, event_month, event_date)
-    progress.update(1, "Parsing date components...")
-    matches_df = parse_date_components(matches_df)
-    
-    # Parse score data (replace score with set1, set2, set3, set4, set5)
-    progress.update(1, "Parsing score data...")
-    matches_df = parse_score_data(matches_df)
+    report_peak_rss("player and rankings enrichment")
     
-    # Standardize tourney levels
-    progress.update(1, "Standardizing tourney levels...")
-    matches_df = standardize_tourney_levels(matches_df, 'Mixed')  # Mixed ATP/WTA data
+    # 3. Match enrichment and the existing transformations
+    matches_df = transform_matches(matches_df, progress)
     
     if (atp_players_df.empty and wta_players_df.empty) or matches_df.empty:
         print("Error: Could not load required data. Exiting.")
@@ -150,7 +389,22 @@ def create_database_with_players():
     
     # Build database (create tables)
     progress.update(1, "Building database...")
-    build_database(matches_df, atp_players_df, wta_players_df, atp_rankings_df, wta_rankings_df)
+    build_database(matches_df, atp_players_df, wta_players_df, atp_rankings, wta_rankings)
+    record_source_manifest(matches_df, player_row_counts, ranking_row_counts, fingerprints)
+    report_peak_rss("database write")
+    
+    # Build indexes over the loaded tables (after the bulk insert)
+    progress.update(1, "Building indexes...")
+    if CREATE_INDEXES:
+        with sqlite3.connect(DB_FILE) as conn:
+            build_indexes(conn)
+        report_peak_rss("index build")
+    else:
+        print("Skipping index creation (CREATE_INDEXES = False)")
+    
+    # Compact schema description for the agent's system prompt
+    with sqlite3.connect(DB_FILE) as conn:
+        build_schema_digest_stage(conn)
     
     progress.complete("Database creation completed!")
     
@@ -158,10 +412,12 @@ def create_database_with_players():
     print(f"\n✅ Successfully created enhanced database '{DB_FILE}' with:")
     print(f"   - {len(matches_df)} singles matches (COMPLETE tournament coverage: 1877-2024)")
     print(f"   - {total_players} players (ATP: {len(atp_players_df)}, WTA: {len(wta_players_df)})")
-    if not atp_rankings_df.empty:
-        print(f"   - {len(atp_rankings_df)} ATP ranking records")
-    if not wta_rankings_df.empty:
-        print(f"   - {len(wta_rankings_df)} WTA ranking records")
+    atp_ranking_rows = sum(ranking_row_counts['atp_rankings'].values())
+    wta_ranking_rows = sum(ranking_row_counts['wta_rankings'].values())
+    if atp_ranking_rows:
+        print(f"   - {atp_ranking_rows} ATP ranking records")
+    if wta_ranking_rows:
+        print(f"   - {wta_ranking_rows} WTA ranking records")
     print(f"   - Player metadata integration")
     print(f"   - Rankings data integration")
     print(f"   - Surface data quality fix (missing surface inference)")
@@ -172,6 +428,154 @@ def create_database_with_players():
     print(f"   - COMPLETE tennis tournament database (147 years)")
 
 
+def update_database_incrementally():
+    """
+    Update an existing database using only the source files that changed.
+    
+    Every source file is compared against the manifest stored in the database
+    (size/mtime first, content hash when those differ). Only changed files are
+    re-parsed and re-transformed; their old rows are deleted by source_file and
+    the new rows appended, all in one transaction. Changed player files replace
+    the players table and refresh the player names in the matching rankings.
+    
+    Note: surface inference for changed match files uses lookups built from
+    those files only, not from the whole matches table.
+    """
+    print("=== Incremental Database Update ===")
+    
+    player_files = get_player_source_files()
+    atp_ranking_files, wta_ranking_files = get_ranking_source_files()
+    match_files = get_match_source_files()
+    
+    target_tables = {players_path: f"{tour.lower()}_players" for players_path, tour in player_files}
+    target_tables.update({f: 'atp_rankings' for f in atp_ranking_files})
+    target_tables.update({f: 'wta_rankings' for f in wta_ranking_files})
+    target_tables.update({f: 'matches' for f, _ in match_files})
+    
+    conn = sqlite3.connect(DB_FILE)
+    try:
+        changed_paths, removed_keys, touched = find_changed_files(conn, list(target_tables))
+        if not changed_paths and not removed_keys:
+            refresh_fingerprints(conn, touched)
+            conn.commit()
+            print("All source files unchanged - database is up to date.")
+            return
+        # Fingerprint the changed files before re-reading them (recorded in the manifest)
+        fingerprints = fingerprint_files(changed_paths)
+        
+        print(f"Changed source files: {len(changed_paths)}, removed source files: {len(removed_keys)}")
+        for path in changed_paths:
+            print(f"  changed: {source_key(path)}")
+        for key in removed_keys:
+            print(f"  removed: {key}")
+        
+        matches_changed = False
+        players_changed = False
+        
+        # Drop rows belonging to source files that no longer exist (or are switched off)
+        for key, table in tables_for_keys(conn, removed_keys).items():
+            if not table.endswith('_players'):
+                deleted = delete_source_rows(conn, table, [key])
+                print(f"Deleted {deleted} rows of {key} from {table}")
+                if table == 'matches':
+                    delete_source_rows(conn, 'player_matches', [key])
+                    matches_changed = True
+        forget_files(conn, removed_keys)
+        
+        # 1. Players: small tables, replaced wholesale
+        for players_path, tour in player_files:
+            if players_path not in changed_paths:
+                continue
+            players_table = f"{tour.lower()}_players"
+            players_df = enrich_players_data(load_players_file(players_path, tour), tour=tour, inplace=True)
+            replace_players_table(conn, players_table, players_df)
+            refresh_ranking_player_names(conn, f"{tour.lower()}_rankings", players_table)
+            record_files(conn, {players_path: len(players_df)}, players_table, fingerprints)
+            players_changed = True
+        
+        # 2. Rankings: re-parse changed decade files, name-join against the stored players
+        for tour, ranking_files in (('ATP', atp_ranking_files), ('WTA', wta_ranking_files)):
+            changed_ranking_files = [f for f in ranking_files if f in changed_paths]
+            if not changed_ranking_files:
+                continue
+            rankings_table = f"{tour.lower()}_rankings"
+            players_df = pd.read_sql_query(
+                f"SELECT player_id, full_name FROM {tour.lower()}_players", conn
+            )
+            if STREAM_RANKINGS:
+                player_names = player_name_lookup(players_df)
+                for file_path in changed_ranking_files:
+                    delete_source_rows(conn, rankings_table, [source_key(file_path)])
+                    written = 0
+                    for chunk in iter_source_chunks(file_path, RANKINGS_CHUNK_SIZE, RANKINGS_READ_DTYPES):
+                        chunk = enrich_rankings_data(chunk, tour=tour, player_names=player_names, inplace=True)
+                        written += append_source_rows(conn, rankings_table, chunk.drop(columns=['tour'], errors='ignore'))
+                    record_files(conn, {file_path: written}, rankings_table, fingerprints)
+                    print(f"Upserted {written} rows from {source_key(file_path)} into {rankings_table}")
+            else:
+                frames = read_source_files(
+                    [(f, None, {'dtype': RANKINGS_READ_DTYPES}) for f in changed_ranking_files],
+                    f"{tour} Rankings Loading"
+                )
+                for file_path, df in frames:
+                    df = enrich_rankings_data(df, tour=tour, players_df=players_df, inplace=True)
+                    delete_source_rows(conn, rankings_table, [source_key(file_path)])
+                    written = append_source_rows(conn, rankings_table, df.drop(columns=['tour'], errors='ignore'))
+                    record_files(conn, {file_path: written}, rankings_table, fingerprints)
+                    print(f"Upserted {written} rows from {source_key(file_path)} into {rankings_table}")
+        
+        # 3. Matches: re-parse and re-transform changed files together
+        changed_match_files = [(f, tour) for f, tour in match_files if f in changed_paths]
+        if changed_match_files:
+            frames = read_source_files(
+                [(f, tour, {'low_memory': False, 'dtype': MATCHES_READ_DTYPES}) for f, tour in changed_match_files],
+                "Match Loading"
+            )
+            if frames:
+                matches_df = concat_frames([df for _, df in frames])
+                del frames  # Release the per-file frames before transforming in place
+                matches_df = transform_matches(matches_df)
+                keys = [source_key(f) for f, _ in changed_match_files]
+                deleted = delete_source_rows(conn, 'matches', keys)
+                delete_source_rows(conn, 'player_matches', keys)
+                written = append_source_rows(conn, 'matches', matches_df)
+                if CREATE_TABLE_PLAYER_MATCHES:
+                    # Rebuild from scratch if an older database has no player_matches yet
+                    populate_player_matches(conn, keys if table_exists(conn, 'player_matches') else None)
+                matches_changed = True
+                counts = matches_df['source_file'].value_counts()
+                record_files(conn, {f: counts.get(source_key(f), 0) for f, _ in changed_match_files}, 'matches', fingerprints)
+                print(f"Replaced {deleted} match rows with {written} rows from {len(keys)} files")
+        
+        # Aggregates are cheap to re-derive from player_matches, so rebuild them whole
+        if matches_changed and CREATE_TABLE_PLAYER_MATCHES and CREATE_TABLE_PLAYER_AGGREGATES:
+            populate_player_aggregates(conn)
+        # The name index covers players and match names, so rebuild it when either changed
+        if (matches_changed or players_changed) and CREATE_TABLE_PLAYER_NAMES:
+            populate_player_names(conn)
+        
+        refresh_fingerprints(conn, touched)
+        conn.commit()
+        if CREATE_INDEXES:
+            # Recreates indexes of replaced tables and refreshes planner statistics
+            build_indexes(conn)
+            conn.commit()
+        # Value lists and year ranges may have changed with the new rows
+        build_schema_digest_stage(conn)
+        print("\n✅ Incremental update completed.")
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+
 if __name__ == '__main__':
-    create_database_with_players()
+    parser = argparse.ArgumentParser(description="Build the tennis SQLite database from the source CSVs.")
+    parser.add_argument('--incremental', action='store_true', default=INCREMENTAL_BUILD,
+                        help="Only reload source files that changed since the last build")
+    parser.add_argument('--full', action='store_true', help="Force a full rebuild")
+    args = parser.parse_args()
+    
+    create_database_with_players(incremental=args.incremental and not args.full)
     verify_enhancement()
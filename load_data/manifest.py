@@ -0,0 +1,209 @@
+"""
+Source file manifest for incremental database rebuilds.
+
+This module fingerprints every source CSV (path, size, mtime, content hash,
+row count) and records the fingerprints inside the SQLite database, so a
+rerun can detect which files changed and only reload the rows that came
+from them.
+"""
+
+import hashlib
+import os
+import time
+
+from .config import PROJECT_ROOT
+
+MANIFEST_TABLE = "_source_manifest"
+HASH_CHUNK_SIZE = 1024 * 1024  # Read files in 1 MB chunks when hashing
+
+
+def source_key(file_path):
+    """
+    Return the manifest key for a source file: its path relative to PROJECT_ROOT.
+
+    Relative keys keep the manifest valid when the project directory moves.
+    This is also the value stored in the source_file column of loaded tables.
+    """
+    return os.path.relpath(os.path.abspath(file_path), PROJECT_ROOT).replace(os.sep, "/")
+
+
+def hash_file(file_path):
+    """Compute the SHA-256 hex digest of a file's content."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def fingerprint_file(file_path, content_hash=None):
+    """
+    Build a fingerprint record for a source file.
+
+    Args:
+        file_path: Path to the source file
+        content_hash: Precomputed content hash (computed if None)
+
+    Returns:
+        Dict with path, size, mtime and content_hash keys
+    """
+    stat = os.stat(file_path)
+    return {
+        "path": source_key(file_path),
+        "size": stat.st_size,
+        "mtime": stat.st_mtime,
+        "content_hash": content_hash or hash_file(file_path),
+    }
+
+
+def fingerprint_files(file_paths):
+    """
+    Fingerprint source files before they are read.
+
+    A build records these instead of fingerprinting after the load, so a
+    file edited while the build was reading it does not look current and
+    is reloaded by the next incremental build.
+
+    Args:
+        file_paths: Source file paths about to be loaded
+
+    Returns:
+        Dict mapping file path to fingerprint (see fingerprint_file)
+    """
+    return {file_path: fingerprint_file(file_path) for file_path in file_paths}
+
+
+def ensure_manifest_table(conn):
+    """Create the manifest table if it does not exist yet."""
+    conn.execute(f"""
+        CREATE TABLE IF NOT EXISTS {MANIFEST_TABLE} (
+            path TEXT PRIMARY KEY,
+            target_table TEXT NOT NULL,
+            size INTEGER NOT NULL,
+            mtime REAL NOT NULL,
+            content_hash TEXT NOT NULL,
+            row_count INTEGER NOT NULL,
+            loaded_at REAL NOT NULL
+        )
+    """)
+
+
+def has_manifest(conn):
+    """Return True if the database already contains a source manifest."""
+    row = conn.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'table' AND name = ?",
+        (MANIFEST_TABLE,)
+    ).fetchone()
+    return row is not None
+
+
+def read_manifest(conn):
+    """
+    Read all manifest records.
+
+    Returns:
+        Dict mapping source key to record dict
+    """
+    if not has_manifest(conn):
+        return {}
+    cursor = conn.execute(
+        f"SELECT path, target_table, size, mtime, content_hash, row_count FROM {MANIFEST_TABLE}"
+    )
+    columns = [c[0] for c in cursor.description]
+    return {row[0]: dict(zip(columns, row)) for row in cursor.fetchall()}
+
+
+def find_changed_files(conn, file_paths):
+    """
+    Compare source files on disk against the manifest.
+
+    A file whose size and mtime match its manifest record is unchanged without
+    being read. Otherwise the content hash decides, so a file that was merely
+    touched is not reloaded.
+
+    Args:
+        conn: SQLite connection to the target database
+        file_paths: Source file paths that the current configuration would load
+
+    Returns:
+        Tuple of (changed_paths, removed_keys, touched_fingerprints):
+        changed_paths are paths that are new or whose content changed,
+        removed_keys are manifest keys no longer present in file_paths,
+        touched_fingerprints are refreshed fingerprints of unchanged files
+        whose mtime moved (to be written back so they skip hashing next time).
+    """
+    manifest = read_manifest(conn)
+    changed_paths = []
+    touched_fingerprints = []
+
+    for file_path in file_paths:
+        record = manifest.get(source_key(file_path))
+        if record is None:
+            changed_paths.append(file_path)
+            continue
+        stat = os.stat(file_path)
+        if stat.st_size == record["size"] and stat.st_mtime == record["mtime"]:
+            continue
+        fingerprint = fingerprint_file(file_path)
+        if fingerprint["content_hash"] == record["content_hash"]:
+            touched_fingerprints.append(fingerprint)
+        else:
+            changed_paths.append(file_path)
+
+    current_keys = {source_key(f) for f in file_paths}
+    removed_keys = [key for key in manifest if key not in current_keys]
+    return changed_paths, removed_keys, touched_fingerprints
+
+
+def record_files(conn, file_row_counts, target_table, fingerprints=None):
+    """
+    Write (or replace) manifest records for loaded source files.
+
+    Args:
+        conn: SQLite connection to the target database
+        file_row_counts: Dict mapping source file path to rows loaded from it
+        target_table: Name of the table the rows were written to
+        fingerprints: Dict mapping file path to the fingerprint taken before
+            the file was read (see fingerprint_files); files missing from it
+            are fingerprinted now
+    """
+    ensure_manifest_table(conn)
+    loaded_at = time.time()
+    fingerprints = fingerprints or {}
+    rows = []
+    for file_path, row_count in file_row_counts.items():
+        fingerprint = fingerprints.get(file_path) or fingerprint_file(file_path)
+        rows.append((
+            fingerprint["path"], target_table, fingerprint["size"], fingerprint["mtime"],
+            fingerprint["content_hash"], int(row_count), loaded_at
+        ))
+    conn.executemany(
+        f"INSERT OR REPLACE INTO {MANIFEST_TABLE} "
+        "(path, target_table, size, mtime, content_hash, row_count, loaded_at) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?)",
+        rows
+    )
+
+
+def refresh_fingerprints(conn, fingerprints):
+    """Update size/mtime of files whose content hash did not change."""
+    conn.executemany(
+        f"UPDATE {MANIFEST_TABLE} SET size = ?, mtime = ? WHERE path = ?",
+        [(fp["size"], fp["mtime"], fp["path"]) for fp in fingerprints]
+    )
+
+
+def forget_files(conn, keys):
+    """Remove manifest records for source files that no longer exist."""
+    conn.executemany(f"DELETE FROM {MANIFEST_TABLE} WHERE path = ?", [(key,) for key in keys])
+
+
+def tables_for_keys(conn, keys):
+    """
+    Look up which table each manifest key was loaded into.
+
+    Returns:
+        Dict mapping manifest key to target table name
+    """
+    manifest = read_manifest(conn)
+    return {key: manifest[key]["target_table"] for key in keys if key in manifest}
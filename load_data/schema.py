@@ -0,0 +1,383 @@
+"""
+Explicit table schemas for the tennis database.
+
+This module declares the column types of every table written by the
+database builder, so SQLite gets proper INTEGER/REAL/TEXT affinities
+instead of whatever DataFrame.to_sql infers from a particular load.
+"""
+
+import pandas as pd
+
+# Dates are stored as ISO text ('YYYY-MM-DD HH:MM:SS'), the same format
+# DataFrame.to_sql produced, so strftime() and string comparisons keep working.
+DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+MATCHES_SCHEMA = [
+    # Stable match key (rowid alias), assigned by SQLite on insert
+    ('match_id', 'INTEGER PRIMARY KEY'),
+    ('tourney_id', 'TEXT'),
+    ('tourney_name', 'TEXT'),
+    ('surface', 'TEXT'),
+    # How the surface was obtained (see data_transformers.SURFACE_SOURCES)
+    ('surface_source', 'TEXT'),
+    ('draw_size', 'INTEGER'),
+    ('tourney_level', 'TEXT'),
+    ('tourney_date', 'TEXT'),
+    ('event_year', 'INTEGER'),
+    ('event_month', 'INTEGER'),
+    ('event_date', 'INTEGER'),
+    ('match_num', 'INTEGER'),
+    ('winner_id', 'INTEGER'),
+    ('winner_seed', 'INTEGER'),
+    ('winner_entry', 'TEXT'),
+    ('winner_name', 'TEXT'),
+    ('winner_hand', 'TEXT'),
+    ('winner_ht', 'INTEGER'),
+    ('winner_ioc', 'TEXT'),
+    ('winner_age', 'REAL'),
+    ('loser_id', 'INTEGER'),
+    ('loser_seed', 'INTEGER'),
+    ('loser_entry', 'TEXT'),
+    ('loser_name', 'TEXT'),
+    ('loser_hand', 'TEXT'),
+    ('loser_ht', 'INTEGER'),
+    ('loser_ioc', 'TEXT'),
+    ('loser_age', 'REAL'),
+    ('score', 'TEXT'),
+    ('set1', 'TEXT'),
+    ('set2', 'TEXT'),
+    ('set3', 'TEXT'),
+    ('set4', 'TEXT'),
+    ('set5', 'TEXT'),
+] + [
+    (f'set{i}_{part}', 'INTEGER')
+    for i in range(1, 6)
+    for part in ('w_games', 'l_games', 'tiebreak')
+] + [
+    ('total_games', 'INTEGER'),
+    ('best_of', 'INTEGER'),
+    ('round', 'TEXT'),
+    ('minutes', 'INTEGER'),
+    ('w_ace', 'INTEGER'),
+    ('w_df', 'INTEGER'),
+    ('w_svpt', 'INTEGER'),
+    ('w_1stIn', 'INTEGER'),
+    ('w_1stWon', 'INTEGER'),
+    ('w_2ndWon', 'INTEGER'),
+    ('w_SvGms', 'INTEGER'),
+    ('w_bpSaved', 'INTEGER'),
+    ('w_bpFaced', 'INTEGER'),
+    ('l_ace', 'INTEGER'),
+    ('l_df', 'INTEGER'),
+    ('l_svpt', 'INTEGER'),
+    ('l_1stIn', 'INTEGER'),
+    ('l_1stWon', 'INTEGER'),
+    ('l_2ndWon', 'INTEGER'),
+    ('l_SvGms', 'INTEGER'),
+    ('l_bpSaved', 'INTEGER'),
+    ('l_bpFaced', 'INTEGER'),
+    ('winner_rank', 'INTEGER'),
+    ('winner_rank_points', 'INTEGER'),
+    ('loser_rank', 'INTEGER'),
+    ('loser_rank_points', 'INTEGER'),
+    ('tour', 'TEXT'),
+    ('tournament_type', 'TEXT'),
+    ('source_file', 'TEXT'),
+    ('era', 'TEXT'),
+]
+
+PLAYERS_SCHEMA = [
+    ('player_id', 'INTEGER'),
+    ('name_first', 'TEXT'),
+    ('name_last', 'TEXT'),
+    ('hand', 'TEXT'),
+    ('dob', 'TEXT'),
+    ('ioc', 'TEXT'),
+    ('height', 'INTEGER'),
+    ('wikidata_id', 'TEXT'),
+    ('full_name', 'TEXT'),
+]
+
+RANKINGS_SCHEMA = [
+    ('ranking_date', 'TEXT'),
+    # Integer forms of ranking_date (e.g. 2024 and 20241230), so year and
+    # date filters are index range scans instead of strftime() on every row
+    ('ranking_year', 'INTEGER'),
+    ('ranking_yyyymmdd', 'INTEGER'),
+    ('rank', 'INTEGER'),
+    ('player', 'INTEGER'),
+    ('points', 'INTEGER'),
+    ('source_file', 'TEXT'),
+    ('player_name', 'TEXT'),
+]
+
+# player_matches holds one row per player per match, seen from that player's
+# side: (column, type, expression for the winner's row, expression for the
+# loser's row). It is filled from the matches table with INSERT ... SELECT.
+# p_* are the player's own serve stats, o_* the opponent's serve stats
+# (i.e. the player's return stats).
+PLAYER_MATCHES_COLUMNS = [
+    ('match_id', 'INTEGER', 'match_id', 'match_id'),
+    ('player_id', 'INTEGER', 'winner_id', 'loser_id'),
+    ('player_name', 'TEXT', 'winner_name', 'loser_name'),
+    ('opponent_id', 'INTEGER', 'loser_id', 'winner_id'),
+    ('opponent_name', 'TEXT', 'loser_name', 'winner_name'),
+    ('is_winner', 'INTEGER', '1', '0'),
+    ('result', 'TEXT', "'W'", "'L'"),
+    ('event_year', 'INTEGER', 'event_year', 'event_year'),
+    ('tourney_date', 'TEXT', 'tourney_date', 'tourney_date'),
+    ('match_num', 'INTEGER', 'match_num', 'match_num'),
+    ('tourney_id', 'TEXT', 'tourney_id', 'tourney_id'),
+    ('tourney_name', 'TEXT', 'tourney_name', 'tourney_name'),
+    ('tourney_level', 'TEXT', 'tourney_level', 'tourney_level'),
+    ('surface', 'TEXT', 'surface', 'surface'),
+    ('round', 'TEXT', 'round', 'round'),
+    ('tour', 'TEXT', 'tour', 'tour'),
+    ('tournament_type', 'TEXT', 'tournament_type', 'tournament_type'),
+    ('best_of', 'INTEGER', 'best_of', 'best_of'),
+    ('score', 'TEXT', 'score', 'score'),
+    ('minutes', 'INTEGER', 'minutes', 'minutes'),
+    ('player_rank', 'INTEGER', 'winner_rank', 'loser_rank'),
+    ('opponent_rank', 'INTEGER', 'loser_rank', 'winner_rank'),
+] + [
+    (f'p_{stat}', 'INTEGER', f'w_{stat}', f'l_{stat}')
+    for stat in ('ace', 'df', 'svpt', '1stIn', '1stWon', '2ndWon', 'SvGms', 'bpSaved', 'bpFaced')
+] + [
+    (f'o_{stat}', 'INTEGER', f'l_{stat}', f'w_{stat}')
+    for stat in ('ace', 'df', 'svpt', '1stIn', '1stWon', '2ndWon', 'SvGms', 'bpSaved', 'bpFaced')
+] + [
+    ('source_file', 'TEXT', 'source_file', 'source_file'),
+]
+
+PLAYER_MATCHES_SCHEMA = [(name, col_type) for name, col_type, _, _ in PLAYER_MATCHES_COLUMNS]
+
+# player_aggregates holds pre-summed per-player counters by year, surface and
+# tournament level: (column, type, aggregate expression over player_matches).
+# Serve counters only sum matches with serve stats (p_svpt > 0) and return
+# counters only matches with opponent serve stats (o_svpt > 0), so ratios of
+# the sums are not skewed by matches without statistics.
+PLAYER_AGGREGATES_KEYS = [
+    ('player_id', 'INTEGER'),
+    ('player_name', 'TEXT'),
+    ('tour', 'TEXT'),
+    ('event_year', 'INTEGER'),
+    ('surface', 'TEXT'),
+    ('tourney_level', 'TEXT'),
+]
+
+PLAYER_AGGREGATES_COUNTERS = [
+    ('matches', 'INTEGER', 'COUNT(*)'),
+    ('wins', 'INTEGER', 'SUM(is_winner)'),
+    ('losses', 'INTEGER', 'SUM(1 - is_winner)'),
+    ('serve_stat_matches', 'INTEGER', 'SUM(p_svpt > 0)'),
+    ('aces', 'INTEGER', 'SUM(CASE WHEN p_svpt > 0 THEN p_ace END)'),
+    ('double_faults', 'INTEGER', 'SUM(CASE WHEN p_svpt > 0 THEN p_df END)'),
+    ('serve_points', 'INTEGER', 'SUM(CASE WHEN p_svpt > 0 THEN p_svpt END)'),
+    ('first_serves_in', 'INTEGER', 'SUM(CASE WHEN p_svpt > 0 THEN p_1stIn END)'),
+    ('first_serve_points_won', 'INTEGER', 'SUM(CASE WHEN p_svpt > 0 THEN p_1stWon END)'),
+    ('second_serve_points_won', 'INTEGER', 'SUM(CASE WHEN p_svpt > 0 THEN p_2ndWon END)'),
+    ('service_games', 'INTEGER', 'SUM(CASE WHEN p_svpt > 0 THEN p_SvGms END)'),
+    ('break_points_saved', 'INTEGER', 'SUM(CASE WHEN p_svpt > 0 THEN p_bpSaved END)'),
+    ('break_points_faced', 'INTEGER', 'SUM(CASE WHEN p_svpt > 0 THEN p_bpFaced END)'),
+    ('return_stat_matches', 'INTEGER', 'SUM(o_svpt > 0)'),
+    ('return_points', 'INTEGER', 'SUM(CASE WHEN o_svpt > 0 THEN o_svpt END)'),
+    ('return_points_won', 'INTEGER', 'SUM(CASE WHEN o_svpt > 0 THEN o_svpt - o_1stWon - o_2ndWon END)'),
+    ('break_point_chances', 'INTEGER', 'SUM(CASE WHEN o_svpt > 0 THEN o_bpFaced END)'),
+    ('break_points_converted', 'INTEGER', 'SUM(CASE WHEN o_svpt > 0 THEN o_bpFaced - o_bpSaved END)'),
+    ('opponent_aces', 'INTEGER', 'SUM(CASE WHEN o_svpt > 0 THEN o_ace END)'),
+]
+
+PLAYER_AGGREGATES_SCHEMA = PLAYER_AGGREGATES_KEYS + [
+    (name, col_type) for name, col_type, _ in PLAYER_AGGREGATES_COUNTERS
+]
+
+# player_names maps normalized names (tennis.player_names.normalize_player_name)
+# to players, so services resolve a name once and then query by integer id.
+# A player has one row per distinct key: players-table name, names used in
+# matches, and aliases (tennis_mapping_dicts.PLAYER_NAME_ALIASES).
+PLAYER_NAMES_SCHEMA = [
+    ('name_key', 'TEXT'),
+    ('tour', 'TEXT'),
+    ('player_id', 'INTEGER'),
+    ('display_name', 'TEXT'),
+    ('name_source', 'TEXT'),
+    ('match_count', 'INTEGER'),
+]
+
+TABLE_SCHEMAS = {
+    'matches': MATCHES_SCHEMA,
+    'player_matches': PLAYER_MATCHES_SCHEMA,
+    'player_aggregates': PLAYER_AGGREGATES_SCHEMA,
+    'player_names': PLAYER_NAMES_SCHEMA,
+    'atp_players': PLAYERS_SCHEMA,
+    'wta_players': PLAYERS_SCHEMA,
+    'atp_rankings': RANKINGS_SCHEMA,
+    'wta_rankings': RANKINGS_SCHEMA,
+}
+
+
+def infer_column_type(series):
+    """
+    Map a pandas column to an SQLite type for columns not declared in a schema.
+
+    Args:
+        series: pandas Series
+
+    Returns:
+        'INTEGER', 'REAL' or 'TEXT'
+    """
+    if pd.api.types.is_bool_dtype(series) or pd.api.types.is_integer_dtype(series):
+        return 'INTEGER'
+    if pd.api.types.is_float_dtype(series):
+        return 'REAL'
+    return 'TEXT'
+
+
+def resolve_columns(table, df):
+    """
+    Resolve the typed column list for writing a DataFrame to a table.
+
+    Declared columns come first in schema order (only those present in the
+    frame, plus primary keys, which SQLite fills in); columns the schema
+    does not know are appended in frame order with a type inferred from
+    their dtype.
+
+    Args:
+        table: Table name
+        df: DataFrame to be written
+
+    Returns:
+        List of (column_name, sqlite_type) tuples
+    """
+    declared = TABLE_SCHEMAS.get(table, [])
+    declared_names = {name for name, _ in declared}
+    columns = [
+        (name, col_type) for name, col_type in declared
+        if name in df.columns or 'PRIMARY KEY' in col_type
+    ]
+    extra = [(name, infer_column_type(df[name])) for name in df.columns if name not in declared_names]
+    if extra and declared:
+        print(f"  Note: {table} has undeclared columns, inferring types: {extra}")
+    return columns + extra
+
+
+def create_table_sql(table, columns):
+    """
+    Build the CREATE TABLE statement for a typed column list.
+
+    Args:
+        table: Table name
+        columns: List of (column_name, sqlite_type) tuples
+
+    Returns:
+        SQL string
+    """
+    column_defs = ',\n    '.join(f'"{name}" {col_type}' for name, col_type in columns)
+    return f'CREATE TABLE "{table}" (\n    {column_defs}\n)'
+
+
+# ============================================================================
+# Index Declarations
+# ============================================================================
+# Built after the bulk insert (see database_builder.build_indexes).
+# Each entry is (index_name, table, indexed columns, partial-index WHERE or None).
+# Name lookups use NOCASE indexes because DatabaseService and the agent prompt
+# compare player and tournament names with COLLATE NOCASE; a BINARY index
+# cannot serve those comparisons.
+
+MATCHES_INDEXES = [
+    # Per-player filters: "winner_name COLLATE NOCASE = ? OR loser_name COLLATE NOCASE = ?"
+    # is answered by a union of these two (multi-index OR), with event_year covered
+    ('idx_matches_winner_name_nocase', 'matches', 'winner_name COLLATE NOCASE, event_year', None),
+    ('idx_matches_loser_name_nocase', 'matches', 'loser_name COLLATE NOCASE, event_year', None),
+    # Covering indexes for opponent lists and head-to-head (exact-case lookups)
+    ('idx_matches_winner_loser', 'matches', 'winner_name, loser_name', None),
+    ('idx_matches_loser_winner', 'matches', 'loser_name, winner_name', None),
+    ('idx_matches_winner_id', 'matches', 'winner_id', None),
+    ('idx_matches_loser_id', 'matches', 'loser_id', None),
+    # Tournament dropdown (DISTINCT tourney_name) and tournament filters
+    ('idx_matches_tourney_name', 'matches', 'tourney_name, event_year', None),
+    ('idx_matches_event_year_surface', 'matches', 'event_year, surface', None),
+    ('idx_matches_surface_year', 'matches', 'surface, event_year', None),
+    # Chronological ordering and keyset paging of filtered match lists; the
+    # expressions match DatabaseService.MATCH_KEY_EXPRESSIONS (NULL-safe keys)
+    ('idx_matches_keyset', 'matches', "COALESCE(tourney_date, ''), COALESCE(match_num, -1), match_id", None),
+    ('idx_matches_tour_level_year', 'matches', 'tour, tourney_level, event_year', None),
+    # "Who won <tournament> in <year>" - only finals, matched case-insensitively
+    ('idx_matches_finals_tourney_nocase', 'matches', 'tourney_name COLLATE NOCASE, event_year, winner_name', "round = 'F'"),
+    # Incremental rebuilds delete rows by source file
+    ('idx_matches_source_file', 'matches', 'source_file', None),
+]
+
+PLAYER_MATCHES_INDEXES = [
+    # Every per-player lookup is a single range scan on the player's name or id
+    ('idx_player_matches_player_nocase', 'player_matches', 'player_name COLLATE NOCASE, event_year', None),
+    ('idx_player_matches_player_opponent_nocase', 'player_matches',
+     'player_name COLLATE NOCASE, opponent_name COLLATE NOCASE', None),
+    ('idx_player_matches_player_id', 'player_matches', 'player_id, event_year', None),
+    ('idx_player_matches_match_id', 'player_matches', 'match_id', None),
+    ('idx_player_matches_source_file', 'player_matches', 'source_file', None),
+]
+
+PLAYER_AGGREGATES_INDEXES = [
+    ('idx_player_aggregates_player_nocase', 'player_aggregates',
+     'player_name COLLATE NOCASE, event_year, surface', None),
+    ('idx_player_aggregates_player_id', 'player_aggregates', 'player_id, event_year', None),
+]
+
+PLAYER_NAMES_INDEXES = [
+    # Name resolution: one range scan on the normalized key
+    ('idx_player_names_key', 'player_names', 'name_key, tour, player_id', None),
+    # Display name and match count of a resolved player (resolve_player_name tool)
+    ('idx_player_names_player', 'player_names', 'player_id, tour', None),
+]
+
+PLAYERS_INDEXES = [
+    (f'idx_{table}_player_id', table, 'player_id', None) for table in ('atp_players', 'wta_players')
+] + [
+    (f'idx_{table}_full_name_nocase', table, 'full_name COLLATE NOCASE, player_id', None)
+    for table in ('atp_players', 'wta_players')
+]
+
+# Rankings published in the last week of December count as year-end rankings
+YEAR_END_RANKING_CONDITION = 'ranking_yyyymmdd % 10000 BETWEEN 1225 AND 1231'
+
+RANKINGS_INDEXES = [
+    # Player ranking timeline, optionally limited to a ranking_yyyymmdd range
+    # (covering: no table lookup for date/rank)
+    (f'idx_{table}_player_date', table, 'player, ranking_yyyymmdd, ranking_date, rank', None)
+    for table in ('atp_rankings', 'wta_rankings')
+] + [
+    # Year-end rankings: used by queries with the same WHERE term
+    (f'idx_{table}_year_end', table, 'ranking_year, points', YEAR_END_RANKING_CONDITION)
+    for table in ('atp_rankings', 'wta_rankings')
+] + [
+    # "Who was ranked N on <date>" and ranking-date scans
+    (f'idx_{table}_date_rank', table, 'ranking_date, rank', None)
+    for table in ('atp_rankings', 'wta_rankings')
+] + [
+    # World number one history
+    (f'idx_{table}_number_one', table, 'ranking_date, player', 'rank = 1')
+    for table in ('atp_rankings', 'wta_rankings')
+] + [
+    (f'idx_{table}_source_file', table, 'source_file', None)
+    for table in ('atp_rankings', 'wta_rankings')
+]
+
+INDEXES = (
+    MATCHES_INDEXES + PLAYER_MATCHES_INDEXES + PLAYER_AGGREGATES_INDEXES
+    + PLAYER_NAMES_INDEXES + PLAYERS_INDEXES + RANKINGS_INDEXES
+)
+
+
+def create_index_sql(index_name, table, columns, where=None):
+    """
+    Build the CREATE INDEX statement for an index declaration.
+
+    Returns:
+        SQL string
+    """
+    sql = f'CREATE INDEX IF NOT EXISTS "{index_name}" ON "{table}" ({columns})'
+    if where:
+        sql += f' WHERE {where}'
+    return sql
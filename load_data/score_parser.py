@@ -0,0 +1,192 @@
+"""
+Vectorized score parsing for tennis match data.
+
+This module splits raw score strings (e.g. "6-4 3-6 7-6(5)", "6-2 3-1 RET",
+"W/O") into set columns and numeric game counts using pandas string/regex
+operations and numpy indexing instead of a per-row Python function.
+"""
+
+import numpy as np
+import pandas as pd
+
+SET_COLUMNS = ['set1', 'set2', 'set3', 'set4', 'set5']
+MAX_SETS = len(SET_COLUMNS)
+
+# Whole-score values that mean the match was not played
+WALKOVER_SCORES = ['W/O', 'WO', 'Walkover']
+DEFAULT_SCORES = ['DEF', 'Default']
+
+# Early-ending markers, checked in this order on the upper-cased score.
+# Each entry: (label, substrings that identify the marker token,
+#              substrings removed (case-sensitive, in order) from the marker token)
+SCORE_MARKERS = [
+    ('W/O', ['W/O', 'WO'], ['W/O', 'WO', 'wo']),
+    ('DEF', ['DEF'], ['DEF', 'DEFAULT', 'def']),
+    ('RET', ['RET'], ['RET', 'ret']),
+]
+
+# A completed or partial set: winner games, loser games, optional tiebreak points
+SET_SCORE_PATTERN = r'^(\d+)-(\d+)(?:\((\d+)\))?$'
+
+
+def _contains_any(series, substrings):
+    """Vectorized 'any(sub in value for sub in substrings)' on a string Series."""
+    mask = pd.Series(False, index=series.index)
+    for sub in substrings:
+        mask |= series.str.contains(sub, regex=False, na=False)
+    return mask
+
+
+def _token_matrix(scores, min_columns):
+    """
+    Split whitespace-separated tokens into an object matrix (None where absent).
+
+    Args:
+        scores: Series of stripped score strings
+        min_columns: Minimum number of columns in the result
+
+    Returns:
+        numpy object array of shape (len(scores), >= min_columns)
+    """
+    if scores.empty:
+        return np.full((0, min_columns), None, dtype=object)
+    tokens = scores.str.split(expand=True)
+    matrix = tokens.to_numpy(dtype=object)
+    matrix = np.where(pd.isna(matrix), None, matrix)
+    if matrix.shape[1] < min_columns:
+        padding = np.full((len(matrix), min_columns - matrix.shape[1]), None, dtype=object)
+        matrix = np.hstack([matrix, padding])
+    return matrix
+
+
+def _apply_marker(out, rows, tokens, label, detect, remove):
+    """
+    Fill result rows for scores that end early (walkover, default, retirement).
+
+    Sets before the first marker token are kept, followed by what is left of
+    the marker token after removing the marker text (if anything), followed
+    by the marker label. Remaining sets stay None.
+    """
+    if not rows.any():
+        return
+    row_idx = np.flatnonzero(rows)
+    marker_tokens = tokens[row_idx]
+
+    # Position of the first token containing the marker (always present: the
+    # marker was found in the whole string and contains no whitespace)
+    is_marker = np.zeros(marker_tokens.shape, dtype=bool)
+    for col in range(marker_tokens.shape[1]):
+        upper = pd.Series(marker_tokens[:, col], dtype=object).str.upper()
+        is_marker[:, col] = _contains_any(upper, detect).to_numpy()
+    first = is_marker.argmax(axis=1)
+
+    # Marker token with the marker text removed
+    cleaned = pd.Series(marker_tokens[np.arange(len(row_idx)), first], dtype=object)
+    for sub in remove:
+        cleaned = cleaned.str.replace(sub, '', regex=False)
+    cleaned = cleaned.str.strip()
+    has_rest = (cleaned != '').to_numpy()
+
+    positions = np.arange(MAX_SETS)
+    block = np.full((len(row_idx), MAX_SETS), None, dtype=object)
+    before = positions[None, :] < first[:, None]
+    block[before] = marker_tokens[:, :MAX_SETS][before]
+
+    rest_rows = np.flatnonzero(has_rest & (first < MAX_SETS))
+    block[rest_rows, first[rest_rows]] = cleaned.to_numpy()[rest_rows]
+
+    label_pos = first + has_rest
+    label_rows = np.flatnonzero(label_pos < MAX_SETS)
+    block[label_rows, label_pos[label_rows]] = label
+
+    out[row_idx] = block
+
+
+def _split_unique_scores(scores):
+    """Split a Series of distinct, non-missing score values into an (n, 5) object array."""
+    n = len(scores)
+    out = np.full((n, MAX_SETS), None, dtype=object)
+
+    empty = scores == ''
+    stripped = scores.astype(str).str.strip().astype(object)
+    upper = stripped.str.upper()
+
+    walkover = ~empty & stripped.isin(WALKOVER_SCORES)
+    default = ~empty & ~walkover & stripped.isin(DEFAULT_SCORES)
+    out[walkover.to_numpy(), 0] = 'W/O'
+    out[default.to_numpy(), 0] = 'DEF'
+
+    tokens = _token_matrix(stripped, MAX_SETS)
+    remaining = ~empty & ~walkover & ~default
+    for label, detect, remove in SCORE_MARKERS:
+        rows = remaining & _contains_any(upper, detect)
+        _apply_marker(out, rows.to_numpy(), tokens, label, detect, remove)
+        remaining &= ~rows
+
+    normal = remaining.to_numpy()
+    out[normal] = tokens[normal, :MAX_SETS]
+    return out
+
+
+def split_score_sets(scores):
+    """
+    Split score strings into five set columns.
+
+    Semantics:
+    - Missing or empty score: all sets None
+    - 'W/O', 'WO', 'Walkover': set1 = 'W/O'; 'DEF', 'Default': set1 = 'DEF'
+    - Scores containing W/O, DEF or RET (checked in that order): the sets
+      played before the marker, then 'W/O'/'DEF'/'RET' in the next set only
+    - Anything else: the first five whitespace-separated tokens
+
+    Args:
+        scores: Series of raw score values
+
+    Returns:
+        DataFrame with columns set1..set5 (object dtype, None where empty),
+        indexed like scores
+    """
+    # Scores repeat heavily (1.7M matches, far fewer distinct strings), so
+    # parse each distinct value once and broadcast back with the codes
+    codes, uniques = pd.factorize(scores, use_na_sentinel=True)
+    parsed = _split_unique_scores(pd.Series(uniques, dtype=object))
+    # Row -1 (missing score) maps to an all-None row appended at the end
+    parsed = np.vstack([parsed, np.full((1, MAX_SETS), None, dtype=object)])
+    out = parsed[codes]
+
+    return pd.DataFrame(out, columns=SET_COLUMNS, index=scores.index, dtype=object)
+
+
+def parse_set_games(sets):
+    """
+    Extract numeric games and tiebreak points from set columns.
+
+    Only regular set scores ("6-4", "7-6(5)") are parsed; markers such as
+    'RET' or 'W/O' and unusual tokens give missing values.
+
+    Args:
+        sets: DataFrame with set1..set5 columns (from split_score_sets)
+
+    Returns:
+        DataFrame with setN_w_games, setN_l_games, setN_tiebreak (nullable
+        Int32) for each set and total_games (sum of parsed games, missing if
+        no set could be parsed)
+    """
+    result = {}
+    total_games = np.zeros(len(sets), dtype=np.int64)
+    any_games = np.zeros(len(sets), dtype=bool)
+    for col in SET_COLUMNS:
+        # Parse each distinct set string once, then broadcast with the codes
+        codes, uniques = pd.factorize(sets[col], use_na_sentinel=True)
+        parts = pd.Series(uniques, dtype=object).str.extract(SET_SCORE_PATTERN)
+        numbers = parts.apply(pd.to_numeric).to_numpy(dtype=float)
+        numbers = np.vstack([numbers.reshape(-1, 3), np.full((1, 3), np.nan)])[codes]
+        w_games, l_games, tiebreak = numbers[:, 0], numbers[:, 1], numbers[:, 2]
+        result[f'{col}_w_games'] = pd.array(w_games, dtype='Int32')
+        result[f'{col}_l_games'] = pd.array(l_games, dtype='Int32')
+        result[f'{col}_tiebreak'] = pd.array(tiebreak, dtype='Int32')
+        parsed = ~np.isnan(w_games)
+        total_games[parsed] += (w_games[parsed] + l_games[parsed]).astype(np.int64)
+        any_games |= parsed
+    result['total_games'] = pd.array(np.where(any_games, total_games, np.nan), dtype='Int32')
+    return pd.DataFrame(result, index=sets.index)
@@ -0,0 +1,190 @@
+"""
+Columnar staging cache for the source CSVs.
+
+The historical source files (rankings decades, yearly match files) never
+change, yet every build parsed them again. This module keeps a typed Arrow
+(Feather) copy of each parsed CSV in STAGING_DIR, next to a small JSON
+fingerprint of the source (size, mtime, content hash) and of the read
+options used. Later runs memory-map the Arrow file and convert it to a
+DataFrame instead of parsing the CSV (the conversion copies the data once,
+but skips tokenizing and type inference), and fall back to the CSV only
+when the source or the read options changed.
+
+pyarrow is optional: without it every file is read from CSV as before.
+"""
+
+import json
+import os
+
+try:
+    import pyarrow.feather as feather
+except ImportError:
+    feather = None
+
+from .config import USE_STAGING_CACHE, STAGING_DIR
+from .manifest import source_key, hash_file
+
+# Bump when the staged layout changes so older staged files are rebuilt
+STAGING_FORMAT_VERSION = 1
+
+
+def staging_enabled():
+    """Return True if staged files can be read and written."""
+    return USE_STAGING_CACHE and feather is not None
+
+
+def staged_paths(file_path):
+    """
+    Return the (data, fingerprint) paths of a source file's staged copy.
+
+    Args:
+        file_path: Path to the source CSV
+
+    Returns:
+        Tuple of (arrow_path, fingerprint_path) inside STAGING_DIR
+    """
+    base = os.path.join(STAGING_DIR, source_key(file_path).replace("/", "__"))
+    return base + ".arrow", base + ".json"
+
+
+def _read_options_key(read_kwargs):
+    """Stable text form of the read_csv options (dtype plan included)."""
+    return repr(sorted((key, repr(value)) for key, value in (read_kwargs or {}).items()))
+
+
+def _is_current(file_path, fingerprint, read_kwargs):
+    """
+    Check a stored fingerprint against the source file and read options.
+
+    A matching size and mtime is enough; otherwise the content hash decides,
+    so a file that was merely touched keeps its staged copy.
+
+    Returns:
+        Tuple of (current, touched): touched is True if the copy is current
+        but the stored mtime is outdated
+    """
+    if fingerprint.get("format_version") != STAGING_FORMAT_VERSION:
+        return False, False
+    if fingerprint.get("read_options") != _read_options_key(read_kwargs):
+        return False, False
+    stat = os.stat(file_path)
+    if stat.st_size != fingerprint.get("size"):
+        return False, False
+    if stat.st_mtime == fingerprint.get("mtime"):
+        return True, False
+    current = hash_file(file_path) == fingerprint.get("content_hash")
+    return current, current
+
+
+def _write_fingerprint(fingerprint_path, fingerprint):
+    """Write a fingerprint JSON via a process-specific temp file and an atomic rename."""
+    tmp_path = fingerprint_path + f".tmp{os.getpid()}"
+    with open(tmp_path, "w") as f:
+        json.dump(fingerprint, f)
+    os.replace(tmp_path, fingerprint_path)
+
+
+def _open_staged_table(file_path, read_kwargs):
+    """
+    Memory-map the staged Arrow table of a source CSV if it is still current.
+
+    Returns:
+        pyarrow Table, or None if there is no current staged copy
+    """
+    if not staging_enabled():
+        return None
+    arrow_path, fingerprint_path = staged_paths(file_path)
+    if not (os.path.exists(arrow_path) and os.path.exists(fingerprint_path)):
+        return None
+    try:
+        with open(fingerprint_path) as f:
+            fingerprint = json.load(f)
+        current, touched = _is_current(file_path, fingerprint, read_kwargs)
+        if not current:
+            return None
+        if touched:
+            # Store the new mtime so later runs skip hashing the file again
+            fingerprint["mtime"] = os.stat(file_path).st_mtime
+            _write_fingerprint(fingerprint_path, fingerprint)
+        # Uncompressed Arrow files are memory-mapped rather than read into buffers
+        return feather.read_table(arrow_path, memory_map=True)
+    except Exception as e:
+        print(f"  Note: ignoring staged copy of {os.path.basename(file_path)} ({e})")
+        return None
+
+
+def read_staged(file_path, read_kwargs=None):
+    """
+    Load the staged copy of a source CSV if it is still current.
+
+    The Arrow file is memory-mapped; converting it to a DataFrame copies the
+    columns into pandas memory.
+
+    Args:
+        file_path: Path to the source CSV
+        read_kwargs: read_csv options the staged copy must have been parsed with
+
+    Returns:
+        DataFrame, or None if there is no current staged copy
+    """
+    table = _open_staged_table(file_path, read_kwargs)
+    return None if table is None else table.to_pandas()
+
+
+def iter_staged_chunks(file_path, chunk_size, read_kwargs=None):
+    """
+    Stream the staged copy of a source CSV in chunks, if it is still current.
+
+    The Arrow file is memory-mapped and converted one record batch at a time,
+    so only one chunk is materialized as a DataFrame at once.
+
+    Args:
+        file_path: Path to the source CSV
+        chunk_size: Maximum rows per chunk
+        read_kwargs: read_csv options the staged copy must have been parsed with
+
+    Returns:
+        Iterator of DataFrames, or None if there is no current staged copy
+    """
+    table = _open_staged_table(file_path, read_kwargs)
+    if table is None:
+        return None
+    return (batch.to_pandas() for batch in table.to_batches(max_chunksize=chunk_size))
+
+
+def write_staged(file_path, df, read_kwargs=None):
+    """
+    Store a parsed source CSV as an Arrow file with its fingerprint.
+
+    The fingerprint is written last (both via atomic renames), so an
+    interrupted write never leaves a staged copy that looks current.
+    Frames Arrow cannot store (e.g. mixed-type object columns) are skipped.
+
+    Args:
+        file_path: Path to the source CSV
+        df: DataFrame parsed from it (before any loader columns are added)
+        read_kwargs: read_csv options it was parsed with
+    """
+    if not staging_enabled():
+        return
+    arrow_path, fingerprint_path = staged_paths(file_path)
+    stat = os.stat(file_path)
+    fingerprint = {
+        "format_version": STAGING_FORMAT_VERSION,
+        "path": source_key(file_path),
+        "size": stat.st_size,
+        "mtime": stat.st_mtime,
+        "content_hash": hash_file(file_path),
+        "read_options": _read_options_key(read_kwargs),
+        "rows": len(df),
+    }
+    try:
+        os.makedirs(STAGING_DIR, exist_ok=True)
+        # A process-specific temp name keeps concurrent loader workers apart
+        tmp_suffix = f".tmp{os.getpid()}"
+        feather.write_feather(df, arrow_path + tmp_suffix, compression="uncompressed")
+        os.replace(arrow_path + tmp_suffix, arrow_path)
+        _write_fingerprint(fingerprint_path, fingerprint)
+    except Exception as e:
+        print(f"  Note: could not stage {os.path.basename(file_path)} ({e})")
+
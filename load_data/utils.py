@@ -2,12 +2,19 @@
 Utility classes and functions for data loading.
 
 This module contains utility classes like ProgressTracker for tracking
-loading progress with time estimates.
+loading progress with time estimates, and peak memory reporting for build stages.
 """
 
+import sys
 import time
 from datetime import timedelta
 
+try:
+    import resource
+except ImportError:
+    # Not available on Windows: memory reporting is skipped
+    resource = None
+
 
 class ProgressTracker:
     """Track and display loading progress with time estimates."""
@@ -50,3 +57,45 @@ class ProgressTracker:
         total_time = time.time() - self.start_time
         print(f"\n✅ {self.step_name} completed in {str(timedelta(seconds=int(total_time)))} | {message}")
 
+
+def get_peak_rss_mb(children=False):
+    """
+    Peak resident set size of the current process so far, in MB.
+    
+    Args:
+        children: Report the largest peak of the finished child processes
+            (the ProcessPoolExecutor workers that parse the CSVs) instead
+    
+    Returns:
+        Peak RSS in MB, or None where the resource module is unavailable
+    """
+    if resource is None:
+        return None
+    who = resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF
+    peak = resource.getrusage(who).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in kilobytes on Linux
+    if sys.platform == 'darwin':
+        return peak / (1024 * 1024)
+    return peak / 1024
+
+
+def report_peak_rss(stage):
+    """
+    Print the peak RSS of the build and its loader workers after a stage.
+    
+    The peak only grows, so the stage that raised it is the one to look at
+    when the build does not fit in memory. Workers count once they have
+    exited (the loader pool is shut down after each read), and the figure
+    is the largest single worker, not the sum of all of them.
+    
+    Args:
+        stage: Name of the stage that just finished
+    """
+    peak_mb = get_peak_rss_mb()
+    if peak_mb is None:
+        return
+    message = f"  [memory] {stage}: peak RSS {peak_mb:,.0f} MB (main process)"
+    worker_peak_mb = get_peak_rss_mb(children=True)
+    if worker_peak_mb:
+        message += f", {worker_peak_mb:,.0f} MB (largest loader worker)"
+    print(message)
@@ -11,6 +11,7 @@ from .return_stats import (
     calculate_match_return_stats,
     calculate_aggregated_player_return_stats,
     calculate_aggregated_opponent_return_stats,
+    calculate_return_stats_from_totals,
     build_year_suffix
 )
 
@@ -18,6 +19,7 @@ __all__ = [
     'calculate_match_return_stats',
     'calculate_aggregated_player_return_stats',
     'calculate_aggregated_opponent_return_stats',
+    'calculate_return_stats_from_totals',
     'build_year_suffix'
 ]
 
@@ -46,7 +46,8 @@ def _build_chart_title_suffixes(year, opponent=None, tournament=None, surfaces=N
     return year_suffix, filter_suffix
 
 
-def create_combined_return_charts(player_name, df, year=None, opponent=None, tournament=None, surfaces=None):
+def create_combined_return_charts(player_name, df, year=None, opponent=None, tournament=None, surfaces=None,
+                                  player_stats=None):
     """
     Create return charts (return points timeline, break point conversion timeline, and radar) for a player.
     
@@ -58,6 +59,8 @@ def create_combined_return_charts(player_name, df, year=None, opponent=None, tou
         opponent: Optional opponent name for chart title
         tournament: Optional tournament name for chart title
         surfaces: Optional list of surfaces for chart title
+        player_stats: Optional precomputed aggregate return stats for the radar chart
+                      (e.g. from calculate_return_stats_from_totals); computed from df if None
         
     Returns:
         tuple: (return_points_timeline_fig, bp_conversion_timeline_fig, radar_fig) - Three Plotly figures ready for display
@@ -70,7 +73,7 @@ def create_combined_return_charts(player_name, df, year=None, opponent=None, tou
     
     # Calculate return statistics
     matches_with_stats = calculate_match_return_stats(df)
-    return_stats = calculate_aggregated_player_return_stats(matches_with_stats)
+    return_stats = player_stats if player_stats is not None else calculate_aggregated_player_return_stats(matches_with_stats)
     
     # Determine if comparison mode should be enabled (specific opponent selected)
     show_comparison = opponent and opponent != "All Opponents"
@@ -276,6 +276,31 @@ def calculate_aggregated_player_return_stats(df, player_name=None, case_sensitiv
     return stats
 
 
+def calculate_return_stats_from_totals(totals):
+    """
+    Calculate player return statistics from pre-summed counters.
+    
+    Uses the counters returned by DatabaseService.get_player_aggregates() (built
+    at load time in the player_aggregates table), so no match rows are needed.
+    Percentages are ratios of the summed counters.
+    
+    Args:
+        totals: Dictionary of summed counters (return_points, return_points_won, ...)
+        
+    Returns:
+        dict: Same keys as calculate_aggregated_player_return_stats(), or None if
+              the totals contain no return statistics
+    """
+    if not totals or not totals.get('return_points'):
+        return None
+    
+    chances = totals['break_point_chances']
+    return {
+        'Return Points Won %': totals['return_points_won'] / totals['return_points'] * 100,
+        'Break Point Conversion %': totals['break_points_converted'] / chances * 100 if chances else np.nan
+    }
+
+
 def calculate_aggregated_opponent_return_stats(df, opponent_name=None):
     """
     Calculate aggregated opponent return statistics across all matches.
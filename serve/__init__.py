@@ -11,6 +11,7 @@ from .serve_stats import (
     calculate_match_serve_stats,
     calculate_aggregated_player_serve_stats,
     calculate_aggregated_opponent_serve_stats,
+    calculate_serve_stats_from_totals,
     build_year_suffix
 )
 
@@ -18,6 +19,7 @@ __all__ = [
     'calculate_match_serve_stats',
     'calculate_aggregated_player_serve_stats',
     'calculate_aggregated_opponent_serve_stats',
+    'calculate_serve_stats_from_totals',
     'build_year_suffix'
 ]
 
@@ -47,7 +47,8 @@ def _build_chart_title_suffixes(year, opponent=None, tournament=None, surfaces=N
     return year_suffix, filter_suffix
 
 
-def create_combined_serve_charts(player_name, df, year=None, opponent=None, tournament=None, surfaces=None):
+def create_combined_serve_charts(player_name, df, year=None, opponent=None, tournament=None, surfaces=None,
+                                 player_stats=None):
     """
     Create serve charts (timeline, ace/DF timeline, break point timeline, and radar) for a player.
     
@@ -59,6 +60,8 @@ def create_combined_serve_charts(player_name, df, year=None, opponent=None, tour
         opponent: Optional opponent name for chart title
         tournament: Optional tournament name for chart title
         surfaces: Optional list of surfaces for chart title
+        player_stats: Optional precomputed aggregate serve stats for the radar chart
+                      (e.g. from calculate_serve_stats_from_totals); computed from df if None
         
     Returns:
         tuple: (timeline_fig, ace_df_timeline_fig, bp_timeline_fig, radar_fig) - Four Plotly figures ready for display
@@ -72,7 +75,7 @@ def create_combined_serve_charts(player_name, df, year=None, opponent=None, tour
     
     # Calculate serve statistics
     matches_with_stats = calculate_match_serve_stats(df)
-    serve_stats = calculate_aggregated_player_serve_stats(matches_with_stats)
+    serve_stats = player_stats if player_stats is not None else calculate_aggregated_player_serve_stats(matches_with_stats)
     
     # Determine if comparison mode should be enabled (specific opponent selected)
     show_comparison = opponent and opponent != "All Opponents"
@@ -254,6 +254,38 @@ def calculate_aggregated_player_serve_stats(df, player_name=None, case_sensitive
     return stats
 
 
+def calculate_serve_stats_from_totals(totals):
+    """
+    Calculate player serve statistics from pre-summed counters.
+    
+    Uses the counters returned by DatabaseService.get_player_aggregates() (built
+    at load time in the player_aggregates table), so no match rows are needed.
+    Percentages are ratios of the summed counters.
+    
+    Args:
+        totals: Dictionary of summed counters (serve_points, first_serves_in, ...)
+        
+    Returns:
+        dict: Same keys as calculate_aggregated_player_serve_stats(), or None if
+              the totals contain no serve statistics
+    """
+    if not totals or not totals.get('serve_points'):
+        return None
+    
+    def pct(numerator, denominator):
+        return numerator / denominator * 100 if denominator else np.nan
+    
+    serve_points = totals['serve_points']
+    first_in = totals['first_serves_in']
+    return {
+        '1st Serve %': pct(first_in, serve_points),
+        '1st Serve Won %': pct(totals['first_serve_points_won'], first_in),
+        '2nd Serve Won %': pct(totals['second_serve_points_won'], serve_points - first_in),
+        'Ace Rate': pct(totals['aces'], serve_points),
+        'Double Fault Rate': pct(totals['double_faults'], serve_points)
+    }
+
+
 def calculate_aggregated_opponent_serve_stats(df, opponent_name=None):
     """
     Calculate aggregated opponent serve statistics across all matches.
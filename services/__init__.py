@@ -1,5 +1,12 @@
 """
 Services package for enhanced UI functionality
+
+- database_service: cached database queries for the UI
+- player_search: in-memory player name autocomplete
+- connection_pool: shared read-only SQLite connections
+- query_cache: process-wide query result cache
+- answer_cache: normalized-question cache of agent answers
+- sql_result_cache: canonical-SQL cache of sql_db_query results
 """
 
 from .database_service import DatabaseService
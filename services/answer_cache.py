@@ -0,0 +1,212 @@
+"""
+Answer cache in front of the LangGraph agent.
+
+Every question used to go through the agent: schema lookup, query check,
+query and final answer, each a Gemini round trip. Questions are now
+normalized (case, accents, punctuation, filler words, and tennis synonyms
+from tennis_mapping_dicts, so "Who won the French Open in 2019?" and
+"who won roland garros 2019" share a key). The final SQL, its result rows,
+the answer and the summary are cached under that key. A hit needs no LLM call.
+
+Only context-free answers are cached: the question must be the first one
+in its conversation and must not refer back to earlier turns ("what about
+2018?", "how many did he win"). Entries live in a QueryCache, so they are
+dropped when the database build fingerprint changes.
+"""
+
+import re
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from langchain_core.messages import AIMessage, ToolMessage
+
+from constants import ANSWER_CACHE_MAX_ENTRIES, DEFAULT_DB_PATH
+from services.query_cache import QueryCache, get_query_cache
+from tennis.player_names import normalize_player_name
+from tennis.tennis_mapping_dicts import (
+    PLAYER_NAME_ALIASES, GRAND_SLAM_MAPPINGS, SURFACE_MAPPINGS, ROUND_MAPPINGS
+)
+
+# Mapping keys that are also everyday words, so mapping them could merge
+# different questions ("french players" is not "roland garros players")
+AMBIGUOUS_TERMS = {
+    "us", "french", "aus", "australian", "winner", "champion", "group", "semi",
+    "quarter", "quarters", "qualifier", "dirt", "synthetic", "artificial",
+    "slow court", "fast court", "quick court", "very fast court", "bronze",
+}
+# Words whose presence does not change what is asked
+FILLER_WORDS = {"the", "a", "an", "in", "of", "please"}
+# Words that make a question depend on the conversation or on today's date
+FOLLOW_UP_TERMS = {
+    "he", "she", "him", "her", "his", "hers", "they", "them", "their", "it", "its",
+    "that", "this", "those", "these", "same", "also", "again", "else", "previous",
+    "above", "today", "yesterday", "now", "current", "currently",
+}
+FOLLOW_UP_PHRASES = ("what about", "how about", "last year", "next year")
+
+_NON_WORD = re.compile(r"[^\w\s]")
+_YEAR = re.compile(r"\b(?:18|19|20)\d{2}\b")
+
+
+def _build_synonyms() -> Tuple[Dict[Tuple[str, ...], str], set]:
+    """Normalized term (as a word tuple) -> canonical term, plus the canonical player names."""
+    synonyms = {}
+    players = set()
+    for mapping, is_player in ((SURFACE_MAPPINGS, False), (ROUND_MAPPINGS, False),
+                               (GRAND_SLAM_MAPPINGS, False), (PLAYER_NAME_ALIASES, True)):
+        for term, canonical in mapping.items():
+            term_key = normalize_player_name(term)
+            if term_key in AMBIGUOUS_TERMS:
+                continue
+            canonical_key = normalize_player_name(canonical)
+            synonyms[tuple(term_key.split())] = canonical_key
+            # A canonical name maps to itself, so its words are not mapped again
+            synonyms[tuple(canonical_key.split())] = canonical_key
+            if is_player:
+                players.add(canonical_key)
+    return synonyms, players
+
+
+_SYNONYMS, _PLAYERS = _build_synonyms()
+_MAX_TERM_WORDS = max(len(term) for term in _SYNONYMS)
+
+
+def normalize_question(question: str) -> Tuple[str, Dict[str, List]]:
+    """
+    Normalize a question into a cache key and extract its entities.
+
+    Args:
+        question: Question as typed
+
+    Returns:
+        Tuple of (key, entities); entities has "years" and "players"
+    """
+    words = _NON_WORD.sub(" ", normalize_player_name(question)).split()
+    mapped = []
+    players = []
+    i = 0
+    while i < len(words):
+        # Longest known term starting at this word wins
+        for size in range(min(_MAX_TERM_WORDS, len(words) - i), 0, -1):
+            canonical = _SYNONYMS.get(tuple(words[i:i + size]))
+            if canonical is not None:
+                mapped.append(canonical)
+                if canonical in _PLAYERS:
+                    players.append(canonical)
+                i += size
+                break
+        else:
+            mapped.append(words[i])
+            i += 1
+    key = " ".join(word for word in " ".join(mapped).split() if word not in FILLER_WORDS)
+    return key, {"years": sorted(set(_YEAR.findall(key))), "players": sorted(set(players))}
+
+
+def is_context_free(question: str) -> bool:
+    """Return True if a question can be answered without the earlier conversation."""
+    text = " ".join(_NON_WORD.sub(" ", normalize_player_name(question)).split())
+    if any(phrase in text for phrase in FOLLOW_UP_PHRASES):
+        return False
+    return not FOLLOW_UP_TERMS.intersection(text.split())
+
+
+def extract_final_query(messages: List[Any]) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Find the last sql_db_query call of a run and the rows it returned.
+
+    Args:
+        messages: Messages of the agent run
+
+    Returns:
+        Tuple of (SQL, result rows as returned by the tool), None where absent
+    """
+    for index in range(len(messages) - 1, -1, -1):
+        message = messages[index]
+        if isinstance(message, AIMessage) and message.tool_calls:
+            for position, tool_call in enumerate(message.tool_calls):
+                if tool_call.get("name") == "sql_db_query":
+                    # The tool node answers each call with a ToolMessage carrying its id
+                    rows = next((m.content for m in messages[index + 1:]
+                                 if isinstance(m, ToolMessage) and tool_call.get("id")
+                                 and m.tool_call_id == tool_call.get("id")), None)
+                    # Calls without an id are answered in call order
+                    if rows is None and index + 1 + position < len(messages):
+                        rows = messages[index + 1 + position].content
+                    return tool_call.get("args", {}).get("query"), rows
+    return None, None
+
+
+class AnswerCache:
+    """Normalized-question cache of final agent answers."""
+
+    def __init__(self, db_path: str = DEFAULT_DB_PATH, cache: Optional[QueryCache] = None):
+        """
+        Create the cache.
+
+        Args:
+            db_path: Database the answers come from (SQLAlchemy URI or file path);
+                     its build fingerprint invalidates the cache
+            cache: Store for the answers; defaults to the process-wide
+                   "answer_cache" shared by all sessions
+        """
+        if db_path.startswith("sqlite:///"):
+            db_path = db_path.replace("sqlite:///", "")
+        elif db_path.startswith("sqlite://"):
+            db_path = db_path.replace("sqlite://", "")
+        self.db_path = db_path
+        self.cache = cache or get_query_cache("answer_cache", ANSWER_CACHE_MAX_ENTRIES)
+
+    def lookup(self, question: str) -> Optional[Dict[str, Any]]:
+        """
+        Find a cached answer.
+
+        Args:
+            question: Question as typed
+
+        Returns:
+            Entry with question, key, entities, sql, rows, answer, summary and
+            created_at, or None
+        """
+        if not is_context_free(question):
+            return None
+        key, _ = normalize_question(question)
+        return self.cache.get(self.db_path, key) if key else None
+
+    def store(self, question: str, messages: List[Any], answer: str,
+              summary: Optional[str] = None) -> bool:
+        """
+        Cache the answer of a context-free question.
+
+        Args:
+            question: Question as typed
+            messages: Messages of the agent run (for the final SQL and rows)
+            answer: Final answer shown to the user
+            summary: One-line summary shown with it, if any
+
+        Returns:
+            True if the answer was cached
+        """
+        if not answer or not answer.strip() or not is_context_free(question):
+            return False
+        key, entities = normalize_question(question)
+        if not key:
+            return False
+        sql, rows = extract_final_query(messages)
+        self.cache.put(self.db_path, key, {
+            "question": question,
+            "key": key,
+            "entities": entities,
+            "sql": sql,
+            "rows": rows,
+            "answer": answer,
+            "summary": summary,
+            "created_at": datetime.now().isoformat(),
+        })
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters of the cache."""
+        return self.cache.stats()
+
+
+__all__ = ['AnswerCache', 'normalize_question', 'is_context_free', 'extract_final_query']
@@ -0,0 +1,216 @@
+"""
+Read-only SQLite connection pool for the UI services.
+
+DatabaseService used to open a new connection for every query, so one
+filter-panel render paid connection setup (and a cold page cache) several
+times. The pool keeps a few read-only connections open and shares them
+across Streamlit sessions and threads:
+
+- opened with mode=ro and PRAGMA query_only, so the UI can never write
+- mmap_size and cache_size tuned for the read-heavy filter queries
+- a per-connection statement cache, so repeated queries skip re-preparing
+
+If the database file is replaced (a different inode, e.g. copied over
+after a rebuild), idle connections are reopened against the new file.
+Capacity is guarded by a condition variable, so a thread waiting for a
+connection wakes up on a return and also when a slot frees up because a
+stale connection was closed.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+# Connections kept per database file
+DEFAULT_POOL_SIZE = 4
+# Seconds to wait for a free connection before giving up
+DEFAULT_CHECKOUT_TIMEOUT = 10.0
+# Bytes of the database file SQLite may memory-map
+MMAP_SIZE = 256 * 1024 * 1024
+# Page cache per connection, in KiB (negative cache_size means KiB, not pages)
+CACHE_SIZE_KIB = 64 * 1024
+# Prepared statements kept per connection (sqlite3 default is 128)
+CACHED_STATEMENTS = 256
+
+
+def _file_identity(db_path: str):
+    """(device, inode) of the database file, or None if it does not exist."""
+    try:
+        stat = os.stat(db_path)
+    except OSError:
+        return None
+    return stat.st_dev, stat.st_ino
+
+
+class SQLiteConnectionPool:
+    """Thread-safe pool of read-only SQLite connections to one database file."""
+
+    def __init__(self, db_path: str, pool_size: int = DEFAULT_POOL_SIZE,
+                 checkout_timeout: float = DEFAULT_CHECKOUT_TIMEOUT):
+        """
+        Create an empty pool; connections are opened on first use.
+
+        Args:
+            db_path: Path to the SQLite database file
+            pool_size: Maximum number of open connections
+            checkout_timeout: Seconds to wait for a free connection
+        """
+        self.db_path = db_path
+        self.pool_size = pool_size
+        self.checkout_timeout = checkout_timeout
+        self._idle = []  # (connection, identity); most recently used last (warmest cache)
+        self._lock = threading.Lock()
+        # Notified whenever a connection is returned or a slot is freed
+        self._available = threading.Condition(self._lock)
+        self._open = 0
+        self._identity = _file_identity(db_path)
+        self._checkouts = 0
+        self._wait_seconds = 0.0
+        self._max_wait_seconds = 0.0
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open one read-only connection with the read pragmas applied."""
+        uri = f"file:{os.path.abspath(self.db_path)}?mode=ro"
+        conn = sqlite3.connect(uri, uri=True, check_same_thread=False,
+                               cached_statements=CACHED_STATEMENTS)
+        conn.execute("PRAGMA query_only = ON")
+        conn.execute(f"PRAGMA mmap_size = {MMAP_SIZE}")
+        conn.execute(f"PRAGMA cache_size = -{CACHE_SIZE_KIB}")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        return conn
+
+    def _free_slot(self):
+        """Give back the slot of a closed (or never opened) connection and wake a waiter."""
+        with self._available:
+            self._open -= 1
+            self._available.notify()
+
+    def _discard(self, conn: sqlite3.Connection):
+        """Close a connection and free its slot."""
+        try:
+            conn.close()
+        finally:
+            self._free_slot()
+
+    def _drop_stale(self):
+        """Close idle connections if the database file was replaced."""
+        identity = _file_identity(self.db_path)
+        with self._lock:
+            if identity == self._identity:
+                return
+            self._identity = identity
+            stale, self._idle = self._idle, []
+        for conn, _ in stale:
+            self._discard(conn)
+
+    def _acquire(self):
+        """Take an idle connection, open a new one, or wait for a free slot."""
+        self._drop_stale()
+        deadline = time.monotonic() + self.checkout_timeout
+        with self._available:
+            while True:
+                if self._idle:
+                    return self._idle.pop()
+                if self._open < self.pool_size:
+                    self._open += 1
+                    identity = self._identity
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(
+                        f"No database connection free after {self.checkout_timeout}s "
+                        f"({self.pool_size} in use)"
+                    )
+                self._available.wait(remaining)
+        try:
+            return self._connect(), identity
+        except Exception:
+            self._free_slot()
+            raise
+
+    @contextmanager
+    def connection(self):
+        """
+        Check out a connection for the duration of a with block.
+
+        Yields:
+            Read-only sqlite3.Connection (returned to the pool afterwards)
+
+        Raises:
+            sqlite3.OperationalError: If the database file cannot be opened
+            TimeoutError: If no connection frees up within checkout_timeout
+        """
+        start = time.perf_counter()
+        conn, identity = self._acquire()
+        waited = time.perf_counter() - start
+        with self._lock:
+            self._checkouts += 1
+            self._wait_seconds += waited
+            self._max_wait_seconds = max(self._max_wait_seconds, waited)
+        try:
+            yield conn
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+            with self._available:
+                current = identity == self._identity
+                if current:
+                    self._idle.append((conn, identity))
+                    self._available.notify()
+            if not current:
+                self._discard(conn)
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Usage counters of the pool.
+
+        Returns:
+            Dict with checkouts, total and max wait seconds, open and idle connections
+        """
+        with self._lock:
+            return {
+                "checkouts": self._checkouts,
+                "wait_seconds": round(self._wait_seconds, 6),
+                "max_wait_seconds": round(self._max_wait_seconds, 6),
+                "open_connections": self._open,
+                "idle_connections": len(self._idle),
+                "pool_size": self.pool_size,
+            }
+
+    def close(self):
+        """Close all idle connections (checked-out ones close on return)."""
+        with self._lock:
+            self._identity = object()  # Nothing matches: returned connections are discarded
+            idle, self._idle = self._idle, []
+        for conn, _ in idle:
+            self._discard(conn)
+
+
+_pools: Dict[str, SQLiteConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_connection_pool(db_path: str, pool_size: Optional[int] = None) -> SQLiteConnectionPool:
+    """
+    Return the process-wide pool for a database file, creating it on first use.
+
+    Args:
+        db_path: Path to the SQLite database file
+        pool_size: Maximum open connections (only used when the pool is created)
+
+    Returns:
+        SQLiteConnectionPool shared by every caller using the same file
+    """
+    key = os.path.abspath(db_path)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = SQLiteConnectionPool(db_path, pool_size or DEFAULT_POOL_SIZE)
+            _pools[key] = pool
+        return pool
+
+
+__all__ = ['SQLiteConnectionPool', 'get_connection_pool']
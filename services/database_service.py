@@ -5,9 +5,14 @@ Provides dynamic data for dropdowns and analysis
 
 import sqlite3
 import pandas as pd
-from typing import List, Optional, Union, Tuple
+from typing import Iterator, List, Optional, Union, Tuple
 import streamlit as st
-from constants import DEFAULT_DB_PATH
+from constants import DEFAULT_DB_PATH, PLAYER_SEARCH_INDEX_CACHE_ENTRIES
+from utils.df_utils import compact_dtypes
+from tennis.player_names import resolve_player_ids, player_id_condition
+from services.player_search import PlayerSearchIndex
+from services.connection_pool import get_connection_pool
+from services.query_cache import QueryCache, get_query_cache, cached_query, skip_caching
 
 class DatabaseService:
     """Service for database operations in enhanced UI."""
@@ -22,9 +27,25 @@ class DatabaseService:
     MIN_YEAR = 1900
     MAX_YEAR = 2100
     DEFAULT_QUERY_LIMIT = 5000
+    # Matches per page in the Matches tab and per streamed chunk
+    MATCH_PAGE_SIZE = 500
+    # Rows per keyset page when a full result is read at once
+    MATCH_CHUNK_SIZE = 20000
+    # Keyset columns added to every page query (removed from the results)
+    MATCH_KEY_COLUMNS = ('_key_date', '_key_num', '_key_id')
+    # Their expressions: a NULL date or match number would make the row
+    # comparison NULL and end the paging early, so NULLs sort first as ''/-1
+    # (served by the idx_matches_keyset expression index)
+    MATCH_KEY_EXPRESSIONS = ("COALESCE(m.tourney_date, '')", "COALESCE(m.match_num, -1)", "m.match_id")
     
-    def __init__(self, db_path: Optional[str] = None):
-        """Initialize database service."""
+    def __init__(self, db_path: Optional[str] = None, query_cache: Optional[QueryCache] = None):
+        """Initialize database service.
+        
+        Args:
+            db_path: Path to the SQLite database (defaults to DEFAULT_DB_PATH)
+            query_cache: Result cache to use (defaults to the process-wide cache,
+                         shared by all sessions and invalidated when the database changes)
+        """
         if db_path is None:
             # Extract file path from SQLAlchemy URI format if present
             db_path = DEFAULT_DB_PATH
@@ -33,6 +54,9 @@ class DatabaseService:
             elif db_path.startswith("sqlite://"):
                 db_path = db_path.replace("sqlite://", "")
         self.db_path = db_path
+        # Read-only connections shared by every session using this database
+        self.pool = get_connection_pool(db_path)
+        self.query_cache = query_cache if query_cache is not None else get_query_cache()
     
     @staticmethod
     def _sanitize_string(value: Optional[str]) -> Optional[str]:
@@ -49,19 +73,74 @@ class DatabaseService:
         sanitized = value.strip()
         return sanitized if sanitized else None
     
+    @cached_query()
+    def resolve_player(_self, player_name: str) -> Optional[List[Tuple[str, int]]]:
+        """Resolve a player name to (tour, player_id) pairs via the player_names table.
+        
+        Matching ignores case, accents and punctuation and knows common aliases.
+        
+        Args:
+            player_name: Name of the player
+            
+        Returns:
+            List of (tour, player_id), [] if the name is unknown, or None if the
+            database has no player_names table
+        """
+        player_name = _self._sanitize_string(player_name)
+        if not player_name or player_name == DatabaseService.ALL_PLAYERS:
+            return []
+        try:
+            with _self.pool.connection() as conn:
+                return resolve_player_ids(conn, player_name)
+        except Exception as e:
+            st.warning(f"Error resolving player name: {e}")
+            skip_caching()
+            return None
+    
+    def _player_condition(self, player_name: str, prefix: str = "",
+                          id_column: str = "player_id", name_column: str = "player_name") -> Tuple[str, list]:
+        """Build the WHERE condition selecting one player's rows.
+        
+        Resolved players are matched by integer id (and tour, since ATP and WTA
+        ids overlap); names the index does not know fall back to a NOCASE
+        name comparison.
+        
+        Args:
+            player_name: Name of the player
+            prefix: Table alias prefix (e.g. "pm.")
+            id_column: Player id column to filter
+            name_column: Player name column for the fallback
+            
+        Returns:
+            Tuple of (SQL condition, parameters)
+        """
+        ids = self.resolve_player(player_name)
+        if ids:
+            return player_id_condition(ids, f"{prefix}{id_column}", f"{prefix}tour")
+        return f"{prefix}{name_column} COLLATE NOCASE = ?", [player_name]
+    
+    def get_connection_stats(self) -> dict:
+        """Get usage counters of the shared connection pool (checkouts, wait time, open connections)."""
+        return self.pool.stats()
+    
+    def get_cache_stats(self) -> dict:
+        """Get hit/miss counters of the query result cache."""
+        return self.query_cache.stats()
+    
     def clear_cache(self):
         """Clear all cached data."""
+        self.query_cache.clear()
         try:
             st.cache_data.clear()
         except Exception:
             # Cache clearing is optional, fail silently if not available
             pass
     
-    @st.cache_data(ttl=300)  # Cache for 5 minutes
+    @cached_query()
     def get_all_players(_self) -> List[str]:
         """Get all unique players from database who have played matches."""
         try:
-            with sqlite3.connect(_self.db_path) as conn:
+            with _self.pool.connection() as conn:
                 query = """
                 SELECT player_name
                 FROM (
@@ -81,9 +160,71 @@ class DatabaseService:
             return [DatabaseService.ALL_PLAYERS] + df['player_name'].tolist()
         except Exception as e:
             st.error(f"Error fetching players: {e}")
+            skip_caching()
             return [DatabaseService.ALL_PLAYERS, "Roger Federer", "Rafael Nadal", "Novak Djokovic"]
     
-    @st.cache_data(ttl=60)  # Cache for 1 minute (shorter TTL since it depends on player selection)
+    def get_player_search_index(self) -> PlayerSearchIndex:
+        """Get the in-memory player name search index of this database.
+        
+        Names come from the player_names table (names players appear under in
+        matches, with matches played for ranking); databases without it fall
+        back to the distinct winner/loser names. The index is kept in the
+        process-wide "player_search_index" QueryCache, shared by all sessions
+        and rebuilt when the database file changes.
+        
+        Returns:
+            PlayerSearchIndex over all players who have played matches
+            
+        Raises:
+            Exception: Database errors propagate (nothing is cached then)
+        """
+        cache = get_query_cache("player_search_index", PLAYER_SEARCH_INDEX_CACHE_ENTRIES)
+        index = cache.get(self.db_path, 'index')
+        if index is None:
+            index = self._build_player_search_index()
+            cache.put(self.db_path, 'index', index)
+        return index
+    
+    def _build_player_search_index(self) -> PlayerSearchIndex:
+        """Read the player names and build a PlayerSearchIndex."""
+        try:
+            with self.pool.connection() as conn:
+                rows = conn.execute("""
+                SELECT display_name, MAX(match_count)
+                FROM player_names
+                WHERE name_source = 'matches'
+                GROUP BY display_name
+                """).fetchall()
+            return PlayerSearchIndex(rows)
+        except sqlite3.OperationalError as e:
+            if "no such table" not in str(e):
+                raise
+            with self.pool.connection() as conn:
+                rows = conn.execute("""
+                SELECT winner_name FROM matches WHERE winner_name IS NOT NULL
+                UNION
+                SELECT loser_name FROM matches WHERE loser_name IS NOT NULL
+                """).fetchall()
+            return PlayerSearchIndex((row[0], 0) for row in rows)
+    
+    def search_players(self, query: Optional[str], limit: int = 20) -> List[str]:
+        """Autocomplete player names.
+        
+        Args:
+            query: Typed text; empty returns the players with the most matches
+            limit: Maximum number of suggestions
+            
+        Returns:
+            List[str]: Up to limit player names, best matches first
+        """
+        try:
+            index = self.get_player_search_index()
+        except Exception as e:
+            st.error(f"Error building player search index: {e}")
+            return []
+        return index.search(self._sanitize_string(query), limit)
+    
+    @cached_query()
     def get_all_tournaments(_self, player_name: Optional[str] = None) -> List[str]:
         """Get tournaments from database, optionally filtered by player.
         
@@ -100,7 +241,7 @@ class DatabaseService:
         # If no player specified or "All Players", return all tournaments
         if not player_name or player_name == DatabaseService.ALL_PLAYERS:
             try:
-                with sqlite3.connect(_self.db_path) as conn:
+                with _self.pool.connection() as conn:
                     query = """
                     SELECT DISTINCT tourney_name FROM matches 
                     WHERE tourney_name IS NOT NULL AND tourney_name != ''
@@ -112,27 +253,30 @@ class DatabaseService:
                 return [DatabaseService.ALL_TOURNAMENTS] + df['tourney_name'].tolist()
             except Exception as e:
                 st.error(f"Error fetching tournaments: {e}")
+                skip_caching()
                 return [DatabaseService.ALL_TOURNAMENTS, "Wimbledon", "French Open", "US Open", "Australian Open"]
         
         # Filter tournaments for specific player
         try:
-            with sqlite3.connect(_self.db_path) as conn:
-                query = """
+            player_condition, player_params = _self._player_condition(player_name)
+            with _self.pool.connection() as conn:
+                query = f"""
                 SELECT DISTINCT tourney_name
-                FROM matches 
-                WHERE (winner_name COLLATE NOCASE = ? OR loser_name COLLATE NOCASE = ?)
+                FROM player_matches 
+                WHERE {player_condition}
                   AND tourney_name IS NOT NULL AND tourney_name != ''
                 ORDER BY tourney_name
                 """
-                df = pd.read_sql_query(query, conn, params=[player_name, player_name])
+                df = pd.read_sql_query(query, conn, params=player_params)
             if df.empty:
                 return [DatabaseService.ALL_TOURNAMENTS]
             return [DatabaseService.ALL_TOURNAMENTS] + df['tourney_name'].tolist()
         except Exception as e:
             st.error(f"Error fetching tournaments for player: {e}")
+            skip_caching()
             # Fallback to all tournaments on error
             try:
-                with sqlite3.connect(_self.db_path) as conn:
+                with _self.pool.connection() as conn:
                     query = """
                     SELECT DISTINCT tourney_name FROM matches 
                     WHERE tourney_name IS NOT NULL AND tourney_name != ''
@@ -143,9 +287,10 @@ class DatabaseService:
                     return [DatabaseService.ALL_TOURNAMENTS]
                 return [DatabaseService.ALL_TOURNAMENTS] + df['tourney_name'].tolist()
             except Exception:
+                skip_caching()
                 return [DatabaseService.ALL_TOURNAMENTS, "Wimbledon", "French Open", "US Open", "Australian Open"]
     
-    @st.cache_data(ttl=300)  # Cache for 5 minutes
+    @cached_query()
     def get_player_year_range(_self, player_name: str) -> Tuple[int, int]:
         """Get the year range (min and max event_year) for a specific player.
         
@@ -160,14 +305,15 @@ class DatabaseService:
             return (1968, 2024)  # Default range
         
         try:
-            with sqlite3.connect(_self.db_path) as conn:
-                query = """
+            player_condition, player_params = _self._player_condition(player_name)
+            with _self.pool.connection() as conn:
+                query = f"""
                 SELECT MIN(event_year) as min_year, MAX(event_year) as max_year
-                FROM matches 
-                WHERE (winner_name COLLATE NOCASE = ? OR loser_name COLLATE NOCASE = ?)
+                FROM player_matches 
+                WHERE {player_condition}
                   AND event_year IS NOT NULL
                 """
-                df = pd.read_sql_query(query, conn, params=[player_name, player_name])
+                df = pd.read_sql_query(query, conn, params=player_params)
             
             if df.empty or df['min_year'].iloc[0] is None or df['max_year'].iloc[0] is None:
                 return (1968, 2024)  # Default range if no matches found
@@ -184,9 +330,10 @@ class DatabaseService:
             return (min_year, max_year)
         except Exception as e:
             st.warning(f"Error fetching year range for player: {e}")
+            skip_caching()
             return (1968, 2024)  # Default range on error
     
-    @st.cache_data(ttl=60)  # Cache for 1 minute
+    @cached_query()
     def get_surfaces_for_player(_self, player_name: Optional[str] = None) -> List[str]:
         """Get surfaces from database, optionally filtered by player.
         
@@ -209,15 +356,16 @@ class DatabaseService:
         
         # Filter surfaces for specific player
         try:
-            with sqlite3.connect(_self.db_path) as conn:
-                query = """
+            player_condition, player_params = _self._player_condition(player_name)
+            with _self.pool.connection() as conn:
+                query = f"""
                 SELECT DISTINCT surface
-                FROM matches 
-                WHERE (winner_name COLLATE NOCASE = ? OR loser_name COLLATE NOCASE = ?)
+                FROM player_matches 
+                WHERE {player_condition}
                   AND surface IS NOT NULL AND surface != ''
                 ORDER BY surface
                 """
-                df = pd.read_sql_query(query, conn, params=[player_name, player_name])
+                df = pd.read_sql_query(query, conn, params=player_params)
             
             if df.empty:
                 return all_surfaces  # Return all surfaces if player has no matches
@@ -229,9 +377,10 @@ class DatabaseService:
             return filtered_surfaces if filtered_surfaces else all_surfaces
         except Exception as e:
             st.error(f"Error fetching surfaces for player: {e}")
+            skip_caching()
             return all_surfaces  # Fallback to all surfaces on error
     
-    @st.cache_data(ttl=60)  # Cache for 1 minute
+    @cached_query()
     def get_opponents_for_player(_self, player_name: str) -> List[str]:
         """Get opponents for a specific player."""
         # Sanitize input: trim whitespace and handle empty strings
@@ -240,43 +389,418 @@ class DatabaseService:
             return _self.get_all_players()
         
         try:
-            with sqlite3.connect(_self.db_path) as conn:
-                query = """
+            player_condition, player_params = _self._player_condition(player_name)
+            with _self.pool.connection() as conn:
+                query = f"""
                 SELECT DISTINCT opponent_name
-                FROM (
-                    SELECT loser_name as opponent_name
-                    FROM matches 
-                    WHERE winner_name = ? AND loser_name IS NOT NULL
-                    UNION ALL
-                    SELECT winner_name as opponent_name
-                    FROM matches 
-                    WHERE loser_name = ? AND winner_name IS NOT NULL
-                )
+                FROM player_matches 
+                WHERE {player_condition} AND opponent_name IS NOT NULL
                 ORDER BY opponent_name
                 """
-                df = pd.read_sql_query(query, conn, params=[player_name, player_name])
+                df = pd.read_sql_query(query, conn, params=player_params)
             if df.empty:
                 return [DatabaseService.ALL_OPPONENTS]
             return [DatabaseService.ALL_OPPONENTS] + df['opponent_name'].tolist()
         except Exception as e:
             st.error(f"Error fetching opponents: {e}")
+            skip_caching()
             return _self.get_all_players()
     
+    @cached_query()
+    def get_player_filter_metadata(_self, player_name: Optional[str] = None) -> dict:
+        """Get every filter-panel facet for a player in one query.
+        
+        One pass over the player's player_matches rows (an indexed range scan)
+        grouped by tournament, surface and opponent replaces the separate
+        tournament, year range, surface and opponent queries.
+        
+        Args:
+            player_name: Name of the player (None or "All Players" for the global lists)
+            
+        Returns:
+            dict: tournaments (with "All Tournaments" first), year_range (min, max),
+                  surfaces (standard order) and opponents (with "All Opponents" first),
+                  in the same form as the individual getters. Without a player the
+                  opponents list is only "All Opponents" (the UI searches opponents
+                  through search_players instead of loading every player)
+        """
+        player_name = _self._sanitize_string(player_name)
+        all_surfaces = ["Hard", "Clay", "Grass", "Carpet"]
+        if not player_name or player_name == DatabaseService.ALL_PLAYERS:
+            return {
+                'tournaments': _self.get_all_tournaments(None),
+                'year_range': (1968, 2024),
+                'surfaces': all_surfaces,
+                'opponents': [DatabaseService.ALL_OPPONENTS],
+            }
+        
+        try:
+            player_condition, player_params = _self._player_condition(player_name)
+            with _self.pool.connection() as conn:
+                rows = conn.execute(f"""
+                SELECT tourney_name, surface, opponent_name, MIN(event_year), MAX(event_year)
+                FROM player_matches
+                WHERE {player_condition}
+                GROUP BY tourney_name, surface, opponent_name
+                """, player_params).fetchall()
+        except Exception as e:
+            st.error(f"Error fetching filter options for player: {e}")
+            skip_caching()
+            return {
+                'tournaments': _self.get_all_tournaments(player_name),
+                'year_range': _self.get_player_year_range(player_name),
+                'surfaces': _self.get_surfaces_for_player(player_name),
+                'opponents': _self.get_opponents_for_player(player_name),
+            }
+        
+        tournaments = sorted({row[0] for row in rows if row[0]})
+        surfaces = {row[1] for row in rows if row[1]}
+        opponents = sorted({row[2] for row in rows if row[2] is not None})
+        min_years = [row[3] for row in rows if row[3] is not None]
+        max_years = [row[4] for row in rows if row[4] is not None]
+        
+        if min_years:
+            year_range = (max(int(min(min_years)), _self.MIN_YEAR), min(int(max(max_years)), _self.MAX_YEAR))
+        else:
+            year_range = (1968, 2024)  # Default range if no matches found
+        player_surfaces = [surface for surface in all_surfaces if surface in surfaces]
+        
+        return {
+            'tournaments': [DatabaseService.ALL_TOURNAMENTS] + tournaments,
+            'year_range': year_range,
+            'surfaces': player_surfaces or all_surfaces,
+            'opponents': [DatabaseService.ALL_OPPONENTS] + opponents,
+        }
+    
+    def _match_query_parts(self, player: Optional[str], opponent: Optional[str],
+                           tournament: Optional[str],
+                           year: Optional[Union[int, str, Tuple[int, int], List[int]]],
+                           surfaces: Optional[List[str]],
+                           return_all_columns: bool) -> Tuple[str, str, List[str], list]:
+        """Build the SELECT list, FROM clause and WHERE conditions of a match filter.
+        
+        Args:
+            player, opponent, tournament, year, surfaces: Filters as in get_matches_with_filters
+            return_all_columns: Select m.* instead of the table columns
+            
+        Returns:
+            Tuple of (select list, from clause, where conditions, parameters)
+        """
+        # Sanitize string inputs: trim whitespace and handle None/empty strings
+        player = self._sanitize_string(player)
+        opponent = self._sanitize_string(opponent)
+        tournament = self._sanitize_string(tournament)
+        # Don't sanitize year - it can be int, tuple, list, or str
+        
+        # Build WHERE clause
+        where_conditions = []
+        params = []
+
+        has_player = bool(player and player != self.ALL_PLAYERS)
+        has_opponent = bool(opponent and opponent != self.ALL_OPPONENTS)
+
+        # Per-player filters go through player_matches (one row per player per match),
+        # so the lookup is a single indexed range scan instead of winner OR loser.
+        # Names are resolved to player ids once (see _player_condition)
+        if has_player or has_opponent:
+            from_clause = "player_matches pm JOIN matches m ON m.match_id = pm.match_id"
+            col = "pm."
+            player_condition, player_params = self._player_condition(player if has_player else opponent, "pm.")
+            where_conditions.append(player_condition)
+            params.extend(player_params)
+            if has_player and has_opponent:
+                opponent_condition, opponent_params = self._player_condition(
+                    opponent, "pm.", id_column="opponent_id", name_column="opponent_name"
+                )
+                where_conditions.append(opponent_condition)
+                params.extend(opponent_params)
+        else:
+            from_clause = "matches m"
+            col = "m."
+
+        # With a player selected, also return the player-perspective columns so
+        # add_player_match_columns() does not have to derive them again
+        perspective_columns = (
+            ", pm.is_winner, pm.opponent_name AS opponent, pm.result" if has_player else ""
+        )
+
+        if tournament and tournament != self.ALL_TOURNAMENTS:
+            where_conditions.append(f"{col}tourney_name = ?")
+            params.append(tournament)
+
+        # Handle year filtering: supports None, int, tuple (range), or list
+        if year is not None and year != self.ALL_YEARS:
+            try:
+                # Handle tuple (year range) - use BETWEEN for efficiency
+                if isinstance(year, tuple) and len(year) == 2:
+                    start_year, end_year = int(year[0]), int(year[1])
+                    # Ensure start <= end
+                    if start_year > end_year:
+                        start_year, end_year = end_year, start_year
+
+                    # Validate year range
+                    if (self.MIN_YEAR <= start_year <= self.MAX_YEAR and 
+                        self.MIN_YEAR <= end_year <= self.MAX_YEAR):
+                        where_conditions.append(f"{col}event_year BETWEEN ? AND ?")
+                        params.extend([start_year, end_year])
+                    else:
+                        st.warning(f"Invalid year range: {start_year}-{end_year}. Skipping year filter.")
+
+                # Handle list (multiple specific years) - use IN
+                elif isinstance(year, list) and len(year) > 0:
+                    year_list = [int(y) for y in year if isinstance(y, (int, str)) and str(y).isdigit()]
+                    # Validate all years
+                    valid_years = [y for y in year_list if self.MIN_YEAR <= y <= self.MAX_YEAR]
+
+                    if valid_years:
+                        if len(valid_years) == 1:
+                            # Single year in list - use equality
+                            where_conditions.append(f"{col}event_year = ?")
+                            params.append(valid_years[0])
+                        else:
+                            # Multiple years - use IN
+                            placeholders = ','.join(['?' for _ in valid_years])
+                            where_conditions.append(f"{col}event_year IN ({placeholders})")
+                            params.extend(valid_years)
+                    else:
+                        st.warning(f"Invalid year values in list. Skipping year filter.")
+
+                # Handle single integer year
+                elif isinstance(year, int):
+                    if self.MIN_YEAR <= year <= self.MAX_YEAR:
+                        where_conditions.append(f"{col}event_year = ?")
+                        params.append(year)
+                    else:
+                        st.warning(f"Invalid year range: {year}. Skipping year filter.")
+
+                # Handle string (backward compatibility)
+                elif isinstance(year, str):
+                    year_int = int(year)
+                    if self.MIN_YEAR <= year_int <= self.MAX_YEAR:
+                        where_conditions.append(f"{col}event_year = ?")
+                        params.append(year_int)
+                    else:
+                        st.warning(f"Invalid year range: {year_int}. Skipping year filter.")
+                else:
+                    st.warning(f"Invalid year format: {type(year)}. Expected int, tuple, list, or str. Skipping year filter.")
+
+            except (ValueError, TypeError) as e:
+                st.warning(f"Invalid year format: {year}. Error: {e}. Skipping year filter.")
+
+        if surfaces:
+            # Filter and validate surfaces: remove empty strings, None values, and strip whitespace
+            valid_surfaces = [
+                s.strip() for s in surfaces 
+                if s and isinstance(s, str) and s.strip()
+            ]
+
+            if valid_surfaces:
+                # Handle multiple surface filtering
+                placeholders = ','.join(['?' for _ in valid_surfaces])
+                where_conditions.append(f"{col}surface IN ({placeholders})")
+                params.extend(valid_surfaces)
+            elif len(surfaces) > 0:
+                # User provided surfaces but all were invalid
+                st.warning(f"Invalid surface values provided. Skipping surface filter.")
+
+        # Select columns based on return_all_columns parameter
+        if return_all_columns:
+            # All columns for chart generation
+            select_list = f"m.*{perspective_columns}"
+        else:
+            # Selected columns for table display
+            select_list = f"""
+                m.event_year,
+                m.tourney_date,
+                m.tourney_name,
+                m.round,
+                m.winner_name,
+                m.loser_name,
+                m.surface,
+                m.score{perspective_columns}"""
+        return select_list, from_clause, where_conditions, params
+    
+    def _read_match_page(self, query_parts: Tuple[str, str, List[str], list],
+                         page_size: int, after: Optional[Tuple] = None) -> Tuple[pd.DataFrame, Optional[Tuple]]:
+        """Read one page of matches in (tourney_date, match_num, match_id) order.
+        
+        Keyset pagination: the page starts after the key of the previous page's
+        last row, so every page is an index range scan however deep it is
+        (OFFSET would re-read all earlier rows). match_id breaks ties between
+        matches sharing a date and match number. Matches without a date or
+        match number come first (see MATCH_KEY_EXPRESSIONS).
+        
+        Args:
+            query_parts: Result of _match_query_parts
+            page_size: Maximum rows in the page
+            after: Key of the previous page's last row, or None for the first page
+            
+        Returns:
+            Tuple of (raw page DataFrame, key of its last row or None if no rows follow)
+        """
+        select_list, from_clause, where_conditions, params = query_parts
+        conditions = list(where_conditions)
+        page_params = list(params)
+        key = ", ".join(self.MATCH_KEY_EXPRESSIONS)
+        if after is not None:
+            # The leading-column bound lets SQLite seek the expression index
+            # (it cannot seek on a row value of expressions alone)
+            conditions.append(f"{self.MATCH_KEY_EXPRESSIONS[0]} >= ? AND ({key}) > (?, ?, ?)")
+            page_params.extend([after[0], *after])
+        where_clause = " AND ".join(conditions) if conditions else "1=1"
+        
+        key_columns = ", ".join(f"{expression} AS {name}"
+                                for expression, name in zip(self.MATCH_KEY_EXPRESSIONS, self.MATCH_KEY_COLUMNS))
+        order_by = ", ".join(f"{expression} ASC" for expression in self.MATCH_KEY_EXPRESSIONS)
+        # One extra row tells whether another page follows
+        query = f"""
+        SELECT {select_list},
+            {key_columns}
+        FROM {from_clause}
+        WHERE {where_clause}
+        ORDER BY {order_by}
+        LIMIT {int(page_size) + 1}
+        """
+        with self.pool.connection() as conn:
+            df = pd.read_sql_query(query, conn, params=page_params)
+        
+        next_key = None
+        if len(df) > page_size:
+            df = df.iloc[:page_size]
+            if len(df):
+                last = df.iloc[-1]
+                next_key = (last['_key_date'], int(last['_key_num']), int(last['_key_id']))
+        return df.drop(columns=list(self.MATCH_KEY_COLUMNS)), next_key
+    
+    def _iter_match_pages(self, query_parts: Tuple[str, str, List[str], list],
+                          page_size: int, max_rows: Optional[int] = None) -> Iterator[pd.DataFrame]:
+        """Yield raw keyset pages until the result (or max_rows) is exhausted.
+        
+        Always yields at least one (possibly empty) page, so the columns are known.
+        """
+        after = None
+        remaining = max_rows
+        while True:
+            size = page_size if remaining is None else min(page_size, remaining)
+            df, after = self._read_match_page(query_parts, size, after)
+            yield df
+            if remaining is not None:
+                remaining -= len(df)
+            if after is None or (remaining is not None and remaining <= 0):
+                return
+    
+    @staticmethod
+    def _finish_match_frame(df: pd.DataFrame) -> pd.DataFrame:
+        """Apply the display dtypes to raw match rows."""
+        if 'is_winner' in df.columns:
+            df['is_winner'] = df['is_winner'].astype(bool)
+        # float32 stats and categorical surface/round/level
+        compact_dtypes(df)
+        return df
+    
+    @cached_query(unordered=('surfaces',))
+    def get_matches_page(self, player: Optional[str] = None,
+                         opponent: Optional[str] = None,
+                         tournament: Optional[str] = None,
+                         year: Optional[Union[int, str, Tuple[int, int], List[int]]] = None,
+                         surfaces: Optional[List[str]] = None,
+                         return_all_columns: bool = False,
+                         page_size: int = MATCH_PAGE_SIZE,
+                         after: Optional[Tuple] = None) -> Tuple[pd.DataFrame, Optional[Tuple]]:
+        """Get one page of filtered matches, oldest first.
+        
+        Args:
+            player, opponent, tournament, year, surfaces: Filters as in get_matches_with_filters
+            return_all_columns: Return all match columns instead of the table columns
+            page_size: Maximum matches in the page
+            after: Key returned with the previous page (None for the first page)
+            
+        Returns:
+            Tuple of (DataFrame, key to pass as after for the next page, or None on the last page)
+        """
+        try:
+            query_parts = self._match_query_parts(player, opponent, tournament, year, surfaces, return_all_columns)
+            df, next_key = self._read_match_page(query_parts, page_size, after)
+            return self._finish_match_frame(df), next_key
+        except Exception as e:
+            st.error(f"Error fetching matches: {e}")
+            skip_caching()
+            return pd.DataFrame(), None
+    
+    @cached_query(unordered=('surfaces',))
+    def count_matches_with_filters(self, player: Optional[str] = None,
+                                   opponent: Optional[str] = None,
+                                   tournament: Optional[str] = None,
+                                   year: Optional[Union[int, str, Tuple[int, int], List[int]]] = None,
+                                   surfaces: Optional[List[str]] = None) -> int:
+        """Count the matches a filter selects (for page counts).
+        
+        Returns:
+            int: Number of matching rows (0 on error)
+        """
+        try:
+            _, from_clause, where_conditions, params = self._match_query_parts(
+                player, opponent, tournament, year, surfaces, False
+            )
+            where_clause = " AND ".join(where_conditions) if where_conditions else "1=1"
+            with self.pool.connection() as conn:
+                row = conn.execute(f"SELECT COUNT(*) FROM {from_clause} WHERE {where_clause}", params).fetchone()
+            return int(row[0])
+        except Exception as e:
+            st.error(f"Error counting matches: {e}")
+            skip_caching()
+            return 0
+    
+    def iter_matches_with_filters(self, player: Optional[str] = None,
+                                  opponent: Optional[str] = None,
+                                  tournament: Optional[str] = None,
+                                  year: Optional[Union[int, str, Tuple[int, int], List[int]]] = None,
+                                  surfaces: Optional[List[str]] = None,
+                                  return_all_columns: bool = False,
+                                  chunk_size: int = MATCH_PAGE_SIZE,
+                                  max_rows: Optional[int] = None) -> Iterator[pd.DataFrame]:
+        """Stream filtered matches as DataFrame chunks, oldest first.
+        
+        Each chunk is one keyset page read on a pooled connection that is
+        returned before the chunk is yielded, so consumers can aggregate
+        results of any size chunk by chunk. Not cached.
+        
+        Args:
+            player, opponent, tournament, year, surfaces: Filters as in get_matches_with_filters
+            return_all_columns: Return all match columns instead of the table columns
+            chunk_size: Maximum rows per chunk
+            max_rows: Stop after this many rows (None for all)
+            
+        Yields:
+            pd.DataFrame: Chunks of at most chunk_size matches
+        """
+        query_parts = self._match_query_parts(player, opponent, tournament, year, surfaces, return_all_columns)
+        for df in self._iter_match_pages(query_parts, chunk_size, max_rows):
+            if len(df):
+                yield self._finish_match_frame(df)
+    
+    @cached_query(unordered=('surfaces',))
     def get_matches_with_filters(self, player: Optional[str] = None, 
                                 opponent: Optional[str] = None, 
                                 tournament: Optional[str] = None, 
                                 year: Optional[Union[int, str, Tuple[int, int], List[int]]] = None, 
                                 surfaces: Optional[List[str]] = None,
                                 return_all_columns: bool = False,
-                                _cache_bust: int = 0) -> pd.DataFrame:
-        """Get matches based on filters."""
-        try:
-            # Sanitize string inputs: trim whitespace and handle None/empty strings
-            player = self._sanitize_string(player)
-            opponent = self._sanitize_string(opponent)
-            tournament = self._sanitize_string(tournament)
-            # Don't sanitize year - it can be int, tuple, list, or str
+                                max_rows: Optional[int] = None) -> pd.DataFrame:
+        """Get all matches for a filter, oldest first.
+        
+        Rows are read in keyset pages (see iter_matches_with_filters) and
+        combined once, so no result is cut off unless max_rows is given.
+        
+        Args:
+            player, opponent, tournament, year, surfaces: Match filters
+            return_all_columns: Return all match columns (charts) instead of the table columns
+            max_rows: Return at most this many matches (None for all)
             
+        Returns:
+            pd.DataFrame: Matching rows
+        """
+        try:
             # Debug logging - format year for display
             year_display = year
             if isinstance(year, tuple):
@@ -285,151 +809,171 @@ class DatabaseService:
                 year_display = f"{min(year)}-{max(year)}" if len(year) > 1 else str(year[0])
             st.write(f"🔍 Querying: player='{player}', year={year_display}, tournament='{tournament}', surfaces='{surfaces}'")
             
-            # Build WHERE clause
-            where_conditions = []
-            params = []
-            
-            # Optimize: if both player and opponent are specified, combine them into one condition
-            # Use COLLATE NOCASE for case-insensitive matching
-            if player and player != self.ALL_PLAYERS and opponent and opponent != self.ALL_OPPONENTS:
-                # Match where both players are involved (either order)
-                where_conditions.append("((winner_name COLLATE NOCASE = ? AND loser_name COLLATE NOCASE = ?) OR (winner_name COLLATE NOCASE = ? AND loser_name COLLATE NOCASE = ?))")
-                params.extend([player, opponent, opponent, player])
-            else:
-                # Handle player and opponent separately if only one is specified
-                if player and player != self.ALL_PLAYERS:
-                    where_conditions.append("(winner_name COLLATE NOCASE = ? OR loser_name COLLATE NOCASE = ?)")
-                    params.extend([player, player])
-                
-                if opponent and opponent != self.ALL_OPPONENTS:
-                    where_conditions.append("(winner_name COLLATE NOCASE = ? OR loser_name COLLATE NOCASE = ?)")
-                    params.extend([opponent, opponent])
-            
-            if tournament and tournament != self.ALL_TOURNAMENTS:
-                where_conditions.append("tourney_name = ?")
-                params.append(tournament)
-            
-            # Handle year filtering: supports None, int, tuple (range), or list
-            if year is not None and year != self.ALL_YEARS:
-                try:
-                    # Handle tuple (year range) - use BETWEEN for efficiency
-                    if isinstance(year, tuple) and len(year) == 2:
-                        start_year, end_year = int(year[0]), int(year[1])
-                        # Ensure start <= end
-                        if start_year > end_year:
-                            start_year, end_year = end_year, start_year
-                        
-                        # Validate year range
-                        if (self.MIN_YEAR <= start_year <= self.MAX_YEAR and 
-                            self.MIN_YEAR <= end_year <= self.MAX_YEAR):
-                            where_conditions.append("event_year BETWEEN ? AND ?")
-                            params.extend([start_year, end_year])
-                        else:
-                            st.warning(f"Invalid year range: {start_year}-{end_year}. Skipping year filter.")
-                    
-                    # Handle list (multiple specific years) - use IN
-                    elif isinstance(year, list) and len(year) > 0:
-                        year_list = [int(y) for y in year if isinstance(y, (int, str)) and str(y).isdigit()]
-                        # Validate all years
-                        valid_years = [y for y in year_list if self.MIN_YEAR <= y <= self.MAX_YEAR]
-                        
-                        if valid_years:
-                            if len(valid_years) == 1:
-                                # Single year in list - use equality
-                                where_conditions.append("event_year = ?")
-                                params.append(valid_years[0])
-                            else:
-                                # Multiple years - use IN
-                                placeholders = ','.join(['?' for _ in valid_years])
-                                where_conditions.append(f"event_year IN ({placeholders})")
-                                params.extend(valid_years)
-                        else:
-                            st.warning(f"Invalid year values in list. Skipping year filter.")
-                    
-                    # Handle single integer year
-                    elif isinstance(year, int):
-                        if self.MIN_YEAR <= year <= self.MAX_YEAR:
-                            where_conditions.append("event_year = ?")
-                            params.append(year)
-                        else:
-                            st.warning(f"Invalid year range: {year}. Skipping year filter.")
-                    
-                    # Handle string (backward compatibility)
-                    elif isinstance(year, str):
-                        year_int = int(year)
-                        if self.MIN_YEAR <= year_int <= self.MAX_YEAR:
-                            where_conditions.append("event_year = ?")
-                            params.append(year_int)
-                        else:
-                            st.warning(f"Invalid year range: {year_int}. Skipping year filter.")
-                    else:
-                        st.warning(f"Invalid year format: {type(year)}. Expected int, tuple, list, or str. Skipping year filter.")
-                        
-                except (ValueError, TypeError) as e:
-                    st.warning(f"Invalid year format: {year}. Error: {e}. Skipping year filter.")
-            
-            if surfaces:
-                # Filter and validate surfaces: remove empty strings, None values, and strip whitespace
-                valid_surfaces = [
-                    s.strip() for s in surfaces 
-                    if s and isinstance(s, str) and s.strip()
-                ]
-                
-                if valid_surfaces:
-                    # Handle multiple surface filtering
-                    placeholders = ','.join(['?' for _ in valid_surfaces])
-                    where_conditions.append(f"surface IN ({placeholders})")
-                    params.extend(valid_surfaces)
-                elif len(surfaces) > 0:
-                    # User provided surfaces but all were invalid
-                    st.warning(f"Invalid surface values provided. Skipping surface filter.")
-            
-            where_clause = " AND ".join(where_conditions) if where_conditions else "1=1"
-            
-            # Select columns based on return_all_columns parameter
-            if return_all_columns:
-                # Return all columns for chart generation
-                query = f"""
-                SELECT *
-                FROM matches 
-                WHERE {where_clause}
-                ORDER BY tourney_date ASC, match_num ASC
-                LIMIT {self.DEFAULT_QUERY_LIMIT}
-                """
-            else:
-                # Return selected columns for table display
-                query = f"""
-                SELECT
-                    event_year,
-                    tourney_date,
-                    tourney_name,
-                    round,
-                    winner_name,
-                    loser_name,
-                    surface,
-                    score
-                FROM matches 
-                WHERE {where_clause}
-                ORDER BY tourney_date ASC, match_num ASC
-                LIMIT {self.DEFAULT_QUERY_LIMIT}
-                """
-            
-            with sqlite3.connect(self.db_path) as conn:
-                df = pd.read_sql_query(query, conn, params=params)
+            query_parts = self._match_query_parts(player, opponent, tournament, year, surfaces, return_all_columns)
+            # Concatenate the raw pages and convert dtypes once (per-page
+            # categoricals would not line up across pages)
+            pages = list(self._iter_match_pages(query_parts, self.MATCH_CHUNK_SIZE, max_rows))
+            df = self._finish_match_frame(pd.concat(pages, ignore_index=True) if len(pages) > 1 else pages[0])
             
             # Debug logging
             st.write(f"📊 Found {len(df)} matches")
             if len(df) == 0:
-                st.write(f"❌ No matches found. Query: {query}")
-                st.write(f"🔧 Parameters: {params}")
+                st.write(f"❌ No matches found for the selected filters.")
             
             return df
             
         except Exception as e:
             st.error(f"Error fetching matches: {e}")
+            skip_caching()
             return pd.DataFrame()
     
-    @st.cache_data(ttl=300)  # Cache for 5 minutes
+    @cached_query(unordered=('surfaces',))
+    def get_player_aggregates(_self, player_name: str,
+                              year: Optional[Union[int, str, Tuple[int, int], List[int]]] = None,
+                              surfaces: Optional[List[str]] = None) -> dict:
+        """Get pre-summed career/season counters for a player from player_aggregates.
+        
+        Sums the build-time aggregate rows (one per year, surface and tourney level)
+        instead of scanning the player's matches.
+        
+        Args:
+            player_name: Name of the player
+            year: Optional year filter (int, str, (start, end) tuple, or list of years)
+            surfaces: Optional list of surfaces to include
+            
+        Returns:
+            dict: Counter name -> summed value (matches, wins, losses, aces, serve_points,
+                  return_points_won, break_points_converted, ...), or an empty dict
+                  if the player has no matches for the filters
+        """
+        player_name = _self._sanitize_string(player_name)
+        if not player_name or player_name == DatabaseService.ALL_PLAYERS:
+            return {}
+        
+        counters = [
+            'matches', 'wins', 'losses',
+            'serve_stat_matches', 'aces', 'double_faults', 'serve_points', 'first_serves_in',
+            'first_serve_points_won', 'second_serve_points_won', 'service_games',
+            'break_points_saved', 'break_points_faced',
+            'return_stat_matches', 'return_points', 'return_points_won',
+            'break_point_chances', 'break_points_converted', 'opponent_aces'
+        ]
+        player_condition, params = _self._player_condition(player_name)
+        where_conditions = [player_condition]
+        
+        if year is not None and year != DatabaseService.ALL_YEARS:
+            try:
+                if isinstance(year, tuple) and len(year) == 2:
+                    start_year, end_year = sorted((int(year[0]), int(year[1])))
+                    where_conditions.append("event_year BETWEEN ? AND ?")
+                    params.extend([start_year, end_year])
+                elif isinstance(year, list) and len(year) > 0:
+                    year_list = [int(y) for y in year]
+                    where_conditions.append(f"event_year IN ({','.join('?' for _ in year_list)})")
+                    params.extend(year_list)
+                else:
+                    where_conditions.append("event_year = ?")
+                    params.append(int(year))
+            except (ValueError, TypeError) as e:
+                st.warning(f"Invalid year format: {year}. Error: {e}. Skipping year filter.")
+        
+        valid_surfaces = [s.strip() for s in (surfaces or []) if s and isinstance(s, str) and s.strip()]
+        if valid_surfaces:
+            where_conditions.append(f"surface IN ({','.join('?' for _ in valid_surfaces)})")
+            params.extend(valid_surfaces)
+        
+        try:
+            with _self.pool.connection() as conn:
+                query = f"""
+                SELECT {', '.join(f'SUM({c}) AS {c}' for c in counters)}
+                FROM player_aggregates
+                WHERE {' AND '.join(where_conditions)}
+                """
+                row = conn.execute(query, params).fetchone()
+            if row is None or not row[0]:
+                return {}
+            return {name: (value or 0) for name, value in zip(counters, row)}
+        except Exception as e:
+            st.error(f"Error fetching player aggregates: {e}")
+            skip_caching()
+            return {}
+    
+    @staticmethod
+    def _has_columns(conn, table: str, *columns: str) -> bool:
+        """Check whether a table has all the given columns (older builds may lack new ones)."""
+        existing = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+        return all(column in existing for column in columns)
+    
+    def _ranking_year_filter(self, year: Optional[Union[int, str, Tuple[int, int], List[int]]],
+                             integer_dates: bool = True) -> Tuple[str, list]:
+        """Build the rankings year filter for get_player_ranking_timeline.
+        
+        With integer_dates the filter is a ranking_yyyymmdd range (part of the
+        (player, ranking_yyyymmdd, ...) index, so a range scan); databases
+        built before those columns existed fall back to strftime().
+        
+        Args:
+            year: None, int, str, (start, end) tuple or list of years
+            integer_dates: Whether the rankings tables have ranking_yyyymmdd
+            
+        Returns:
+            Tuple of (SQL clause starting with AND, or "", parameters)
+        """
+        if year is None or year == self.ALL_YEARS:
+            return "", []
+        try:
+            # Handle tuple (year range) - use BETWEEN for efficiency
+            if isinstance(year, tuple) and len(year) == 2:
+                start_year, end_year = sorted((int(year[0]), int(year[1])))
+                years = None
+            # Handle list (multiple specific years) - use IN
+            elif isinstance(year, list) and len(year) > 0:
+                year_list = [int(y) for y in year if isinstance(y, (int, str)) and str(y).isdigit()]
+                years = [y for y in year_list if self.MIN_YEAR <= y <= self.MAX_YEAR]
+                if not years:
+                    return "", []
+                if len(years) == 1:
+                    start_year = end_year = years[0]
+                    years = None
+            # Handle single year (int, or str for backward compatibility)
+            elif isinstance(year, (int, str)):
+                start_year = end_year = int(year)
+                years = None
+            else:
+                return "", []
+        except (ValueError, TypeError):
+            # If year filtering fails, just continue without year filter
+            return "", []
+        
+        if years is None and not (self.MIN_YEAR <= start_year <= self.MAX_YEAR and
+                                  self.MIN_YEAR <= end_year <= self.MAX_YEAR):
+            return "", []
+        
+        placeholders = ','.join('?' for _ in years or [])
+        if integer_dates:
+            if years is None:
+                return "AND ranking_yyyymmdd BETWEEN ? AND ?", [start_year * 10000 + 101, end_year * 10000 + 1231]
+            # One ranking_yyyymmdd range per run of consecutive years. An
+            # expression such as ranking_yyyymmdd / 10000 cannot use the index;
+            # the outer range from the first to the last year is the index range
+            # scan, the per-run ranges filter the rows it reads
+            ranges = []
+            for y in sorted(set(years)):
+                if ranges and ranges[-1][1] == y - 1:
+                    ranges[-1][1] = y
+                else:
+                    ranges.append([y, y])
+            bounds = [[first * 10000 + 101, last * 10000 + 1231] for first, last in ranges]
+            if len(bounds) == 1:
+                return "AND ranking_yyyymmdd BETWEEN ? AND ?", bounds[0]
+            clause = " OR ".join("ranking_yyyymmdd BETWEEN ? AND ?" for _ in bounds)
+            params = [bounds[0][0], bounds[-1][1]] + [bound for pair in bounds for bound in pair]
+            return f"AND ranking_yyyymmdd BETWEEN ? AND ? AND ({clause})", params
+        if years is None:
+            return "AND CAST(strftime('%Y', ranking_date) AS INTEGER) BETWEEN ? AND ?", [start_year, end_year]
+        return f"AND CAST(strftime('%Y', ranking_date) AS INTEGER) IN ({placeholders})", years
+    
+    @cached_query()
     def get_player_ranking_timeline(_self, player_name: str, year: Optional[Union[int, str, Tuple[int, int], List[int]]] = None) -> pd.DataFrame:
         """
         Get ranking timeline data for a specific player from both ATP and WTA rankings.
@@ -450,92 +994,63 @@ class DatabaseService:
             return pd.DataFrame()
         
         try:
-            with sqlite3.connect(_self.db_path) as conn:
+            with _self.pool.connection() as conn:
                 # Build year filter clause for ranking_date
-                year_filter_clause = ""
-                year_params = []
-                
-                if year is not None and year != _self.ALL_YEARS:
-                    try:
-                        # Handle tuple (year range) - use BETWEEN for efficiency
-                        if isinstance(year, tuple) and len(year) == 2:
-                            start_year, end_year = int(year[0]), int(year[1])
-                            # Ensure start <= end
-                            if start_year > end_year:
-                                start_year, end_year = end_year, start_year
-                            
-                            # Validate year range
-                            if (_self.MIN_YEAR <= start_year <= _self.MAX_YEAR and 
-                                _self.MIN_YEAR <= end_year <= _self.MAX_YEAR):
-                                year_filter_clause = "AND CAST(strftime('%Y', ranking_date) AS INTEGER) BETWEEN ? AND ?"
-                                year_params = [start_year, end_year]
-                        
-                        # Handle list (multiple specific years) - use IN
-                        elif isinstance(year, list) and len(year) > 0:
-                            year_list = [int(y) for y in year if isinstance(y, (int, str)) and str(y).isdigit()]
-                            # Validate all years
-                            valid_years = [y for y in year_list if _self.MIN_YEAR <= y <= _self.MAX_YEAR]
-                            
-                            if valid_years:
-                                if len(valid_years) == 1:
-                                    # Single year in list - use equality
-                                    year_filter_clause = "AND CAST(strftime('%Y', ranking_date) AS INTEGER) = ?"
-                                    year_params = [valid_years[0]]
-                                else:
-                                    # Multiple years - use IN
-                                    placeholders = ','.join(['?' for _ in valid_years])
-                                    year_filter_clause = f"AND CAST(strftime('%Y', ranking_date) AS INTEGER) IN ({placeholders})"
-                                    year_params = valid_years
-                        
-                        # Handle single integer year
-                        elif isinstance(year, int):
-                            if _self.MIN_YEAR <= year <= _self.MAX_YEAR:
-                                year_filter_clause = "AND CAST(strftime('%Y', ranking_date) AS INTEGER) = ?"
-                                year_params = [year]
-                        
-                        # Handle string (backward compatibility)
-                        elif isinstance(year, str):
-                            year_int = int(year)
-                            if _self.MIN_YEAR <= year_int <= _self.MAX_YEAR:
-                                year_filter_clause = "AND CAST(strftime('%Y', ranking_date) AS INTEGER) = ?"
-                                year_params = [year_int]
-                                
-                    except (ValueError, TypeError) as e:
-                        # If year filtering fails, just continue without year filter
-                        pass
-                
-                # Query ATP rankings - join with atp_players to get player name
-                atp_query = f"""
-                SELECT ar.ranking_date, ar.rank, 'ATP' as tour
-                FROM atp_rankings ar
-                JOIN atp_players ap ON ar.player = ap.player_id
-                WHERE (COALESCE(ap.full_name, ap.name_first || ' ' || ap.name_last) COLLATE NOCASE = ?
-                    OR ap.full_name COLLATE NOCASE = ?
-                    OR (ap.name_first || ' ' || ap.name_last) COLLATE NOCASE = ?)
-                  AND ar.ranking_date IS NOT NULL
-                  AND ar.rank IS NOT NULL
-                  {year_filter_clause}
-                ORDER BY ar.ranking_date ASC
-                """
-                
-                # Query WTA rankings - join with wta_players to get player name
-                wta_query = f"""
-                SELECT wr.ranking_date, wr.rank, 'WTA' as tour
-                FROM wta_rankings wr
-                JOIN wta_players wp ON wr.player = wp.player_id
-                WHERE (COALESCE(wp.full_name, wp.name_first || ' ' || wp.name_last) COLLATE NOCASE = ?
-                    OR wp.full_name COLLATE NOCASE = ?
-                    OR (wp.name_first || ' ' || wp.name_last) COLLATE NOCASE = ?)
-                  AND wr.ranking_date IS NOT NULL
-                  AND wr.rank IS NOT NULL
-                  {year_filter_clause}
-                ORDER BY wr.ranking_date ASC
-                """
+                year_filter_clause, year_params = _self._ranking_year_filter(
+                    year, integer_dates=_self._has_columns(conn, 'atp_rankings', 'ranking_yyyymmdd')
+                )
                 
-                # Execute both queries with player name params + year params
-                player_params = [player_name, player_name, player_name]
-                atp_df = pd.read_sql_query(atp_query, conn, params=player_params + year_params)
-                wta_df = pd.read_sql_query(wta_query, conn, params=player_params + year_params)
+                ids = _self.resolve_player(player_name)
+                if ids:
+                    # Resolved once to player ids: a covering range scan on
+                    # idx_<tour>_rankings_player_date per tour, no players join
+                    frames = []
+                    for tour in ('ATP', 'WTA'):
+                        tour_ids = [player_id for id_tour, player_id in ids if id_tour == tour]
+                        if not tour_ids:
+                            frames.append(pd.DataFrame())
+                            continue
+                        placeholders = ','.join('?' for _ in tour_ids)
+                        query = f"""
+                        SELECT ranking_date, rank, '{tour}' as tour
+                        FROM {tour.lower()}_rankings
+                        WHERE player IN ({placeholders})
+                          AND ranking_date IS NOT NULL
+                          AND rank IS NOT NULL
+                          {year_filter_clause}
+                        ORDER BY ranking_date ASC
+                        """
+                        frames.append(pd.read_sql_query(query, conn, params=tour_ids + year_params))
+                    atp_df, wta_df = frames
+                else:
+                    # Databases without player_names: match the name against the players tables
+                    atp_query = f"""
+                    SELECT ar.ranking_date, ar.rank, 'ATP' as tour
+                    FROM atp_rankings ar
+                    JOIN atp_players ap ON ar.player = ap.player_id
+                    WHERE (COALESCE(ap.full_name, ap.name_first || ' ' || ap.name_last) COLLATE NOCASE = ?
+                        OR ap.full_name COLLATE NOCASE = ?
+                        OR (ap.name_first || ' ' || ap.name_last) COLLATE NOCASE = ?)
+                      AND ar.ranking_date IS NOT NULL
+                      AND ar.rank IS NOT NULL
+                      {year_filter_clause}
+                    ORDER BY ar.ranking_date ASC
+                    """
+                    wta_query = f"""
+                    SELECT wr.ranking_date, wr.rank, 'WTA' as tour
+                    FROM wta_rankings wr
+                    JOIN wta_players wp ON wr.player = wp.player_id
+                    WHERE (COALESCE(wp.full_name, wp.name_first || ' ' || wp.name_last) COLLATE NOCASE = ?
+                        OR wp.full_name COLLATE NOCASE = ?
+                        OR (wp.name_first || ' ' || wp.name_last) COLLATE NOCASE = ?)
+                      AND wr.ranking_date IS NOT NULL
+                      AND wr.rank IS NOT NULL
+                      {year_filter_clause}
+                    ORDER BY wr.ranking_date ASC
+                    """
+                    player_params = [player_name, player_name, player_name]
+                    atp_df = pd.read_sql_query(atp_query, conn, params=player_params + year_params)
+                    wta_df = pd.read_sql_query(wta_query, conn, params=player_params + year_params)
                 
                 # Combine results
                 if not atp_df.empty and not wta_df.empty:
@@ -555,4 +1070,5 @@ class DatabaseService:
                 
         except Exception as e:
             st.warning(f"Error fetching ranking timeline for {player_name}: {e}")
+            skip_caching()
             return pd.DataFrame()
\ No newline at end of file
@@ -0,0 +1,115 @@
+"""
+In-memory player name search for the filter panel autocomplete.
+
+PlayerSearchIndex keeps every player name once, in a sorted array of
+normalized word-start suffixes (so "nad" finds "Rafael Nadal" as well as
+"Nadia Petrova") plus a trigram index for misspelled queries. A search
+returns only the top-N names, ranked by matches played, instead of
+shipping the full player list to a Streamlit widget.
+"""
+
+from bisect import bisect_left
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from tennis.player_names import normalize_player_name
+
+# Queries shorter than this only use prefix matching (trigrams of 1-2
+# characters match almost every name)
+MIN_FUZZY_QUERY_LENGTH = 3
+# Share of the query's trigrams a name must contain to count as a fuzzy hit
+MIN_TRIGRAM_SIMILARITY = 0.5
+
+
+def _trigrams(key: str) -> set:
+    """Trigrams of a normalized name, padded so word starts weigh in."""
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class PlayerSearchIndex:
+    """Prefix and fuzzy search over player names, ranked by matches played."""
+
+    def __init__(self, players: Iterable[Tuple[str, int]]):
+        """
+        Build the index.
+
+        Args:
+            players: (display name, matches played) pairs; duplicate names keep
+                     their highest count
+        """
+        counts = {}
+        for name, match_count in players:
+            if name and isinstance(name, str):
+                counts[name] = max(counts.get(name, 0), int(match_count or 0))
+
+        # Most played first, then alphabetical: a name's position is its rank
+        ranked = sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+        self.names = [name for name, _ in ranked]
+        self.match_counts = np.array([count for _, count in ranked], dtype=np.int64)
+        keys = [normalize_player_name(name) for name in self.names]
+
+        # Every suffix starting at a word boundary, sorted, with its name position
+        suffixes = sorted(
+            (key[start:], position)
+            for position, key in enumerate(keys)
+            for start in [0] + [i + 1 for i, ch in enumerate(key) if ch == ' ']
+        )
+        self._suffixes = [suffix for suffix, _ in suffixes]
+        self._suffix_positions = np.array([position for _, position in suffixes], dtype=np.int32)
+
+        postings = {}
+        for position, key in enumerate(keys):
+            for trigram in _trigrams(key):
+                postings.setdefault(trigram, []).append(position)
+        self._trigrams = {trigram: np.array(positions, dtype=np.int32) for trigram, positions in postings.items()}
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def _prefix_positions(self, key: str) -> np.ndarray:
+        """Name positions having a word that starts with key, best ranked first."""
+        start = bisect_left(self._suffixes, key)
+        # Everything starting with key sorts before key + the highest code point
+        end = bisect_left(self._suffixes, key + '\U0010ffff', lo=start)
+        return np.unique(self._suffix_positions[start:end])
+
+    def _fuzzy_positions(self, key: str, exclude: np.ndarray) -> np.ndarray:
+        """Name positions sharing enough trigrams with key, most similar first."""
+        query_trigrams = _trigrams(key)
+        hits = [self._trigrams[t] for t in query_trigrams if t in self._trigrams]
+        if not hits:
+            return np.empty(0, dtype=np.int32)
+        shared = np.bincount(np.concatenate(hits), minlength=len(self.names))
+        similarity = shared / len(query_trigrams)
+        similarity[exclude] = 0
+        candidates = np.flatnonzero(similarity >= MIN_TRIGRAM_SIMILARITY)
+        # Stable sort keeps the matches-played rank among equally similar names
+        return candidates[np.argsort(-similarity[candidates], kind='stable')]
+
+    def search(self, query: Optional[str], limit: int = 20) -> List[str]:
+        """
+        Find player names for an autocomplete query.
+
+        Args:
+            query: Typed text (any case, accents optional); empty returns the
+                   most played names
+            limit: Maximum number of names
+
+        Returns:
+            Up to limit names: names with a word starting with the query first,
+            then (for queries of 3+ characters) names similar to it, each group
+            ordered by matches played
+        """
+        key = normalize_player_name(query)
+        if not key:
+            return self.names[:limit]
+        positions = self._prefix_positions(key)[:limit]
+        if len(positions) < limit and len(key) >= MIN_FUZZY_QUERY_LENGTH:
+            fuzzy = self._fuzzy_positions(key, positions)
+            positions = np.concatenate([positions, fuzzy[:limit - len(positions)]])
+        return [self.names[position] for position in positions]
+
+
+__all__ = ['PlayerSearchIndex']
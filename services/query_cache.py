@@ -0,0 +1,311 @@
+"""
+Process-wide query result cache, independent of Streamlit.
+
+Results are kept in an LRU that is bounded both by entry count and by an
+estimate of their memory size. Each entry is stored under the database
+file's build fingerprint (inode, size and mtime of the file and its WAL),
+so a rebuilt or incrementally updated database invalidates everything
+cached from it. No wall-clock TTL is involved.
+
+QueryCache works in any process (Streamlit app, test runner, batch job).
+Hit and miss counters are written periodically to the log as a
+"CACHE STATS" section, which PerformanceMetrics aggregates.
+"""
+
+import copy
+import functools
+import inspect
+import os
+import pickle
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+import pandas as pd
+
+from constants import QUERY_CACHE_MAX_ENTRIES, QUERY_CACHE_MAX_BYTES, QUERY_CACHE_STATS_INTERVAL
+from tennis_logging.simplified_factory import log_cache_stats
+
+
+def database_fingerprint(db_path: str) -> Optional[Tuple]:
+    """
+    Fingerprint a database build from its file metadata.
+
+    Args:
+        db_path: Path to the SQLite database file
+
+    Returns:
+        Tuple identifying the current file contents, or None if the file
+        does not exist (nothing is cached then)
+    """
+    parts = []
+    for path in (db_path, db_path + "-wal"):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            if path == db_path:
+                return None
+            continue
+        parts.append((stat.st_ino, stat.st_size, stat.st_mtime_ns))
+    return tuple(parts)
+
+
+def estimate_size(value: Any) -> int:
+    """Approximate memory size of a cached value in bytes."""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, tuple) and any(isinstance(item, pd.DataFrame) for item in value):
+        return sum(estimate_size(item) for item in value)
+    try:
+        return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return sys.getsizeof(value)
+
+
+def _copy_result(value: Any) -> Any:
+    """Copy a result so callers and the cache never share a mutable DataFrame."""
+    if isinstance(value, pd.DataFrame):
+        return value.copy()
+    if isinstance(value, tuple):
+        return tuple(_copy_result(item) for item in value)
+    return copy.copy(value)
+
+
+def _normalize(value: Any, unordered: bool = False) -> Hashable:
+    """Turn a filter argument into a hashable, canonical key part."""
+    if isinstance(value, str):
+        return value.strip()
+    if isinstance(value, (list, tuple, set, frozenset)):
+        items = [_normalize(item) for item in value]
+        if unordered or isinstance(value, (set, frozenset)):
+            items = sorted(items, key=repr)
+        return tuple(items)
+    if isinstance(value, dict):
+        return tuple(sorted((key, _normalize(item)) for key, item in value.items()))
+    return value
+
+
+class QueryCache:
+    """Thread-safe LRU of query results with entry-count and byte limits."""
+
+    def __init__(self, name: str = "query_cache", max_entries: int = QUERY_CACHE_MAX_ENTRIES,
+                 max_bytes: int = QUERY_CACHE_MAX_BYTES, stats_interval: int = QUERY_CACHE_STATS_INTERVAL):
+        """
+        Create an empty cache.
+
+        Args:
+            name: Cache name used in the logged statistics
+            max_entries: Maximum number of cached results
+            max_bytes: Maximum estimated size of all cached results
+            stats_interval: Log the counters every this many lookups (0 disables)
+        """
+        self.name = name
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.stats_interval = stats_interval
+        self._entries = OrderedDict()  # key -> (value, size)
+        self._fingerprints: Dict[str, Tuple] = {}
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    def _check_fingerprint(self, db_path: str, fingerprint: Tuple):
+        """Drop every entry of a database whose build fingerprint changed (lock held)."""
+        known = self._fingerprints.get(db_path)
+        if known == fingerprint:
+            return
+        self._fingerprints[db_path] = fingerprint
+        if known is None:
+            return
+        stale = [key for key in self._entries if key[0] == db_path]
+        for key in stale:
+            _, size = self._entries.pop(key)
+            self._bytes -= size
+        self._invalidations += len(stale)
+
+    def get(self, db_path: str, key: Hashable, default: Any = None) -> Any:
+        """
+        Look up a cached result.
+
+        Args:
+            db_path: Database the result was computed from
+            key: Normalized query key
+            default: Returned on a miss
+
+        Returns:
+            A copy of the cached result, or default
+        """
+        fingerprint = database_fingerprint(db_path)
+        with self._lock:
+            if fingerprint is not None:
+                self._check_fingerprint(db_path, fingerprint)
+            entry = None if fingerprint is None else self._entries.get((db_path, key))
+            if entry is None:
+                self._misses += 1
+            else:
+                self._entries.move_to_end((db_path, key))
+                self._hits += 1
+            log_now = self.stats_interval and (self._hits + self._misses) % self.stats_interval == 0
+        if log_now:
+            self.log_stats()
+        if entry is None:
+            return default
+        # Callers may modify the result (e.g. add DataFrame columns); keep the cached one intact
+        return _copy_result(entry[0])
+
+    def put(self, db_path: str, key: Hashable, value: Any):
+        """
+        Store a result, evicting least recently used entries beyond the limits.
+
+        Args:
+            db_path: Database the result was computed from
+            key: Normalized query key
+            value: Result to cache (a copy is stored)
+        """
+        fingerprint = database_fingerprint(db_path)
+        if fingerprint is None:
+            return
+        value = _copy_result(value)
+        size = estimate_size(value)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            self._check_fingerprint(db_path, fingerprint)
+            old = self._entries.pop((db_path, key), None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._entries[(db_path, key)] = (value, size)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self._evictions += 1
+
+    def clear(self):
+        """Drop all cached results (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self._fingerprints.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Cache counters.
+
+        Returns:
+            Dict with hits, misses, hit_ratio, evictions, invalidations, entries and bytes
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": round(self._hits / lookups, 4) if lookups else 0.0,
+                "evictions": self._evictions,
+                "invalidations": self._invalidations,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+            }
+
+    def log_stats(self, component: str = "query_cache"):
+        """Write the current counters to the log for PerformanceMetrics."""
+        log_cache_stats(self.name, self.stats(), component=component)
+
+
+_caches: Dict[str, QueryCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_query_cache(name: str = "database_service", max_entries: Optional[int] = None,
+                    max_bytes: Optional[int] = None) -> QueryCache:
+    """
+    Return the process-wide cache with this name, creating it on first use.
+
+    Args:
+        name: Cache name (one cache per name per process)
+        max_entries: Maximum cached results (only used when the cache is created)
+        max_bytes: Maximum estimated size of all results (only used when the cache is created)
+
+    Returns:
+        Shared QueryCache
+    """
+    with _caches_lock:
+        cache = _caches.get(name)
+        if cache is None:
+            cache = QueryCache(name, max_entries=max_entries or QUERY_CACHE_MAX_ENTRIES,
+                               max_bytes=max_bytes or QUERY_CACHE_MAX_BYTES)
+            _caches[name] = cache
+        return cache
+
+
+_MISSING = object()
+_call_state = threading.local()
+
+
+def skip_caching():
+    """
+    Keep the result of the running cached_query call out of the cache.
+
+    DatabaseService methods call this where they return a fallback after an
+    error: the fallback is returned to the caller, and the next call queries
+    the database again instead of serving the fallback until the next rebuild.
+    A cached_query call that made the marked call (e.g. a metadata getter
+    falling back to the individual getters) is not cached either.
+    """
+    _call_state.skip = True
+
+
+def cached_query(unordered: Iterable[str] = ()):
+    """
+    Cache a DatabaseService method's result in the service's query cache.
+
+    The key is the method name plus its bound arguments (strings stripped,
+    sequences made hashable, defaults filled in), so equivalent filter
+    combinations share one entry. The instance must have db_path and
+    query_cache attributes. Results of calls that called skip_caching()
+    are returned but not stored.
+
+    Args:
+        unordered: Names of sequence arguments whose order does not change
+                   the result (e.g. surfaces)
+
+    Returns:
+        Method decorator
+    """
+    unordered = frozenset(unordered)
+
+    def decorator(method: Callable) -> Callable:
+        signature = inspect.signature(method)
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            key = (method.__name__,) + tuple(
+                (name, _normalize(value, name in unordered))
+                for name, value in list(bound.arguments.items())[1:]
+            )
+            cache = self.query_cache
+            result = cache.get(self.db_path, key, _MISSING)
+            if result is _MISSING:
+                outer_skip = getattr(_call_state, "skip", False)
+                _call_state.skip = False
+                try:
+                    result = method(self, *args, **kwargs)
+                    skip = _call_state.skip
+                finally:
+                    _call_state.skip = outer_skip or _call_state.skip
+                if not skip:
+                    cache.put(self.db_path, key, result)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+__all__ = ['QueryCache', 'get_query_cache', 'cached_query', 'skip_caching', 'database_fingerprint']
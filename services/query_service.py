@@ -6,13 +6,15 @@ Moved from ui/processing/ for better architectural separation.
 
 import streamlit as st
 import ast
+import asyncio
 from datetime import datetime
-from typing import Optional
+from typing import Any, Optional, Tuple
 from langchain_core.messages import HumanMessage, AIMessage
 from langchain_google_genai import ChatGoogleGenerativeAI
 from tennis_logging.simplified_factory import log_user_query, log_llm_interaction, log_final_response, log_error, log_agent_response_parsing, get_session_id
 from utils.formatters import ConsolidatedFormatter
 from config.config import Config
+from services.answer_cache import AnswerCache
 
 
 class QueryProcessor:
@@ -26,14 +28,17 @@ class QueryProcessor:
     3. process_agent_response() - Processes agent response (called by handle_user_query)
     """
     
-    def __init__(self, data_formatter: ConsolidatedFormatter):
+    def __init__(self, data_formatter: ConsolidatedFormatter, answer_cache: Optional[AnswerCache] = None):
         """
         Initialize the query processor.
         
         Args:
             data_formatter: ConsolidatedFormatter instance for formatting responses
+            answer_cache: Cache of final answers; defaults to the process-wide one
+                          for the configured database
         """
         self.data_formatter = data_formatter
+        self.answer_cache = answer_cache or AnswerCache(Config().db_path)
     
     @staticmethod
     @st.cache_resource
@@ -110,6 +115,20 @@ Summary (one line, max 120 chars):"""
             # Fallback to simple string-based summary if LLM fails
             return self._fallback_summary(response_text, lines)
     
+    async def _agenerate_summary(self, response_text: str) -> Optional[str]:
+        """
+        Generate the summary without blocking the event loop.
+        
+        Args:
+            response_text: The full AI response text
+            
+        Returns:
+            Summary string if response is long enough, None otherwise
+        """
+        # Create the cached LLM on the script thread; the worker thread then reuses it
+        self._get_summary_llm()
+        return await asyncio.to_thread(self._generate_summary, response_text)
+    
     def _fallback_summary(self, response_text: str, lines: list) -> Optional[str]:
         """
         Fallback method for summary generation using string manipulation.
@@ -144,8 +163,20 @@ Summary (one line, max 120 chars):"""
         # Final fallback: take first line
         return lines[0] if lines else None
     
-    def handle_user_query(self, user_question: str, agent_graph):
-        """Handle user query processing and store results in session state."""
+    def handle_user_query(self, user_question: str, agent_graph, response_placeholder=None, progress_placeholder=None):
+        """
+        Handle user query processing and store results in session state.
+        
+        The agent run is streamed: answer tokens are written to response_placeholder
+        as they arrive and tool progress to progress_placeholder, and the summary
+        is generated while the finished answer is already shown.
+        
+        Args:
+            user_question: Question as typed
+            agent_graph: Compiled LangGraph agent
+            response_placeholder: st.empty() slot for the answer as it streams (optional)
+            progress_placeholder: st.empty() slot for agent and tool progress (optional)
+        """
         # Get session ID from session state (set in logging_setup)
         # Use helper function to ensure session ID is always available
         session_id = get_session_id()
@@ -153,42 +184,41 @@ Summary (one line, max 120 chars):"""
         # Log the user query with actual session ID
         log_user_query(user_question, session_id, component="query_service")
         
+        # The config dictionary ensures each user gets their own conversation history.
+        # Use the same session ID for thread_id to maintain conversation context per session
+        config = {"configurable": {"thread_id": session_id}}
+        
+        # Context-free questions answered before (in any session) skip the agent
+        if self._answer_from_cache(user_question, agent_graph, config):
+            return
+        
         with st.spinner("The AI is analyzing your question and querying the database..."):
             try:
                 start_time = datetime.now()
-                
-                # The config dictionary ensures each user gets their own conversation history.
-                # Use the same session ID for thread_id to maintain conversation context per session
-                config = {"configurable": {"thread_id": session_id}}
+                new_conversation = not self._thread_messages(agent_graph, config)
                 
                 # Log the initial LLM interaction
                 log_llm_interaction([HumanMessage(content=user_question)], "INITIAL_USER_QUERY", component="query_service")
                 
-                # Only pass the new message - LangGraph's checkpointer automatically loads
-                # conversation history from memory based on the thread_id in config
-                response = agent_graph.invoke(
-                    {"messages": [HumanMessage(content=user_question)]},
-                    config=config
-                )
+                response, final_answer, summary = asyncio.run(self._run_agent(
+                    user_question, agent_graph, config, response_placeholder, progress_placeholder
+                ))
                 
                 # Log the complete conversation flow
                 log_llm_interaction(response["messages"], "COMPLETE_CONVERSATION_FLOW", component="query_service")
                 
-                # Process the response
-                final_answer = self.process_agent_response(response, user_question)
-                
                 # Calculate total processing time
                 end_time = datetime.now()
                 processing_time = (end_time - start_time).total_seconds()
                 
-                # Generate summary if response is long enough
-                summary = self._generate_summary(final_answer) if final_answer else None
-                
                 # Store response and summary in session state for display
                 st.session_state.ai_query_response = final_answer
                 st.session_state.ai_query_summary = summary
                 
                 if final_answer and final_answer.strip():
+                    # Only a first question's answer is free of earlier context
+                    if new_conversation:
+                        self.answer_cache.store(user_question, response["messages"], final_answer, summary)
                     # Log successful response
                     log_final_response(final_answer, processing_time, component="query_service")
                 else:
@@ -200,6 +230,123 @@ Summary (one line, max 120 chars):"""
                 log_error(e, f"Processing user query: {user_question}", component="query_service")
                 st.error(f"An error occurred while processing your request: {e}")
     
+    async def _run_agent(self, user_question: str, agent_graph, config: dict,
+                         response_placeholder=None, progress_placeholder=None) -> Tuple[dict, str, Optional[str]]:
+        """
+        Stream one agent run, then summarize the answer while it is displayed.
+        
+        Args:
+            user_question: Question as typed
+            agent_graph: Compiled LangGraph agent
+            config: Graph config with the session's thread_id
+            response_placeholder: Slot for the streamed answer (optional)
+            progress_placeholder: Slot for agent and tool progress (optional)
+            
+        Returns:
+            Tuple of (final graph state, final answer, summary or None)
+        """
+        streamed_text = ""
+        agent_step = None
+        
+        # Only pass the new message - LangGraph's checkpointer automatically loads
+        # conversation history from memory based on the thread_id in config
+        async for mode, payload in agent_graph.astream(
+            {"messages": [HumanMessage(content=user_question)]},
+            config=config,
+            stream_mode=["messages", "updates"]
+        ):
+            if mode == "messages":
+                chunk, metadata = payload
+                if metadata.get("langgraph_node") != "agent":
+                    continue
+                # Each agent step starts a new message; only the last one is the answer
+                if metadata.get("langgraph_step") != agent_step:
+                    agent_step = metadata.get("langgraph_step")
+                    streamed_text = ""
+                text = self._message_text(chunk.content)
+                if text:
+                    streamed_text += text
+                    if response_placeholder is not None:
+                        response_placeholder.markdown(streamed_text + " ▌")
+            elif progress_placeholder is not None:
+                for node, update in payload.items():
+                    messages = (update or {}).get("messages", [])
+                    tool_names = [call["name"] for message in messages
+                                  for call in getattr(message, "tool_calls", None) or []]
+                    if node == "agent" and tool_names:
+                        progress_placeholder.caption(f"Running {', '.join(tool_names)}...")
+                    elif node == "tools":
+                        progress_placeholder.caption("Tool results received, writing the answer...")
+        
+        if progress_placeholder is not None:
+            progress_placeholder.empty()
+        
+        # The checkpointed state holds the whole conversation, as invoke() returned it
+        response = {"messages": self._thread_messages(agent_graph, config)}
+        final_answer = self.process_agent_response(response, user_question)
+        
+        # Show the finished answer right away; the summary follows when ready
+        summary_task = asyncio.create_task(self._agenerate_summary(final_answer)) if final_answer else None
+        if response_placeholder is not None and final_answer:
+            response_placeholder.markdown(final_answer)
+        summary = await summary_task if summary_task is not None else None
+        return response, final_answer, summary
+    
+    @staticmethod
+    def _message_text(content: Any) -> str:
+        """Text of a message (chunk) whose content is a string or Gemini's list of parts."""
+        if isinstance(content, str):
+            return content
+        if isinstance(content, list):
+            return "".join(
+                part if isinstance(part, str) else part.get("text", "")
+                for part in content
+                if isinstance(part, (str, dict))
+            )
+        return ""
+    
+    @staticmethod
+    def _thread_messages(agent_graph, config: dict) -> list:
+        """Messages already stored for this conversation thread (empty if unknown)."""
+        try:
+            return agent_graph.get_state(config).values.get("messages", [])
+        except Exception:
+            return []
+    
+    def _answer_from_cache(self, user_question: str, agent_graph, config: dict) -> bool:
+        """
+        Answer a question from the answer cache, without any LLM call.
+        
+        Args:
+            user_question: Question as typed
+            agent_graph: Compiled agent graph (the cached turn is added to its memory)
+            config: Graph config with the session's thread_id
+            
+        Returns:
+            True if the question was answered from the cache
+        """
+        start_time = datetime.now()
+        cached = self.answer_cache.lookup(user_question)
+        if cached is None:
+            return False
+        
+        st.session_state.ai_query_response = cached["answer"]
+        st.session_state.ai_query_summary = cached["summary"]
+        
+        # Keep the conversation memory complete so follow-up questions still have context
+        try:
+            agent_graph.update_state(
+                config,
+                {"messages": [HumanMessage(content=user_question), AIMessage(content=cached["answer"])]},
+                as_node="agent"
+            )
+        except Exception as e:
+            log_error(e, "Adding cached answer to conversation memory", component="query_service")
+        
+        processing_time = (datetime.now() - start_time).total_seconds()
+        log_final_response(cached["answer"], processing_time, component="query_service")
+        return True
+    
     def process_agent_response(self, response: dict, user_question: str = "") -> str:
         """Process and format the agent's response."""
         # The final answer is in the content of the last AIMessage.
@@ -214,8 +361,8 @@ Summary (one line, max 120 chars):"""
         )
         
         if isinstance(last_message.content, list) and last_message.content:
-            # For Gemini, content is a list of dicts. We want the text from the first part.
-            final_answer = last_message.content[0].get("text", "")
+            # For Gemini, content is a list of dicts. A streamed answer arrives in several text parts.
+            final_answer = self._message_text(last_message.content)
             log_agent_response_parsing(
                 step="list_extraction",
                 message_type="AIMessage",
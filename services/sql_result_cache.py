@@ -0,0 +1,169 @@
+"""
+Result cache for the agent's sql_db_query tool.
+
+The agent often re-issues the same SELECT across turns and sessions,
+differing only in whitespace, keyword case, comments or an optional AS.
+canonicalize_sql reduces such variants to one key, and SQLResultCache
+keeps the tool's result text in a QueryCache (LRU, bounded by entry count
+and total bytes, invalidated by a new database build). Results above a
+per-entry byte budget, error results and queries that read the clock or
+random() are returned but never cached.
+
+Each call reports whether it was a hit and how much query time the hit
+saved, for the tool-usage log.
+"""
+
+import re
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from constants import (
+    SQL_RESULT_CACHE_MAX_ENTRIES, SQL_RESULT_CACHE_MAX_BYTES, SQL_RESULT_CACHE_MAX_ENTRY_BYTES
+)
+from services.query_cache import QueryCache, get_query_cache
+
+_TOKEN = re.compile(r"""
+    (?P<comment>--[^\n]*|/\*.*?(?:\*/|$))
+  | (?P<string>'(?:[^']|'')*')
+  | (?P<quoted>"(?:[^"]|"")*"|`[^`]*`|\[[^\]]*\])
+  | (?P<word>[A-Za-z_][A-Za-z0-9_$]*)
+  | (?P<number>(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)
+  | (?P<operator><>|!=|==|<=|>=|\|\||<<|>>)
+  | (?P<space>\s+)
+  | (?P<other>.)
+""", re.VERBOSE | re.DOTALL)
+
+# Operators with more than one spelling in SQLite
+_OPERATOR_ALIASES = {"!=": "<>", "==": "="}
+# Statements whose result only depends on the database contents
+_READ_ONLY_STATEMENTS = ("select", "with", "values")
+# Results that also depend on the clock or on randomness: 'now' and the
+# date functions called without arguments (today), CURRENT_* and random()
+_VOLATILE_SQL = re.compile(r"""
+    '(?i:now)'
+  | \b(?:current_date|current_time|current_timestamp|random|randomblob)\b
+  | \b(?:date|time|datetime|julianday|unixepoch)\s\(\s\)
+""", re.VERBOSE)
+
+
+def canonicalize_sql(query: str) -> str:
+    """
+    Reduce a query to a canonical form for use as a cache key.
+
+    Comments and whitespace are dropped, bare keywords and identifiers are
+    lowercased (SQLite treats them case-insensitively), the optional AS
+    keyword is removed, operator spellings are unified and numeric literals
+    are written in one form. String literals and quoted identifiers are
+    kept verbatim.
+
+    Args:
+        query: SQL as written by the agent
+
+    Returns:
+        Canonical SQL (tokens separated by single spaces)
+    """
+    tokens = []
+    for match in _TOKEN.finditer(query or ""):
+        kind, text = match.lastgroup, match.group()
+        if kind in ("comment", "space"):
+            continue
+        if kind == "word":
+            text = text.lower()
+            if text == "as":
+                continue
+        elif kind == "number":
+            text = str(int(text)) if text.isdigit() else repr(float(text))
+        elif kind == "operator":
+            text = _OPERATOR_ALIASES.get(text, text)
+        tokens.append(text)
+    while tokens and tokens[-1] == ";":
+        tokens.pop()
+    return " ".join(tokens)
+
+
+def is_cacheable_query(canonical_sql: str) -> bool:
+    """Return True for a single read-only statement that does not read the clock or random()."""
+    return (canonical_sql.startswith(_READ_ONLY_STATEMENTS) and ";" not in canonical_sql.split()
+            and not _VOLATILE_SQL.search(canonical_sql))
+
+
+class SQLResultCache:
+    """Cache of sql_db_query results keyed by canonical SQL."""
+
+    def __init__(self, db_path: str, cache: Optional[QueryCache] = None,
+                 max_entry_bytes: int = SQL_RESULT_CACHE_MAX_ENTRY_BYTES):
+        """
+        Create the cache.
+
+        Args:
+            db_path: Database the agent queries (SQLAlchemy URI or file path);
+                     its build fingerprint invalidates the cache
+            cache: Store for the results; defaults to the process-wide
+                   "sql_result_cache"
+            max_entry_bytes: Results larger than this are not cached
+        """
+        if db_path.startswith("sqlite:///"):
+            db_path = db_path.replace("sqlite:///", "")
+        elif db_path.startswith("sqlite://"):
+            db_path = db_path.replace("sqlite://", "")
+        self.db_path = db_path
+        self.cache = cache or get_query_cache(
+            "sql_result_cache", SQL_RESULT_CACHE_MAX_ENTRIES, SQL_RESULT_CACHE_MAX_BYTES
+        )
+        self.max_entry_bytes = max_entry_bytes
+        self._lock = threading.Lock()
+        self._time_saved = 0.0
+
+    def run(self, query: str, execute: Callable[[], Any]) -> Tuple[Any, Dict[str, Any]]:
+        """
+        Return a query's result from the cache, or execute it and cache the result.
+
+        Args:
+            query: SQL passed to the tool
+            execute: Runs the query (the tool invocation) and returns its result
+
+        Returns:
+            Tuple of (result, cache details for log_tool_usage: hit, time_saved,
+            hit_ratio, total_time_saved)
+        """
+        key = canonicalize_sql(query)
+        if not is_cacheable_query(key):
+            return execute(), self._details(False, 0.0)
+
+        cached = self.cache.get(self.db_path, key)
+        if cached is not None:
+            result, query_seconds = cached
+            with self._lock:
+                self._time_saved += query_seconds
+            return result, self._details(True, query_seconds)
+
+        start = time.perf_counter()
+        result = execute()
+        query_seconds = time.perf_counter() - start
+        # The tool reports SQL errors as text; those must be retried, not cached
+        text = str(result)
+        if not text.startswith("Error:") and len(text.encode("utf-8")) <= self.max_entry_bytes:
+            self.cache.put(self.db_path, key, (result, query_seconds))
+        return result, self._details(False, 0.0)
+
+    def _details(self, hit: bool, time_saved: float) -> Dict[str, Any]:
+        """Cache details of one call plus the cumulative counters."""
+        with self._lock:
+            total_time_saved = self._time_saved
+        return {
+            "hit": hit,
+            "time_saved": round(time_saved, 6),
+            "hit_ratio": self.cache.stats()["hit_ratio"],
+            "total_time_saved": round(total_time_saved, 6),
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache counters plus the total query time saved by hits."""
+        stats = self.cache.stats()
+        with self._lock:
+            stats["time_saved"] = round(self._time_saved, 6)
+        return stats
+
+
+__all__ = ['SQLResultCache', 'canonicalize_sql', 'is_cacheable_query']
@@ -0,0 +1,104 @@
+"""
+Player Name Resolution
+Normalizes player names and resolves them to (tour, player_id) through the
+player_names table built by load_data.
+
+Names are lower-cased, accent-folded and stripped of punctuation, so
+"Stan Wawrinka", "stan  WAWRINKA" and "Stan Wawrinka." share one key, as
+do "Iga Świątek" and "iga swiatek". The same normalizer is used when the
+table is built and when a name is looked up.
+"""
+
+import re
+import sqlite3
+import unicodedata
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+PLAYER_NAMES_TABLE = "player_names"
+
+# Letters that do not decompose into a base letter + combining mark under NFKD
+_FOLDED_LETTERS = str.maketrans({
+    'ł': 'l', 'ø': 'o', 'đ': 'd', 'ð': 'd', 'þ': 'th', 'ß': 'ss',
+    'æ': 'ae', 'œ': 'oe', 'ı': 'i',
+})
+_PUNCTUATION = re.compile(r"[.,'’`\"()]")
+_SEPARATORS = re.compile(r"[\s\-_/]+")
+
+
+@lru_cache(maxsize=4096)
+def normalize_player_name(name: Optional[str]) -> str:
+    """
+    Normalize a player name for lookups.
+
+    Args:
+        name: Player name as typed or stored
+
+    Returns:
+        Lower-cased, accent-folded name with punctuation removed and
+        single spaces between words ('' for missing names)
+    """
+    if not name or not isinstance(name, str):
+        return ''
+    folded = unicodedata.normalize('NFKD', name.casefold())
+    folded = ''.join(ch for ch in folded if not unicodedata.combining(ch))
+    folded = _PUNCTUATION.sub('', folded.translate(_FOLDED_LETTERS))
+    return _SEPARATORS.sub(' ', folded).strip()
+
+
+def resolve_player_ids(conn: sqlite3.Connection, name: str) -> Optional[List[Tuple[str, int]]]:
+    """
+    Resolve a player name to (tour, player_id) pairs.
+
+    Args:
+        conn: SQLite connection to the tennis database
+        name: Player name (any case, with or without accents, or a known alias)
+
+    Returns:
+        List of (tour, player_id), most matches played first (several entries
+        only for players sharing a name); [] if the name is unknown; None if
+        the database has no player_names table (built before name resolution)
+    """
+    key = normalize_player_name(name)
+    if not key:
+        return []
+    try:
+        rows = conn.execute(
+            f"""
+            SELECT tour, player_id
+            FROM {PLAYER_NAMES_TABLE}
+            WHERE name_key = ?
+            GROUP BY tour, player_id
+            ORDER BY MAX(match_count) DESC, player_id
+            """,
+            (key,)
+        ).fetchall()
+    except sqlite3.OperationalError:
+        return None
+    return [(tour, int(player_id)) for tour, player_id in rows]
+
+
+def player_id_condition(ids: List[Tuple[str, int]], id_column: str = "player_id",
+                        tour_column: str = "tour") -> Tuple[str, list]:
+    """
+    Build a WHERE condition matching any of the resolved players.
+
+    Args:
+        ids: (tour, player_id) pairs from resolve_player_ids
+        id_column: Player id column (may be qualified, e.g. 'pm.player_id')
+        tour_column: Tour column next to it
+
+    Returns:
+        Tuple of (SQL condition, parameters)
+    """
+    condition = " OR ".join(f"({id_column} = ? AND {tour_column} = ?)" for _ in ids)
+    params = [value for tour, player_id in ids for value in (player_id, tour)]
+    return f"({condition})", params
+
+
+__all__ = [
+    'PLAYER_NAMES_TABLE',
+    'normalize_player_name',
+    'resolve_player_ids',
+    'player_id_condition',
+]
@@ -0,0 +1,296 @@
+"""
+Schema Digest
+Compact description of the tennis database for the agent's system prompt.
+
+SQLDatabase.get_table_info() emits the full CREATE TABLE text plus sample
+rows of every table, and the system prompt is resent on every agent turn.
+The digest says the same in far fewer tokens:
+
+- one line per table with its plain columns
+- repeated column families folded into one line (winner_/loser_, w_/l_,
+  p_/o_, player_/opponent_, set1..set5)
+- the values of low-cardinality text columns, e.g. surface[Carpet|Clay|Grass|Hard]
+- year ranges and the join keys between tables
+
+The digest is built by load_data after the indexes (the value scans are
+too slow for app startup) and stored in the _schema_digest table, together
+with the token estimate of the full table info it replaces, so startup can
+report the saving without generating the full text.
+"""
+
+import math
+import re
+import sqlite3
+from typing import Dict, List, Optional, Tuple
+
+SCHEMA_DIGEST_TABLE = "_schema_digest"
+
+# Text columns with at most this many distinct values are listed with their values
+ENUM_MAX_VALUES = 12
+# Values longer than this are not worth spelling out
+ENUM_MAX_VALUE_LENGTH = 24
+# Sample rows per table and value length in SQLDatabase.get_table_info()
+TABLE_INFO_SAMPLE_ROWS = 3
+TABLE_INFO_MAX_VALUE_LENGTH = 100
+# Names, dates and ids are never listed, even when a small database has few of them
+_NOT_ENUMERATED = re.compile(r"(name|name_first|name_last|_id|date|dob|score|source_file|_key)$")
+# Column families sharing the same suffixes, folded into one line
+PAIRED_PREFIXES = [("winner_", "loser_"), ("player_", "opponent_"), ("w_", "l_"), ("p_", "o_")]
+
+_NUMBERED_COLUMN = re.compile(r"^([A-Za-z]+)(\d+)(.*)$")
+
+TABLE_NOTES = {
+    'matches': "one row per singles match",
+    'player_matches': "one row per player per match, from that player's side",
+    'player_aggregates': "pre-summed counters per player/tour/year/surface/level",
+    'player_names': "normalized name_key -> tour, player_id",
+    'atp_players': "ATP player metadata",
+    'wta_players': "WTA player metadata",
+    'atp_rankings': "ATP weekly rankings",
+    'wta_rankings': "WTA weekly rankings",
+}
+
+# (left table, right table, join condition)
+JOIN_KEYS = [
+    ('player_matches', 'matches', "player_matches.match_id = matches.match_id"),
+    ('matches', 'atp_players', "matches.winner_id|loser_id = atp_players.player_id (tour 'ATP')"),
+    ('matches', 'wta_players', "matches.winner_id|loser_id = wta_players.player_id (tour 'WTA')"),
+    ('player_matches', 'player_names', "player_matches.player_id|opponent_id + tour = player_names.player_id + tour"),
+    ('player_aggregates', 'player_names', "player_aggregates.player_id + tour = player_names.player_id + tour"),
+    ('atp_rankings', 'atp_players', "atp_rankings.player = atp_players.player_id"),
+    ('wta_rankings', 'wta_players', "wta_rankings.player = wta_players.player_id"),
+]
+
+
+def estimate_tokens(text: Optional[str]) -> int:
+    """
+    Estimate the LLM token count of a text (about 4 characters per token).
+
+    Args:
+        text: Prompt text
+
+    Returns:
+        Approximate number of input tokens
+    """
+    return math.ceil(len(text or "") / 4)
+
+
+def _quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _user_tables(conn: sqlite3.Connection) -> List[str]:
+    """Tables the agent may query (internal and SQLite tables excluded)."""
+    rows = conn.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'table' "
+        "AND name NOT LIKE 'sqlite%' AND name NOT LIKE '\\_%' ESCAPE '\\' ORDER BY name"
+    ).fetchall()
+    known = list(TABLE_NOTES)
+    return sorted((row[0] for row in rows), key=lambda t: (known.index(t) if t in known else len(known), t))
+
+
+def _column_annotations(conn: sqlite3.Connection, table: str, columns: List[Tuple[str, str]]) -> Dict[str, str]:
+    """Value lists of low-cardinality text columns and ranges of year columns."""
+    annotations = {}
+    for name, col_type in columns:
+        column = _quote(name)
+        if col_type.upper() == 'TEXT' and not _NOT_ENUMERATED.search(name):
+            values = [row[0] for row in conn.execute(
+                f"SELECT DISTINCT {column} FROM {_quote(table)} WHERE {column} IS NOT NULL LIMIT ?",
+                (ENUM_MAX_VALUES + 1,)
+            )]
+            if 0 < len(values) <= ENUM_MAX_VALUES and all(len(str(v)) <= ENUM_MAX_VALUE_LENGTH for v in values):
+                annotations[name] = "|".join(sorted(str(v) for v in values))
+        elif col_type.upper() == 'INTEGER' and name.endswith('year'):
+            low, high = conn.execute(f"SELECT MIN({column}), MAX({column}) FROM {_quote(table)}").fetchone()
+            if low is not None:
+                annotations[name] = f"{low}..{high}"
+    return annotations
+
+
+def _merge_values(*annotations: Optional[str]) -> Optional[str]:
+    """Union of value lists (ranges are kept from the first column)."""
+    present = [a for a in annotations if a]
+    if not present:
+        return None
+    if ".." in present[0]:
+        return present[0]
+    values = sorted({value for a in present for value in a.split("|")})
+    return "|".join(values) if len(values) <= ENUM_MAX_VALUES else None
+
+
+def _with_values(name: str, values: Optional[str]) -> str:
+    return f"{name}[{values}]" if values else name
+
+
+def describe_table(conn: sqlite3.Connection, table: str) -> str:
+    """
+    Describe one table in a few lines.
+
+    Args:
+        conn: SQLite connection
+        table: Table name
+
+    Returns:
+        Digest lines of the table
+    """
+    columns = [(row[1], row[2] or '') for row in conn.execute(f"PRAGMA table_info({_quote(table)})")]
+    names = [name for name, _ in columns]
+    annotations = _column_annotations(conn, table, columns)
+    used = set()
+    groups = []
+
+    # winner_name/loser_name, w_ace/l_ace, ...: one line per family
+    for first, second in PAIRED_PREFIXES:
+        seconds = {name[len(second):] for name in names if name.startswith(second) and name not in used}
+        suffixes = [name[len(first):] for name in names
+                    if name.startswith(first) and name not in used and name[len(first):] in seconds]
+        if len(suffixes) < 2:
+            continue
+        used.update(first + s for s in suffixes)
+        used.update(second + s for s in suffixes)
+        parts = [_with_values(s, _merge_values(annotations.get(first + s), annotations.get(second + s)))
+                 for s in suffixes]
+        groups.append(f"  {first}|{second}: {', '.join(parts)}")
+
+    # set1 .. set5, set1_w_games .. set5_w_games: one line per numbered family
+    numbered = {}
+    for name in names:
+        match = _NUMBERED_COLUMN.match(name)
+        if match and name not in used:
+            prefix, number, suffix = match.groups()
+            numbered.setdefault(prefix, {}).setdefault(suffix, []).append(int(number))
+    for prefix, suffixes in numbered.items():
+        numbers = sorted({n for ns in suffixes.values() for n in ns})
+        if len(numbers) < 3:
+            continue
+        used.update(f"{prefix}{n}{suffix}" for suffix, ns in suffixes.items() for n in ns)
+        parts = [f"{prefix}N{suffix}" for suffix in suffixes]
+        groups.append(f"  {prefix}N (N={numbers[0]}-{numbers[-1]}): {', '.join(parts)}")
+
+    plain = [_with_values(name, annotations.get(name)) for name in names if name not in used]
+    note = TABLE_NOTES.get(table)
+    header = f"{table}" + (f" ({note})" if note else "") + f": {', '.join(plain)}"
+    return "\n".join([header] + groups)
+
+
+def build_schema_digest(conn: sqlite3.Connection) -> str:
+    """
+    Build the digest of every queryable table.
+
+    Args:
+        conn: SQLite connection to a built database
+
+    Returns:
+        Digest text for the system prompt
+    """
+    tables = _user_tables(conn)
+    lines = [describe_table(conn, table) for table in tables]
+    joins = [condition for left, right, condition in JOIN_KEYS if left in tables and right in tables]
+    if joins:
+        lines.append("Joins: " + "; ".join(joins))
+    lines.append("Dates: tourney_date/ranking_date are TEXT 'YYYY-MM-DD HH:MM:SS'; "
+                 "[a|b] = all values of a column, [x..y] = value range")
+    return "\n".join(lines)
+
+
+def full_table_info(conn: sqlite3.Connection) -> str:
+    """
+    Approximate the text of SQLDatabase.get_table_info() for every table.
+
+    Uses the stored CREATE TABLE statements and the first sample rows of each
+    table, in the same layout, so its token estimate matches the full info
+    the digest replaces.
+
+    Args:
+        conn: SQLite connection
+
+    Returns:
+        Full table info text
+    """
+    parts = []
+    rows = conn.execute(
+        "SELECT name, sql FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite%' ORDER BY name"
+    ).fetchall()
+    for table, create_sql in rows:
+        cursor = conn.execute(f"SELECT * FROM {_quote(table)} LIMIT ?", (TABLE_INFO_SAMPLE_ROWS,))
+        header = "\t".join(column[0] for column in cursor.description)
+        samples = "\n".join("\t".join(str(value)[:TABLE_INFO_MAX_VALUE_LENGTH] for value in row) for row in cursor)
+        parts.append(f"\n{create_sql}\n\n/*\n{TABLE_INFO_SAMPLE_ROWS} rows from {table} table:\n"
+                     f"{header}\n{samples}\n*/")
+    return "\n\n".join(parts)
+
+
+def write_schema_digest(conn: sqlite3.Connection) -> str:
+    """
+    Build the digest and store it in the database with the token estimate
+    of the full table info.
+
+    Args:
+        conn: SQLite connection to a built database
+
+    Returns:
+        The stored digest
+    """
+    digest = build_schema_digest(conn)
+    full_info_tokens = estimate_tokens(full_table_info(conn))
+    # Recreated on every build (databases from older builds lack full_info_tokens)
+    conn.execute(f"DROP TABLE IF EXISTS {SCHEMA_DIGEST_TABLE}")
+    conn.execute(f"CREATE TABLE {SCHEMA_DIGEST_TABLE} (name TEXT PRIMARY KEY, digest TEXT, full_info_tokens INTEGER)")
+    conn.execute(f"INSERT INTO {SCHEMA_DIGEST_TABLE} (name, digest, full_info_tokens) VALUES ('schema', ?, ?)",
+                 (digest, full_info_tokens))
+    conn.commit()
+    return digest
+
+
+def _read_digest_row(db_path: str, column: str) -> Optional[Tuple]:
+    """Read one column of the stored digest row (None if absent)."""
+    if db_path.startswith("sqlite:///"):
+        db_path = db_path.replace("sqlite:///", "")
+    elif db_path.startswith("sqlite://"):
+        db_path = db_path.replace("sqlite://", "")
+    try:
+        conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    except sqlite3.Error:
+        return None
+    try:
+        return conn.execute(f"SELECT {column} FROM {SCHEMA_DIGEST_TABLE} WHERE name = 'schema'").fetchone()
+    except sqlite3.Error:
+        return None
+    finally:
+        conn.close()
+
+
+def read_schema_digest(db_path: str) -> Optional[str]:
+    """
+    Read the stored digest.
+
+    Args:
+        db_path: Database file path or sqlite:/// URI
+
+    Returns:
+        Digest text, or None if the database predates the digest
+    """
+    row = _read_digest_row(db_path, "digest")
+    return row[0] if row else None
+
+
+def read_full_info_tokens(db_path: str) -> Optional[int]:
+    """
+    Read the token estimate of the full table info stored with the digest.
+
+    Args:
+        db_path: Database file path or sqlite:/// URI
+
+    Returns:
+        Estimated tokens, or None if the database predates the estimate
+    """
+    row = _read_digest_row(db_path, "full_info_tokens")
+    return row[0] if row else None
+
+
+
+__all__ = [
+    'build_schema_digest', 'write_schema_digest', 'read_schema_digest', 'read_full_info_tokens',
+    'full_table_info', 'estimate_tokens', 'SCHEMA_DIGEST_TABLE'
+]
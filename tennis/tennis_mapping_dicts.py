@@ -162,6 +162,26 @@ COMBINED_TOURNAMENT_MAPPINGS = {
     "paris": {"atp": "Paris Masters", "wta": "Paris"}
 }
 
+# Nicknames and alternative spellings -> name as stored in the database.
+# Keys are normalized (see tennis.player_names.normalize_player_name).
+PLAYER_NAME_ALIASES = {
+    "rafa": "Rafael Nadal", "rafa nadal": "Rafael Nadal",
+    "fedex": "Roger Federer", "federer": "Roger Federer",
+    "nole": "Novak Djokovic", "djokovic": "Novak Djokovic",
+    "stan the man": "Stan Wawrinka", "stanislas wawrinka": "Stan Wawrinka",
+    "delpo": "Juan Martin del Potro", "del potro": "Juan Martin del Potro",
+    "muzza": "Andy Murray",
+    "sampras": "Pete Sampras", "pistol pete": "Pete Sampras",
+    "agassi": "Andre Agassi",
+    "serena": "Serena Williams", "venus": "Venus Williams",
+    "steffi": "Steffi Graf", "stefanie graf": "Steffi Graf",
+    "aga": "Agnieszka Radwanska",
+    "iga": "Iga Swiatek",
+    "sabalenka": "Aryna Sabalenka",
+    "alcaraz": "Carlos Alcaraz", "carlitos": "Carlos Alcaraz",
+    "sinner": "Jannik Sinner",
+}
+
 # =============================================================================
 # EXPORTS
 # =============================================================================
@@ -173,6 +193,7 @@ __all__ = [
     'HAND_MAPPINGS',
     'GRAND_SLAM_MAPPINGS',
     'TOURNEY_LEVEL_MAPPINGS',
-    'COMBINED_TOURNAMENT_MAPPINGS'
+    'COMBINED_TOURNAMENT_MAPPINGS',
+    'PLAYER_NAME_ALIASES'
 ]
 
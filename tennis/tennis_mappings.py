@@ -7,9 +7,13 @@ from langchain_core.tools import tool
 from typing import List
 from functools import lru_cache
 import json
+import sqlite3
+from constants import DEFAULT_DB_PATH
+from services.connection_pool import get_connection_pool
 from .ranking_analysis import (
     get_ranking_context
 )
+from .player_names import PLAYER_NAMES_TABLE, resolve_player_ids
 from .tennis_mapping_dicts import (
     ROUND_MAPPINGS,
     SURFACE_MAPPINGS,
@@ -79,6 +83,40 @@ def _get_tournament_mapping(tournament: str) -> str:
     
     return json.dumps({"database_name": tournament, "type": "unknown"})
 
+def _resolve_player_name(player_name: str, db_path: str) -> str:
+    """Resolve a player name to tour/player_id candidates (not cached: reads the database)."""
+    db_file = db_path.replace("sqlite:///", "").replace("sqlite://", "")
+    try:
+        # Read-only pooled connection: a missing file is an error, not a new empty database
+        with get_connection_pool(db_file).connection() as conn:
+            ids = resolve_player_ids(conn, player_name)
+            if not ids:
+                return json.dumps({"player_name": player_name, "players": [],
+                                   "type": "unknown" if ids == [] else "no_name_index"})
+            players = []
+            for tour, player_id in ids:
+                row = conn.execute(
+                    f"""
+                    SELECT display_name, match_count FROM {PLAYER_NAMES_TABLE}
+                    WHERE player_id = ? AND tour = ?
+                    ORDER BY name_source = 'players' DESC LIMIT 1
+                    """,
+                    (player_id, tour)
+                ).fetchone()
+                players.append({"tour": tour, "player_id": player_id,
+                                "name": row[0] if row else player_name, "matches": row[1] if row else 0})
+    except (sqlite3.Error, TimeoutError) as e:
+        return json.dumps({"player_name": player_name, "players": [], "type": "error", "error": str(e)})
+    
+    return json.dumps({
+        "player_name": player_name,
+        "players": players,
+        "type": "tennis_player",
+        "sql_pattern": "player_matches/player_aggregates: WHERE player_id = <player_id> AND tour = '<tour>'; "
+                       "atp_rankings/wta_rankings: WHERE player = <player_id>; "
+                       "matches: WHERE (winner_id = <player_id> OR loser_id = <player_id>) AND tour = '<tour>'"
+    })
+
 # =============================================================================
 # TENNIS MAPPING TOOLS
 # =============================================================================
@@ -264,10 +302,34 @@ class TennisMappingTools:
         return get_grand_slam_tournament_names
     
     @staticmethod
-    def create_all_mapping_tools() -> List:
+    def create_player_resolution_tool(db_path: str = DEFAULT_DB_PATH):
+        """Create the player name resolution tool."""
+        @tool
+        def resolve_player_name(player_name: str) -> str:
+            """
+            Resolve a player name to its tour and integer player_id.
+            Ignores case, accents and punctuation and knows common nicknames (e.g. 'rafa', 'nole').
+            Use the returned player_id in SQL instead of comparing names.
+            
+            Args:
+                player_name: The player name to look up (e.g., 'Rafael Nadal', 'iga swiatek', 'rafa')
+                
+            Returns:
+                JSON string with matching players (tour, player_id, name, matches played)
+                and the SQL pattern for querying by id
+            """
+            return _resolve_player_name(player_name, db_path)
+        
+        return resolve_player_name
+    
+    @staticmethod
+    def create_all_mapping_tools(db_path: str = DEFAULT_DB_PATH) -> List:
         """
         Create all tennis mapping tools using the correct, decorated methods.
         
+        Args:
+            db_path: Database path or SQLAlchemy URI for the tools that read the database
+        
         Returns:
             List of all mapping tools compatible with LangChain.
         """
@@ -280,7 +342,8 @@ class TennisMappingTools:
             TennisMappingTools.create_grand_slam_mapping_tool(),
             TennisMappingTools.create_ranking_analysis_tool(),
             TennisMappingTools.create_ranking_sql_tool(),
-            TennisMappingTools.create_ranking_parameters_tool()
+            TennisMappingTools.create_ranking_parameters_tool(),
+            TennisMappingTools.create_player_resolution_tool(db_path)
         ]
 
 # =============================================================================
@@ -85,16 +85,31 @@ class TennisPromptBuilder:
         - wta_players: WTA player metadata (handedness, nationality, height, birth date)
         - atp_rankings: ATP historical ranking data (1973-2024)
         - wta_rankings: WTA historical ranking data (1973-2024)
+        - player_matches: One row per player per match (match_id joins to matches), seen from that player's side:
+          player_name, opponent_name, is_winner (1/0), result ('W'/'L'), event_year, tourney_name, surface, round,
+          p_* = the player's serve stats, o_* = the opponent's serve stats (e.g. p_ace, o_bpFaced)
+          * For a single player's record use player_matches WHERE player_name COLLATE NOCASE = '...'
+            instead of (winner_name = ... OR loser_name = ...) - it is indexed and much faster
+        - player_aggregates: Pre-summed counters per player_name, tour, event_year, surface, tourney_level:
+          matches, wins, losses, aces, double_faults, serve_points, first_serves_in, first_serve_points_won,
+          second_serve_points_won, service_games, break_points_saved, break_points_faced, return_points,
+          return_points_won, break_point_chances, break_points_converted
+          * Use it for career/season totals and percentages (e.g. win % = SUM(wins) * 100.0 / SUM(matches))
+            instead of GROUP BY over matches; it has no opponent, tournament or round breakdown
+        - player_names: Normalized player name (name_key: lower-case, no accents) -> tour, player_id
+          * Looked up by the resolve_player_name tool; query by player_id (plus tour) once a player is resolved
         - Note: For ranking queries, use UNION to combine ATP and WTA data when tour is not specified
 
         CRITICAL: FOCUS ON SINGLES MATCHES ONLY:
-        - ALL queries should use ONLY the matches table (singles matches)
+        - ALL queries should use ONLY the matches table (singles matches) or player_matches (the same matches, one row per player)
         - The database contains singles match data in the matches table
         - Focus exclusively on singles tennis matches for all queries
 
         QUERY OPTIMIZATION:
         - Use event_year, event_month for date filtering (faster than tourney_date)
         - Use set1, set2, set3, set4, set5 for score analysis (parsed from score column)
+        - Use numeric setN_w_games / setN_l_games (games won by winner/loser in set N), setN_tiebreak
+          (loser's tiebreak points) and total_games for game counts instead of parsing score strings
         - Use tour column to filter ATP vs WTA matches
         - Use tourney_level for tournament importance filtering
 
@@ -116,6 +131,9 @@ class TennisPromptBuilder:
         - get_tennis_tour_mapping: Converts tour names (e.g., "atp" → "ATP", "wta" → "WTA")
         - get_tennis_hand_mapping: Converts hand names (e.g., "right-handed" → "R")
         - get_grand_slam_tournament_names: Returns all Grand Slam tournament names for queries
+        - resolve_player_name: Resolves a player name or nickname (e.g., "rafa", "iga swiatek") to tour and player_id
+          * Resolve each player once, then filter by id: player_matches WHERE player_id = ? AND tour = ?,
+            rankings WHERE player = ? - faster than name comparisons and robust to spelling/accents
 
         COLLATE NOCASE REQUIREMENT (CRITICAL):
         - MUST be used for ALL player name and tournament name comparisons
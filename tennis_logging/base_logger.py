@@ -119,7 +119,7 @@ class BaseLogger:
             "component": component
         })
     
-    def log_tool_usage(self, tool_name: str, tool_input: Any, tool_output: Any, execution_time: Optional[float] = None, component: Optional[str] = None) -> None:
+    def log_tool_usage(self, tool_name: str, tool_input: Any, tool_output: Any, execution_time: Optional[float] = None, component: Optional[str] = None, cache: Optional[Dict[str, Any]] = None) -> None:
         """Log tool usage.
         
         Args:
@@ -128,16 +128,20 @@ class BaseLogger:
             tool_output: Output from the tool
             execution_time: Execution time in seconds
             component: Component/module name where logging occurs
+            cache: Result cache details (hit, time_saved, hit_ratio, total_time_saved), if cached
         """
         if not self._is_logging_enabled():
             return
-        self._log_section("TOOL USAGE", {
+        data = {
             "tool_name": tool_name,
             "tool_input": tool_input,
             "tool_output": tool_output,
             "execution_time": execution_time,
             "component": component
-        })
+        }
+        if cache is not None:
+            data["cache"] = cache
+        self._log_section("TOOL USAGE", data)
     
     def log_final_response(self, response: str, processing_time: Optional[float] = None, component: Optional[str] = None) -> None:
         """Log final responses.
@@ -155,6 +159,22 @@ class BaseLogger:
             "component": component
         })
     
+    def log_cache_stats(self, cache_name: str, stats: Dict[str, Any], component: Optional[str] = None) -> None:
+        """Log cumulative cache counters.
+        
+        Args:
+            cache_name: Name of the cache (e.g., "database_service")
+            stats: Counters such as hits, misses, hit_ratio, evictions, entries, bytes
+            component: Component/module name where logging occurs
+        """
+        if not self._is_logging_enabled():
+            return
+        self._log_section("CACHE STATS", {
+            "cache_name": cache_name,
+            **stats,
+            "component": component
+        })
+    
     def log_error(self, error: Exception, context: str = "", component: Optional[str] = None) -> None:
         """Log errors with full context and stack trace.
         
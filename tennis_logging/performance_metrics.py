@@ -59,11 +59,15 @@ class PerformanceMetrics:
                     tool_name = data.get("tool_name", "unknown")
                     component = data.get("component", "unknown")
                     
+                    cache = data.get("cache") or {}
+                    
                     self.metrics["tool_usage"].append({
                         "timestamp": timestamp,
                         "execution_time": float(execution_time),
                         "tool_name": tool_name,
-                        "component": component
+                        "component": component,
+                        "cache_hit": bool(cache.get("hit", False)),
+                        "time_saved": float(cache.get("time_saved", 0.0))
                     })
             
             # Extract final response processing times
@@ -77,6 +81,21 @@ class PerformanceMetrics:
                         "processing_time": float(processing_time),
                         "component": component
                     })
+            
+            # Extract cache counters (cumulative per process, logged periodically)
+            elif section == "CACHE STATS":
+                hits = data.get("hits")
+                misses = data.get("misses")
+                if hits is not None and misses is not None:
+                    self.metrics["cache_stats"].append({
+                        "timestamp": timestamp,
+                        "cache_name": data.get("cache_name", "unknown"),
+                        "hits": int(hits),
+                        "misses": int(misses),
+                        "evictions": int(data.get("evictions", 0)),
+                        "entries": int(data.get("entries", 0)),
+                        "component": data.get("component", "unknown")
+                    })
     
     def _extract_operation_type(self, sql_query: str) -> str:
         """Extract SQL operation type from query.
@@ -137,7 +156,9 @@ class PerformanceMetrics:
                 "average_time": 0.0,
                 "min_time": 0.0,
                 "max_time": 0.0,
-                "total_time": 0.0
+                "total_time": 0.0,
+                "cache_hits": 0,
+                "time_saved": 0.0
             }
         
         execution_times = [t["execution_time"] for t in tools]
@@ -148,6 +169,8 @@ class PerformanceMetrics:
             "min_time": min(execution_times),
             "max_time": max(execution_times),
             "total_time": sum(execution_times),
+            "cache_hits": sum(1 for t in tools if t.get("cache_hit")),
+            "time_saved": sum(t.get("time_saved", 0.0) for t in tools),
             "tools": self._aggregate_by_field(tools, "tool_name", "execution_time"),
             "components": self._count_by_field(tools, "component")
         }
@@ -179,6 +202,40 @@ class PerformanceMetrics:
             "components": self._count_by_field(responses, "component")
         }
     
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get cache hit/miss statistics.
+        
+        Counters are cumulative within a process, so the latest snapshot of
+        each cache is used.
+        
+        Returns:
+            Dictionary with totals and per-cache counters
+        """
+        latest = {}
+        for snapshot in self.metrics["cache_stats"]:
+            latest[snapshot["cache_name"]] = snapshot
+        
+        hits = sum(s["hits"] for s in latest.values())
+        misses = sum(s["misses"] for s in latest.values())
+        lookups = hits + misses
+        
+        return {
+            "total_lookups": lookups,
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": hits / lookups if lookups else 0.0,
+            "caches": {
+                name: {
+                    "hits": s["hits"],
+                    "misses": s["misses"],
+                    "hit_ratio": s["hits"] / (s["hits"] + s["misses"]) if s["hits"] + s["misses"] else 0.0,
+                    "evictions": s["evictions"],
+                    "entries": s["entries"]
+                }
+                for name, s in latest.items()
+            }
+        }
+    
     def get_overall_stats(self) -> Dict[str, Any]:
         """Get overall performance statistics.
         
@@ -195,6 +252,7 @@ class PerformanceMetrics:
             "database_queries": db_stats,
             "tool_usage": tool_stats,
             "response_processing": response_stats,
+            "cache": self.get_cache_stats(),
             "total_processing_time": total_time,
             "metrics_extracted_at": datetime.now().isoformat()
         }
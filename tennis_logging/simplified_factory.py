@@ -60,7 +60,7 @@ class SimplifiedLoggingFactory:
         """
         return self.base_logger.log_database_query(sql_query, results, execution_time, component)
     
-    def log_tool_usage(self, tool_name: str, tool_input: Any, tool_output: Any, execution_time: Optional[float] = None, component: Optional[str] = None) -> None:
+    def log_tool_usage(self, tool_name: str, tool_input: Any, tool_output: Any, execution_time: Optional[float] = None, component: Optional[str] = None, cache: Optional[Dict[str, Any]] = None) -> None:
         """Log tool usage and results.
         
         Args:
@@ -69,8 +69,9 @@ class SimplifiedLoggingFactory:
             tool_output: Output from the tool
             execution_time: Execution time in seconds
             component: Component/module name where logging occurs
+            cache: Result cache details (hit, time_saved, hit_ratio, total_time_saved), if cached
         """
-        return self.base_logger.log_tool_usage(tool_name, tool_input, tool_output, execution_time, component)
+        return self.base_logger.log_tool_usage(tool_name, tool_input, tool_output, execution_time, component, cache)
     
     def log_final_response(self, response: str, processing_time: Optional[float] = None, component: Optional[str] = None) -> None:
         """Log the final response to the user.
@@ -82,6 +83,16 @@ class SimplifiedLoggingFactory:
         """
         return self.base_logger.log_final_response(response, processing_time, component)
     
+    def log_cache_stats(self, cache_name: str, stats: Dict[str, Any], component: Optional[str] = None) -> None:
+        """Log cumulative cache counters.
+        
+        Args:
+            cache_name: Name of the cache
+            stats: Counters such as hits, misses and hit_ratio
+            component: Component/module name where logging occurs
+        """
+        return self.base_logger.log_cache_stats(cache_name, stats, component)
+    
     def log_error(self, error: Exception, context: str = "", component: Optional[str] = None) -> None:
         """Log errors with context.
         
@@ -148,7 +159,7 @@ def log_database_query(sql_query: str, results: Any, execution_time: Optional[fl
     """
     return _simplified_factory.log_database_query(sql_query, results, execution_time, component)
 
-def log_tool_usage(tool_name: str, tool_input: Any, tool_output: Any, execution_time: Optional[float] = None, component: Optional[str] = None) -> None:
+def log_tool_usage(tool_name: str, tool_input: Any, tool_output: Any, execution_time: Optional[float] = None, component: Optional[str] = None, cache: Optional[Dict[str, Any]] = None) -> None:
     """Log tool usage and results.
     
     Args:
@@ -157,8 +168,9 @@ def log_tool_usage(tool_name: str, tool_input: Any, tool_output: Any, execution_
         tool_output: Output from the tool
         execution_time: Execution time in seconds
         component: Component/module name where logging occurs
+        cache: Result cache details (hit, time_saved, hit_ratio, total_time_saved), if cached
     """
-    return _simplified_factory.log_tool_usage(tool_name, tool_input, tool_output, execution_time, component)
+    return _simplified_factory.log_tool_usage(tool_name, tool_input, tool_output, execution_time, component, cache)
 
 def log_final_response(response: str, processing_time: Optional[float] = None, component: Optional[str] = None) -> None:
     """Log the final response to the user.
@@ -170,6 +182,16 @@ def log_final_response(response: str, processing_time: Optional[float] = None, c
     """
     return _simplified_factory.log_final_response(response, processing_time, component)
 
+def log_cache_stats(cache_name: str, stats: Dict[str, Any], component: Optional[str] = None) -> None:
+    """Log cumulative cache counters.
+    
+    Args:
+        cache_name: Name of the cache
+        stats: Counters such as hits, misses and hit_ratio
+        component: Component/module name where logging occurs
+    """
+    return _simplified_factory.log_cache_stats(cache_name, stats, component)
+
 def log_error(error: Exception, context: str = "", component: Optional[str] = None) -> None:
     """Log errors with context.
     
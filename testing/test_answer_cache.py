@@ -0,0 +1,99 @@
+"""
+Unit tests for question normalization and the agent answer cache.
+"""
+
+import unittest
+import os
+import shutil
+import sqlite3
+import tempfile
+
+# Add parent directory to path for imports
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from langchain_core.messages import HumanMessage, AIMessage, ToolMessage
+
+from services.answer_cache import AnswerCache, normalize_question, is_context_free, extract_final_query
+from services.query_cache import QueryCache
+
+
+class TestNormalizeQuestion(unittest.TestCase):
+    """Equivalent wordings share a key; different questions do not."""
+
+    def test_synonyms_share_a_key(self):
+        key, entities = normalize_question("Who won the French Open in 2019?")
+        self.assertEqual(key, normalize_question("who won roland garros 2019")[0])
+        self.assertEqual(entities["years"], ["2019"])
+        self.assertEqual(normalize_question("How many titles does Rafa have?")[0],
+                         normalize_question("how many titles does Rafael Nadal have")[0])
+        self.assertEqual(normalize_question("Rafa titles")[1]["players"], ["rafael nadal"])
+
+    def test_different_questions_differ(self):
+        self.assertNotEqual(normalize_question("Who won Wimbledon 2019")[0],
+                            normalize_question("Who won Wimbledon 2018")[0])
+        # "french" alone is a nationality, not the tournament
+        self.assertNotEqual(normalize_question("best french players")[0],
+                            normalize_question("best roland garros players")[0])
+
+    def test_follow_ups_are_not_context_free(self):
+        self.assertTrue(is_context_free("Who won Wimbledon 2019?"))
+        self.assertFalse(is_context_free("What about 2018?"))
+        self.assertFalse(is_context_free("How many titles did he win?"))
+
+
+class TestAnswerCache(unittest.TestCase):
+    """Answers are stored with their SQL and invalidated by a new database build."""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.tmp, "tennis.db")
+        sqlite3.connect(self.db_path).close()
+        self.cache = AnswerCache(f"sqlite:///{self.db_path}", cache=QueryCache("answer_cache"))
+        self.messages = [
+            HumanMessage(content="Who won the French Open in 2019?"),
+            AIMessage(content="", tool_calls=[{
+                "name": "sql_db_query", "args": {"query": "SELECT winner_name FROM matches"}, "id": "1",
+            }]),
+            ToolMessage(content="[('Rafael Nadal',)]", name="sql_db_query", tool_call_id="1"),
+            AIMessage(content="Rafael Nadal won Roland Garros in 2019."),
+        ]
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_store_and_lookup(self):
+        self.assertTrue(self.cache.store("Who won the French Open in 2019?", self.messages,
+                                         "Rafael Nadal won Roland Garros in 2019."))
+        entry = self.cache.lookup("who won roland garros 2019")
+        self.assertEqual(entry["answer"], "Rafael Nadal won Roland Garros in 2019.")
+        self.assertEqual(entry["sql"], "SELECT winner_name FROM matches")
+        self.assertEqual(entry["rows"], "[('Rafael Nadal',)]")
+        self.assertIsNone(self.cache.lookup("who won roland garros 2018"))
+
+    def test_final_query_of_parallel_calls_without_ids(self):
+        messages = [
+            HumanMessage(content="Who won Wimbledon 2019?"),
+            AIMessage(content="", tool_calls=[
+                {"name": "get_tennis_round_mapping", "args": {"round_name": "final"}, "id": None},
+                {"name": "sql_db_query", "args": {"query": "SELECT 1"}, "id": None},
+            ]),
+            ToolMessage(content="F", name="get_tennis_round_mapping", tool_call_id="get_tennis_round_mapping_0"),
+            ToolMessage(content="[(1,)]", name="sql_db_query", tool_call_id="sql_db_query_1"),
+        ]
+        self.assertEqual(extract_final_query(messages), ("SELECT 1", "[(1,)]"))
+
+    def test_follow_ups_and_empty_answers_are_not_cached(self):
+        self.assertFalse(self.cache.store("What about 2018?", self.messages, "Nadal again."))
+        self.assertFalse(self.cache.store("Who won Wimbledon 2019?", self.messages, "  "))
+        self.assertEqual(self.cache.stats()["entries"], 0)
+
+    def test_rebuild_invalidates(self):
+        self.cache.store("Who won the French Open in 2019?", self.messages, "Rafael Nadal.")
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("CREATE TABLE matches (winner_name TEXT)")
+        self.assertIsNone(self.cache.lookup("Who won the French Open in 2019?"))
+
+
+if __name__ == '__main__':
+    unittest.main()
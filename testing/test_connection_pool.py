@@ -0,0 +1,117 @@
+"""
+Unit tests for the read-only SQLite connection pool.
+"""
+
+import unittest
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+
+# Add parent directory to path for imports
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.connection_pool import SQLiteConnectionPool
+
+
+def make_db(path, value):
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE t (x INTEGER)")
+    conn.execute("INSERT INTO t VALUES (?)", (value,))
+    conn.commit()
+    conn.close()
+
+
+class TestSQLiteConnectionPool(unittest.TestCase):
+    """Connections are reused, read-only, bounded and follow a replaced file."""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.tmp, "tennis.db")
+        make_db(self.db_path, 1)
+        self.pool = SQLiteConnectionPool(self.db_path, pool_size=2, checkout_timeout=0.2)
+
+    def tearDown(self):
+        self.pool.close()
+        shutil.rmtree(self.tmp)
+
+    def test_reuses_connections(self):
+        for _ in range(5):
+            with self.pool.connection() as conn:
+                self.assertEqual(conn.execute("SELECT x FROM t").fetchone(), (1,))
+        stats = self.pool.stats()
+        self.assertEqual(stats["checkouts"], 5)
+        self.assertEqual(stats["open_connections"], 1)
+        self.assertEqual(stats["idle_connections"], 1)
+
+    def test_read_only(self):
+        with self.pool.connection() as conn:
+            with self.assertRaises(sqlite3.OperationalError):
+                conn.execute("INSERT INTO t VALUES (2)")
+
+    def test_bounded_and_times_out(self):
+        release = threading.Event()
+        held = threading.Barrier(3)
+
+        def hold():
+            with self.pool.connection():
+                held.wait()
+                release.wait()
+
+        threads = [threading.Thread(target=hold) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        held.wait()
+        with self.assertRaises(TimeoutError):
+            with self.pool.connection():
+                pass
+        release.set()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(self.pool.stats()["open_connections"], 2)
+
+    def test_replaced_file_is_reopened(self):
+        with self.pool.connection() as conn:
+            conn.execute("SELECT x FROM t").fetchone()
+        new_path = os.path.join(self.tmp, "rebuilt.db")
+        make_db(new_path, 2)
+        os.replace(new_path, self.db_path)
+        with self.pool.connection() as conn:
+            self.assertEqual(conn.execute("SELECT x FROM t").fetchone(), (2,))
+        self.assertEqual(self.pool.stats()["open_connections"], 1)
+
+    def test_waiter_wakes_when_stale_connection_is_discarded(self):
+        pool = SQLiteConnectionPool(self.db_path, pool_size=1, checkout_timeout=5)
+        results = []
+
+        def wait_for_connection():
+            with pool.connection() as conn:
+                results.append(conn.execute("SELECT x FROM t").fetchone())
+
+        with pool.connection():
+            new_path = os.path.join(self.tmp, "rebuilt.db")
+            make_db(new_path, 2)
+            os.replace(new_path, self.db_path)
+            # The waiter notices the new file, so the held connection is closed
+            # on return instead of going back to the pool; that frees the slot
+            waiter = threading.Thread(target=wait_for_connection)
+            waiter.start()
+            time.sleep(0.1)
+        waiter.join()
+        pool.close()
+        self.assertEqual(results, [(2,)])
+
+    def test_missing_database(self):
+        pool = SQLiteConnectionPool(os.path.join(self.tmp, "missing.db"))
+        with self.assertRaises(sqlite3.OperationalError):
+            with pool.connection():
+                pass
+        self.assertEqual(pool.stats()["open_connections"], 0)
+        self.assertFalse(os.path.exists(os.path.join(self.tmp, "missing.db")))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -293,6 +293,21 @@ class TestPerformanceMetrics(unittest.TestCase):
         self.assertIn("database_queries", stats)
         self.assertIn("tool_usage", stats)
     
+    def test_get_cache_stats(self):
+        """Test that the latest cache counters are used."""
+        with open(self.log_file, 'a') as f:
+            for hits, misses in ((10, 10), (30, 10)):
+                f.write(json.dumps({
+                    "timestamp": datetime.now().isoformat(),
+                    "section": "CACHE STATS",
+                    "data": {"cache_name": "database_service", "hits": hits, "misses": misses}
+                }) + "\n")
+        metrics = PerformanceMetrics(self.log_file)
+        stats = metrics.get_cache_stats()
+        self.assertEqual(stats["total_lookups"], 40)
+        self.assertAlmostEqual(stats["hit_ratio"], 0.75)
+        self.assertIn("cache", metrics.get_overall_stats())
+    
     def test_identify_bottlenecks(self):
         """Test identifying bottlenecks."""
         metrics = PerformanceMetrics(self.log_file)
@@ -0,0 +1,98 @@
+"""
+Unit tests for keyset pagination of filtered matches (DatabaseService).
+"""
+
+import unittest
+import os
+import shutil
+import sqlite3
+import tempfile
+
+# Add parent directory to path for imports
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+
+from services.database_service import DatabaseService
+from services.query_cache import QueryCache
+
+
+class TestMatchPagination(unittest.TestCase):
+    """Pages cover every match exactly once, in (tourney_date, match_num, match_id) order."""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        db_path = os.path.join(self.tmp, "tennis.db")
+        conn = sqlite3.connect(db_path)
+        # Duplicate (tourney_date, match_num) keys across tournaments, as in the real data
+        pd.DataFrame({
+            'match_id': range(1, 26),
+            'tourney_date': ['2020-01-06'] * 10 + ['2020-02-03'] * 15,
+            'match_num': [n % 5 for n in range(25)],
+            'event_year': 2020,
+            'tourney_name': ['A'] * 10 + ['B'] * 15,
+            'round': 'R32',
+            'winner_name': 'W',
+            'loser_name': 'L',
+            'surface': ['Hard'] * 20 + ['Clay'] * 5,
+            'score': '6-0 6-0',
+        }).to_sql('matches', conn, index=False)
+        conn.close()
+        self.service = DatabaseService(db_path, query_cache=QueryCache("test", stats_interval=0))
+        self.expected = pd.read_sql_query(
+            "SELECT tourney_name, match_num FROM matches ORDER BY tourney_date, match_num, match_id",
+            sqlite3.connect(db_path)
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_pages_cover_all_rows_in_order(self):
+        pages, after = [], None
+        while True:
+            df, after = self.service.get_matches_page(page_size=4, after=after)
+            pages.append(df)
+            if after is None:
+                break
+        self.assertEqual([len(df) for df in pages], [4] * 6 + [1])
+        combined = pd.concat(pages, ignore_index=True)
+        self.assertEqual(combined['tourney_name'].astype(str).tolist(), self.expected['tourney_name'].tolist())
+
+    def test_full_result_is_not_truncated(self):
+        self.service.MATCH_CHUNK_SIZE = 7
+        self.assertEqual(len(self.service.get_matches_with_filters()), 25)
+        self.assertEqual(len(self.service.get_matches_with_filters(max_rows=9)), 9)
+        self.assertEqual(self.service.count_matches_with_filters(surfaces=['Clay']), 5)
+
+    def test_null_keys_are_paged(self):
+        conn = sqlite3.connect(os.path.join(self.tmp, "nulls.db"))
+        pd.DataFrame({
+            'match_id': range(1, 11),
+            'tourney_date': [None, '2020-01-06', None, '2020-01-06', '2020-02-03',
+                             None, '2020-02-03', '2020-02-03', '2020-03-02', '2020-03-02'],
+            'match_num': [1, 2, 3, None, 5, 6, None, 8, 9, 10],
+            'event_year': 2020,
+            'tourney_name': 'A',
+            'round': 'R32',
+            'winner_name': 'W',
+            'loser_name': 'L',
+            'surface': 'Hard',
+            'score': '6-0 6-0',
+        }).to_sql('matches', conn, index=False)
+        conn.close()
+        service = DatabaseService(os.path.join(self.tmp, "nulls.db"),
+                                  query_cache=QueryCache("test", stats_interval=0))
+        service.MATCH_CHUNK_SIZE = 3
+        df = service.get_matches_with_filters()
+        self.assertEqual(len(df), service.count_matches_with_filters())
+        self.assertEqual(len(df), 10)
+        self.assertEqual(df['tourney_date'].isna().sum(), 3)
+
+    def test_stream_chunks(self):
+        chunks = list(self.service.iter_matches_with_filters(surfaces=['Hard'], chunk_size=6))
+        self.assertEqual([len(df) for df in chunks], [6, 6, 6, 2])
+
+
+if __name__ == '__main__':
+    unittest.main()
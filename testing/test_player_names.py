@@ -0,0 +1,88 @@
+"""
+Unit tests for player name normalization and the player_names index.
+"""
+
+import unittest
+import os
+import io
+import sqlite3
+import contextlib
+
+# Add parent directory to path for imports
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+
+from tennis.player_names import normalize_player_name, resolve_player_ids, player_id_condition
+from load_data.database_builder import populate_player_names, write_table
+
+
+class TestNormalizePlayerName(unittest.TestCase):
+    """Case, accents, punctuation and spacing do not change the key."""
+
+    def test_variants_share_a_key(self):
+        self.assertEqual(normalize_player_name("Iga Świątek"), "iga swiatek")
+        self.assertEqual(normalize_player_name("  STAN   Wawrinka. "), "stan wawrinka")
+        self.assertEqual(normalize_player_name("Jo-Wilfried Tsonga"), "jo wilfried tsonga")
+        self.assertEqual(normalize_player_name("Łukasz Kubot"), "lukasz kubot")
+        self.assertEqual(normalize_player_name("Juan Martín del Potro"), "juan martin del potro")
+
+    def test_missing_names(self):
+        self.assertEqual(normalize_player_name(None), "")
+        self.assertEqual(normalize_player_name("   "), "")
+
+
+class TestPlayerNamesIndex(unittest.TestCase):
+    """Names from players, matches and aliases resolve to (tour, player_id)."""
+
+    def setUp(self):
+        self.conn = sqlite3.connect(":memory:")
+        with contextlib.redirect_stdout(io.StringIO()):
+            write_table(self.conn, 'atp_players', pd.DataFrame({
+                'player_id': [104745, 103819],
+                'name_first': ['Rafael', 'Roger'],
+                'name_last': ['Nadal', 'Federer'],
+                'full_name': ['Rafael Nadal', 'Roger Federer'],
+            }))
+            write_table(self.conn, 'wta_players', pd.DataFrame({
+                'player_id': [206173],
+                'name_first': ['Iga'],
+                'name_last': ['Świątek'],
+                'full_name': ['Iga Świątek'],
+            }))
+            write_table(self.conn, 'matches', pd.DataFrame({
+                'tour': ['ATP', 'ATP', 'WTA'],
+                'winner_id': [104745, 104745, 206173],
+                'winner_name': ['Rafael Nadal', 'R. Nadal', 'Iga Swiatek'],
+                'loser_id': [103819, 103819, None],
+                'loser_name': ['Roger Federer', 'Roger Federer', None],
+            }))
+            populate_player_names(self.conn)
+
+    def tearDown(self):
+        self.conn.close()
+
+    def test_resolves_spellings_match_names_and_aliases(self):
+        for name in ("rafael nadal", "R. Nadal", "Rafa", "RAFAEL NADAL"):
+            self.assertEqual(resolve_player_ids(self.conn, name), [('ATP', 104745)], name)
+        self.assertEqual(resolve_player_ids(self.conn, "iga swiatek"), [('WTA', 206173)])
+        self.assertEqual(resolve_player_ids(self.conn, "Nobody"), [])
+
+    def test_match_counts(self):
+        counts = dict(self.conn.execute(
+            "SELECT player_id, MAX(match_count) FROM player_names GROUP BY player_id"
+        ).fetchall())
+        self.assertEqual(counts, {104745: 2, 103819: 2, 206173: 1})
+
+    def test_missing_index_table(self):
+        self.assertIsNone(resolve_player_ids(sqlite3.connect(":memory:"), "Rafael Nadal"))
+
+    def test_id_condition(self):
+        condition, params = player_id_condition([('ATP', 1), ('WTA', 2)], "pm.player_id", "pm.tour")
+        self.assertEqual(condition, "((pm.player_id = ? AND pm.tour = ?) OR (pm.player_id = ? AND pm.tour = ?))")
+        self.assertEqual(params, [1, 'ATP', 2, 'WTA'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+"""
+Unit tests for the in-memory player name autocomplete (PlayerSearchIndex).
+"""
+
+import unittest
+import os
+import shutil
+import sqlite3
+import tempfile
+import time
+
+# Add parent directory to path for imports
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.database_service import DatabaseService
+from services.player_search import PlayerSearchIndex
+
+
+class TestPlayerSearchIndex(unittest.TestCase):
+    """Prefix hits come first, ranked by matches played, then fuzzy hits."""
+
+    def setUp(self):
+        self.index = PlayerSearchIndex([
+            ("Rafael Nadal", 1300),
+            ("Nadia Petrova", 700),
+            ("Roger Federer", 1500),
+            ("Iga Świątek", 400),
+            ("Roger Federer", 10),
+        ])
+
+    def test_word_prefix(self):
+        self.assertEqual(self.index.search("nad"), ["Rafael Nadal", "Nadia Petrova"])
+        self.assertEqual(self.index.search("ROG"), ["Roger Federer"])
+
+    def test_accents_ignored(self):
+        self.assertEqual(self.index.search("swia"), ["Iga Świątek"])
+
+    def test_fuzzy_after_prefix(self):
+        self.assertEqual(self.index.search("federrer")[:1], ["Roger Federer"])
+        self.assertEqual(self.index.search("xyzq"), [])
+
+    def test_empty_query_and_limit(self):
+        self.assertEqual(len(self.index), 4)
+        self.assertEqual(self.index.search(None, limit=2), ["Roger Federer", "Rafael Nadal"])
+        self.assertEqual(self.index.search("r", limit=1), ["Roger Federer"])
+
+
+class TestPlayerSearchCache(unittest.TestCase):
+    """The search index of a database is rebuilt when the database changes."""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def write_names(self, db_path, names):
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("DROP TABLE IF EXISTS player_names")
+            conn.execute("CREATE TABLE player_names (display_name TEXT, match_count INTEGER, name_source TEXT)")
+            conn.executemany("INSERT INTO player_names VALUES (?, ?, 'matches')", [(name, 1) for name in names])
+        conn.close()
+
+    def test_rebuild_and_per_database_index(self):
+        first, second = os.path.join(self.tmp, "first.db"), os.path.join(self.tmp, "second.db")
+        self.write_names(first, ["Rafael Nadal"])
+        self.write_names(second, ["Roger Federer"])
+        self.assertEqual(DatabaseService(first).search_players("r"), ["Rafael Nadal"])
+        self.assertEqual(DatabaseService(second).search_players("r"), ["Roger Federer"])
+        time.sleep(0.01)  # A new mtime, as after a rebuild
+        self.write_names(first, ["Rafael Nadal", "Rod Laver"])
+        self.assertEqual(DatabaseService(first).search_players("ro"), ["Rod Laver"])
+
+
+if __name__ == '__main__':
+    unittest.main()
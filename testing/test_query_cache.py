@@ -0,0 +1,112 @@
+"""
+Unit tests for the process-wide query result cache.
+"""
+
+import unittest
+import os
+import shutil
+import sqlite3
+import tempfile
+
+# Add parent directory to path for imports
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+
+from services.query_cache import QueryCache, cached_query, skip_caching
+
+
+class FakeService:
+    """Minimal object with the attributes cached_query expects."""
+
+    def __init__(self, db_path, cache):
+        self.db_path = db_path
+        self.query_cache = cache
+        self.calls = 0
+
+    @cached_query(unordered=('surfaces',))
+    def matches(self, player=None, surfaces=None):
+        self.calls += 1
+        return pd.DataFrame({'player': [player], 'surfaces': [len(surfaces or [])]})
+
+    @cached_query()
+    def players(self, fail=False):
+        self.calls += 1
+        if fail:
+            skip_caching()
+            return ["All Players"]  # Error fallback
+        return ["All Players", "Roger Federer"]
+
+    @cached_query()
+    def summary(self, fail=False):
+        return len(self.players(fail))
+
+
+class TestQueryCache(unittest.TestCase):
+    """LRU and size limits, fingerprint invalidation and key normalization."""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.tmp, "tennis.db")
+        sqlite3.connect(self.db_path).close()
+        self.cache = QueryCache("test", max_entries=2, max_bytes=10_000, stats_interval=0)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_lru_eviction(self):
+        self.cache.put(self.db_path, "a", [1])
+        self.cache.put(self.db_path, "b", [2])
+        self.assertEqual(self.cache.get(self.db_path, "a"), [1])  # a is now most recent
+        self.cache.put(self.db_path, "c", [3])
+        self.assertIsNone(self.cache.get(self.db_path, "b"))
+        self.assertEqual(self.cache.get(self.db_path, "a"), [1])
+        self.assertEqual(self.cache.stats()["evictions"], 1)
+
+    def test_size_limit(self):
+        self.cache.put(self.db_path, "big", list(range(10_000)))
+        self.assertIsNone(self.cache.get(self.db_path, "big"))
+        self.assertEqual(self.cache.stats()["entries"], 0)
+
+    def test_database_change_invalidates(self):
+        self.cache.put(self.db_path, "a", [1])
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("CREATE TABLE t (x INTEGER)")
+        conn.commit()
+        conn.close()
+        os.utime(self.db_path, ns=(0, 0))  # Make the change visible even on coarse mtimes
+        self.assertIsNone(self.cache.get(self.db_path, "a"))
+        self.assertEqual(self.cache.stats()["invalidations"], 1)
+
+    def test_missing_database_is_not_cached(self):
+        missing = os.path.join(self.tmp, "missing.db")
+        self.cache.put(missing, "a", [1])
+        self.assertIsNone(self.cache.get(missing, "a"))
+
+    def test_decorator_normalizes_arguments_and_copies(self):
+        service = FakeService(self.db_path, self.cache)
+        first = service.matches(" Roger Federer ", surfaces=['Hard', 'Clay'])
+        first['player'] = 'changed'
+        second = service.matches(player="Roger Federer", surfaces=['Clay', 'Hard'])
+        self.assertEqual(service.calls, 1)
+        self.assertEqual(second.loc[0, 'player'], " Roger Federer ")
+        stats = self.cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+
+    def test_error_fallbacks_are_not_cached(self):
+        service = FakeService(self.db_path, self.cache)
+        self.assertEqual(service.players(fail=True), ["All Players"])
+        service.players(fail=True)
+        self.assertEqual(service.calls, 2)
+        # A cached call built on a fallback is not cached either
+        self.assertEqual(service.summary(fail=True), 1)
+        self.assertEqual(self.cache.stats()["entries"], 0)
+        service.players()
+        service.players()
+        self.assertEqual(service.calls, 4)
+        self.assertEqual(self.cache.stats()["entries"], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
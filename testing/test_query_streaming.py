@@ -0,0 +1,113 @@
+"""
+Unit tests for the streamed agent run in QueryProcessor.
+"""
+
+import unittest
+import asyncio
+import json
+import os
+from typing import List
+
+# Add parent directory to path for imports
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
+from langchain_core.tools import tool
+
+import agent  # Loads agent before graph, which imports agent.agent_state
+from graph.langgraph_builder import LangGraphBuilder
+from services.answer_cache import AnswerCache
+from services.query_service import QueryProcessor
+
+
+@tool
+def get_tennis_surface_mapping(surface: str) -> str:
+    """Map a surface name."""
+    return surface.title()
+
+
+class ScriptedChatModel(BaseChatModel):
+    """Streams a tool call on its first turn and a Gemini-style answer on the next."""
+
+    turns: List[int] = []
+
+    @property
+    def _llm_type(self) -> str:
+        return "scripted"
+
+    def bind_tools(self, tools, **kwargs):
+        return self
+
+    def _chunks(self):
+        self.turns.append(1)
+        if len(self.turns) == 1:
+            yield AIMessageChunk(content="", tool_call_chunks=[{
+                "name": "get_tennis_surface_mapping", "args": json.dumps({"surface": "clay"}), "id": "a", "index": 0,
+            }])
+        else:
+            for word in ("Nadal ", "won ", "on ", "clay."):
+                yield AIMessageChunk(content=[{"type": "text", "text": word}])
+
+    def _stream(self, messages, stop=None, run_manager=None, **kwargs):
+        for chunk in self._chunks():
+            if run_manager:
+                run_manager.on_llm_new_token(str(chunk.content), chunk=ChatGenerationChunk(message=chunk))
+            yield ChatGenerationChunk(message=chunk)
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        message = None
+        for chunk in self._chunks():
+            message = chunk if message is None else message + chunk
+        return ChatResult(generations=[ChatGeneration(
+            message=AIMessage(content=message.content, tool_calls=message.tool_calls)
+        )])
+
+
+class RecordingPlaceholder:
+    """Stands in for st.empty() and records what was shown."""
+
+    def __init__(self):
+        self.shown = []
+
+    def markdown(self, text):
+        self.shown.append(text)
+
+    def caption(self, text):
+        self.shown.append(text)
+
+    def empty(self):
+        self.shown.append(None)
+
+
+class TestStreamedAgentRun(unittest.TestCase):
+    """Tokens and tool progress reach the placeholders before the run ends."""
+
+    def test_stream_tokens_progress_and_summary(self):
+        prompt = ChatPromptTemplate.from_messages([("system", "Tennis"), MessagesPlaceholder("messages")])
+        graph = LangGraphBuilder([get_tennis_surface_mapping], ScriptedChatModel(turns=[]), prompt).build_graph()
+        processor = QueryProcessor(None, answer_cache=AnswerCache(os.devnull))
+
+        async def summarize(text):
+            return f"Summary of: {text}"
+        processor._agenerate_summary = summarize
+
+        response_slot, progress_slot = RecordingPlaceholder(), RecordingPlaceholder()
+        response, final_answer, summary = asyncio.run(processor._run_agent(
+            "Who won on clay?", graph, {"configurable": {"thread_id": "test"}}, response_slot, progress_slot
+        ))
+
+        self.assertEqual(final_answer, "Nadal won on clay.")
+        self.assertEqual(summary, "Summary of: Nadal won on clay.")
+        self.assertEqual(response_slot.shown[0], "Nadal  ▌")
+        self.assertEqual(response_slot.shown[-1], "Nadal won on clay.")
+        self.assertEqual(progress_slot.shown[0], "Running get_tennis_surface_mapping...")
+        self.assertIsNone(progress_slot.shown[-1])
+        self.assertEqual(len(response["messages"]), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
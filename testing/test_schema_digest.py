@@ -0,0 +1,73 @@
+"""
+Unit tests for the agent's compact schema digest.
+"""
+
+import unittest
+import os
+import shutil
+import sqlite3
+import tempfile
+
+# Add parent directory to path for imports
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tennis.schema_digest import (
+    build_schema_digest, write_schema_digest, read_schema_digest, read_full_info_tokens,
+    full_table_info, estimate_tokens
+)
+
+
+class TestSchemaDigest(unittest.TestCase):
+    """Column families are folded, small value sets listed and joins named."""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.tmp, "tennis.db")
+        self.conn = sqlite3.connect(self.db_path)
+        self.conn.execute(
+            "CREATE TABLE matches (match_id INTEGER PRIMARY KEY, surface TEXT, event_year INTEGER, "
+            "winner_id INTEGER, winner_name TEXT, winner_hand TEXT, loser_id INTEGER, loser_name TEXT, "
+            "loser_hand TEXT, w_ace INTEGER, l_ace INTEGER, w_df INTEGER, l_df INTEGER, "
+            "set1 TEXT, set2 TEXT, set3 TEXT, set1_tiebreak INTEGER, set2_tiebreak INTEGER, set3_tiebreak INTEGER)"
+        )
+        self.conn.executemany(
+            "INSERT INTO matches (surface, event_year, winner_name, winner_hand, loser_name, loser_hand) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            [("Clay", 2019, "Rafael Nadal", "L", "Roger Federer", "R"),
+             ("Grass", 2021, "Novak Djokovic", "R", "Matteo Berrettini", "R")]
+        )
+        self.conn.execute("CREATE TABLE player_matches (match_id INTEGER, player_id INTEGER)")
+        self.conn.execute("CREATE TABLE _source_manifest (path TEXT)")
+        self.conn.commit()
+
+    def tearDown(self):
+        self.conn.close()
+        shutil.rmtree(self.tmp)
+
+    def test_digest_content(self):
+        digest = build_schema_digest(self.conn)
+        self.assertIn("surface[Clay|Grass]", digest)
+        self.assertIn("event_year[2019..2021]", digest)
+        self.assertIn("winner_|loser_: id, name, hand[L|R]", digest)
+        self.assertIn("w_|l_: ace, df", digest)
+        self.assertIn("setN (N=1-3): setN, setN_tiebreak", digest)
+        self.assertIn("player_matches.match_id = matches.match_id", digest)
+        # Names are never listed as values; internal tables are left out
+        self.assertNotIn("Nadal", digest)
+        self.assertNotIn("_source_manifest", digest)
+
+    def test_write_and_read(self):
+        self.assertIsNone(read_schema_digest(self.db_path))
+        self.assertIsNone(read_full_info_tokens(self.db_path))
+        full_info = full_table_info(self.conn)
+        self.assertIn("3 rows from matches table:", full_info)
+        digest = write_schema_digest(self.conn)
+        self.assertEqual(read_schema_digest(f"sqlite:///{self.db_path}"), digest)
+        self.assertEqual(read_full_info_tokens(self.db_path), estimate_tokens(full_info))
+        self.assertLess(estimate_tokens(digest), estimate_tokens(full_info))
+        self.assertIsNone(read_schema_digest(os.path.join(self.tmp, "missing.db")))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,178 @@
+"""
+Unit tests for the vectorized score parser (load_data/score_parser.py).
+Checks parity with the previous per-row parse_score implementation, on edge
+cases and, when the source CSVs are present, on every score in the dataset.
+"""
+
+import unittest
+import os
+import glob
+import random
+
+# Add parent directory to path for imports
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+
+from load_data.config import DATA_DIRS
+from load_data.score_parser import SET_COLUMNS, split_score_sets, parse_set_games
+from load_data.data_transformers import parse_score_data
+
+
+def legacy_parse_score(score_str):
+    """Reference implementation: the per-row parser used before vectorization."""
+    if pd.isna(score_str) or score_str == '':
+        return [None, None, None, None, None]
+
+    score_str = str(score_str).strip()
+
+    if score_str in ['W/O', 'WO', 'Walkover']:
+        return ['W/O', None, None, None, None]
+    elif score_str in ['DEF', 'Default']:
+        return ['DEF', None, None, None, None]
+    elif 'W/O' in score_str.upper() or 'WO' in score_str.upper():
+        parts = score_str.split()
+        sets = []
+        for part in parts:
+            if 'W/O' in part.upper() or 'WO' in part.upper():
+                score_part = part.replace('W/O', '').replace('WO', '').replace('wo', '').strip()
+                if score_part:
+                    sets.append(score_part)
+                sets.append('W/O')
+                break
+            else:
+                sets.append(part)
+        while len(sets) < 5:
+            sets.append(None)
+        return sets[:5]
+    elif 'DEF' in score_str.upper() or 'DEFAULT' in score_str.upper():
+        parts = score_str.split()
+        sets = []
+        for part in parts:
+            if 'DEF' in part.upper() or 'DEFAULT' in part.upper():
+                score_part = part.replace('DEF', '').replace('DEFAULT', '').replace('def', '').strip()
+                if score_part:
+                    sets.append(score_part)
+                sets.append('DEF')
+                break
+            else:
+                sets.append(part)
+        while len(sets) < 5:
+            sets.append(None)
+        return sets[:5]
+    elif 'RET' in score_str.upper():
+        parts = score_str.split()
+        sets = []
+        for part in parts:
+            if 'RET' in part.upper():
+                score_part = part.replace('RET', '').replace('ret', '').strip()
+                if score_part:
+                    sets.append(score_part)
+                sets.append('RET')
+                break
+            else:
+                sets.append(part)
+        while len(sets) < 5:
+            sets.append(None)
+        return sets[:5]
+    else:
+        parts = score_str.split()
+        sets = parts[:5]
+        while len(sets) < 5:
+            sets.append(None)
+        return sets
+
+
+EDGE_CASE_SCORES = [
+    None, float('nan'), '', '   ', 'W/O', 'WO', 'Walkover', 'walkover', 'DEF', 'Default',
+    'Def.', '6-4 6-3', '6-4 3-6 7-6(5)', '7-6(10) 6-7(8) 6-4 4-6 12-10',
+    '6-4 6-4 6-4 6-4 6-4 6-4', '6-2 3-1 RET', '6-2 3-1RET', '6-2 RET', 'RET', 'Ret.',
+    '6-3 2-0 ret.', '6-4 W/O', '6-4 2-1W/O', 'W/O 6-4', '6-1 DEF', '6-1 Def.', '3-2 DEFAULT',
+    '6-4 6-3 Default', '  6-4   6-2  ', '6-4\t6-2', 'Played and abandoned', 'In Progress',
+    'ABD', 'NA', '?', 'unfinished', '6-4 [10-8]', '6-4 3-6 [10-7]', '6-0 1-0 RET 2',
+    '1-6 WO RET', 'DEF RET', 'retired', 'Walkover RET',
+]
+
+
+def _legacy_frame(scores):
+    rows = [legacy_parse_score(s) for s in scores]
+    return pd.DataFrame(rows, columns=SET_COLUMNS, index=scores.index, dtype=object)
+
+
+class TestScoreParserParity(unittest.TestCase):
+    """Parity of split_score_sets with the legacy per-row parser."""
+
+    def assert_parity(self, scores):
+        expected = _legacy_frame(scores)
+        actual = split_score_sets(scores)
+        for col in SET_COLUMNS:
+            mismatch = [
+                (scores.iloc[i], expected[col].iloc[i], actual[col].iloc[i])
+                for i in range(len(scores))
+                if expected[col].iloc[i] != actual[col].iloc[i]
+            ]
+            self.assertEqual(mismatch, [], f"Mismatches in {col}")
+
+    def test_edge_cases(self):
+        """Special scores (walkover, default, retirement, junk) parse identically."""
+        self.assert_parity(pd.Series(EDGE_CASE_SCORES, dtype=object))
+
+    def test_random_token_combinations(self):
+        """Random combinations of set scores and markers parse identically."""
+        rng = random.Random(42)
+        tokens = ['6-4', '7-6(3)', '3-6', '10-8', 'RET', 'ret', 'W/O', 'wo', 'DEF', 'def',
+                  'Def.', 'Default', '2-1RET', '4-3W/O', '[10-5]', 'ABD', '']
+        scores = [' '.join(rng.choice(tokens) for _ in range(rng.randint(0, 7))) for _ in range(2000)]
+        self.assert_parity(pd.Series(scores, dtype=object))
+
+    def test_empty_series(self):
+        """An empty score column gives empty set columns."""
+        result = split_score_sets(pd.Series([], dtype=object))
+        self.assertEqual(list(result.columns), SET_COLUMNS)
+        self.assertEqual(len(result), 0)
+
+    def test_full_dataset(self):
+        """Every score in the source match CSVs parses identically."""
+        files = sorted(
+            f for data_dir in DATA_DIRS for f in glob.glob(os.path.join(data_dir, '*_matches_*.csv'))
+        )
+        if not files:
+            self.skipTest("Source match CSVs not available")
+        scores = pd.concat(
+            [pd.read_csv(f, usecols=['score'], dtype={'score': object})['score'] for f in files],
+            ignore_index=True
+        )
+        self.assert_parity(scores)
+
+
+class TestSetGames(unittest.TestCase):
+    """Numeric games and tiebreak extraction."""
+
+    def test_games_and_tiebreaks(self):
+        sets = split_score_sets(pd.Series(['6-4 3-6 7-6(5)', '6-2 3-1 RET', 'W/O', None], dtype=object))
+        games = parse_set_games(sets)
+        self.assertEqual(games.loc[0, 'set1_w_games'], 6)
+        self.assertEqual(games.loc[0, 'set2_l_games'], 6)
+        self.assertEqual(games.loc[0, 'set3_tiebreak'], 5)
+        self.assertTrue(pd.isna(games.loc[0, 'set1_tiebreak']))
+        self.assertEqual(games.loc[0, 'total_games'], 32)
+        # Partial set before a retirement still counts; the RET marker does not
+        self.assertEqual(games.loc[1, 'total_games'], 12)
+        self.assertTrue(pd.isna(games.loc[1, 'set3_w_games']))
+        self.assertTrue(pd.isna(games.loc[2, 'total_games']))
+        self.assertTrue(pd.isna(games.loc[3, 'total_games']))
+
+    def test_parse_score_data_columns(self):
+        """parse_score_data places set and games columns right after score."""
+        df = pd.DataFrame({'tourney_name': ['A', 'B'], 'score': ['6-4 6-3', '6-1 RET'], 'round': ['F', 'SF']})
+        result = parse_score_data(df)
+        columns = list(result.columns)
+        self.assertEqual(columns[:7], ['tourney_name', 'score'] + SET_COLUMNS)
+        self.assertEqual(columns[-1], 'round')
+        self.assertEqual(result.loc[1, 'set2'], 'RET')
+        self.assertEqual(result.loc[0, 'total_games'], 19)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+"""
+Unit tests for SQL canonicalization and the sql_db_query result cache.
+"""
+
+import unittest
+import os
+import shutil
+import sqlite3
+import tempfile
+
+# Add parent directory to path for imports
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.query_cache import QueryCache
+from services.sql_result_cache import SQLResultCache, canonicalize_sql, is_cacheable_query
+
+
+class TestCanonicalizeSQL(unittest.TestCase):
+    """Formatting variants share a key; literals keep their meaning."""
+
+    def test_variants_share_a_key(self):
+        expected = canonicalize_sql("SELECT m.winner_name FROM matches m WHERE m.year = 2019 LIMIT 5")
+        for variant in (
+            "select  m.winner_name\n  FROM matches AS m\nwhere m.year=2019 limit 5;",
+            "SELECT m.winner_name -- champion\nFROM matches m /* all */ WHERE m.year = 02019 LIMIT 5",
+        ):
+            self.assertEqual(canonicalize_sql(variant), expected, variant)
+        self.assertEqual(canonicalize_sql("SELECT 1 WHERE a != 2"), canonicalize_sql("select 1 where a <> 2"))
+
+    def test_literals_are_kept(self):
+        self.assertNotEqual(canonicalize_sql("SELECT * FROM m WHERE name = 'Nadal'"),
+                            canonicalize_sql("SELECT * FROM m WHERE name = 'nadal'"))
+        self.assertIn("'Rafa  Nadal -- x'", canonicalize_sql("SELECT 'Rafa  Nadal -- x'"))
+
+    def test_only_single_reads_are_cacheable(self):
+        self.assertTrue(is_cacheable_query(canonicalize_sql("WITH t AS (SELECT 1) SELECT * FROM t")))
+        self.assertFalse(is_cacheable_query(canonicalize_sql("DELETE FROM matches")))
+        self.assertFalse(is_cacheable_query(canonicalize_sql("SELECT 1; DROP TABLE matches")))
+
+    def test_clock_and_random_queries_are_not_cacheable(self):
+        for query in ("SELECT * FROM atp_rankings WHERE ranking_date > date('now', '-1 year')",
+                      "SELECT DATE('NOW')",
+                      "SELECT count(*) FROM matches WHERE tourney_date < CURRENT_DATE",
+                      "select current_timestamp",
+                      "SELECT winner_name FROM matches ORDER BY RANDOM() LIMIT 1",
+                      "SELECT julianday() - julianday(tourney_date) FROM matches"):
+            self.assertFalse(is_cacheable_query(canonicalize_sql(query)), query)
+        self.assertTrue(is_cacheable_query(canonicalize_sql(
+            "SELECT date(tourney_date) FROM matches WHERE winner_name = 'Nowak'")))
+
+
+class TestSQLResultCache(unittest.TestCase):
+    """Hits skip execution; errors and oversized results are not cached."""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.tmp, "tennis.db")
+        sqlite3.connect(self.db_path).close()
+        self.cache = SQLResultCache(f"sqlite:///{self.db_path}", cache=QueryCache("sql_result_cache"),
+                                    max_entry_bytes=100)
+        self.calls = 0
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def execute(self, result):
+        def run():
+            self.calls += 1
+            return result
+        return run
+
+    def test_hit_skips_execution(self):
+        result, details = self.cache.run("SELECT 1", self.execute("[(1,)]"))
+        self.assertFalse(details["hit"])
+        result, details = self.cache.run("select 1;", self.execute("[(2,)]"))
+        self.assertEqual(result, "[(1,)]")
+        self.assertTrue(details["hit"])
+        self.assertEqual(details["hit_ratio"], 0.5)
+        self.assertEqual(self.calls, 1)
+
+    def test_errors_and_large_results_are_not_cached(self):
+        self.cache.run("SELECT x", self.execute("Error: no such column: x"))
+        self.cache.run("SELECT x", self.execute("Error: no such column: x"))
+        self.cache.run("SELECT 2", self.execute("x" * 200))
+        self.cache.run("SELECT 2", self.execute("x" * 200))
+        self.assertEqual(self.calls, 4)
+        self.assertEqual(self.cache.stats()["entries"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+"""
+Unit tests for the columnar staging cache (load_data/staging.py).
+"""
+
+import unittest
+import os
+import tempfile
+import time
+
+# Add parent directory to path for imports
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+
+from load_data import staging
+from load_data.data_loaders import read_source_file, iter_source_chunks
+from load_data.dtypes import MATCHES_READ_DTYPES, concat_frames
+
+
+@unittest.skipUnless(staging.feather is not None, "pyarrow not installed")
+class TestStagingCache(unittest.TestCase):
+    """Staged copies are reused only while the source and read options are unchanged."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.original = (staging.STAGING_DIR, staging.USE_STAGING_CACHE)
+        staging.STAGING_DIR = os.path.join(self.tmp.name, 'staging')
+        staging.USE_STAGING_CACHE = True
+        self.csv_path = os.path.join(self.tmp.name, 'atp_matches_2019.csv')
+        self.read_kwargs = {'low_memory': False, 'dtype': MATCHES_READ_DTYPES}
+        self.write_csv("6-4 6-3", 12)
+
+    def tearDown(self):
+        staging.STAGING_DIR, staging.USE_STAGING_CACHE = self.original
+        self.tmp.cleanup()
+
+    def write_csv(self, score, aces):
+        pd.DataFrame({
+            'tourney_name': ['Halle', 'Halle'],
+            'surface': ['Grass', None],
+            'w_ace': [aces, None],
+            'score': [score, 'W/O'],
+        }).to_csv(self.csv_path, index=False)
+
+    def test_round_trip_keeps_dtypes(self):
+        """A staged copy loads with the same values and dtypes as the CSV parse."""
+        parsed = read_source_file(self.csv_path, 'ATP', self.read_kwargs)
+        self.assertTrue(os.path.exists(staging.staged_paths(self.csv_path)[0]))
+        staged = staging.read_staged(self.csv_path, self.read_kwargs)
+        self.assertIsNotNone(staged)
+        expected = parsed.drop(columns=['tour', '_source_file'])
+        pd.testing.assert_frame_equal(staged, expected)
+        self.assertEqual(str(staged['w_ace'].dtype), 'Int16')
+        self.assertIsInstance(staged['surface'].dtype, pd.CategoricalDtype)
+
+    def test_changed_source_is_parsed_again(self):
+        """Editing the CSV invalidates its staged copy."""
+        read_source_file(self.csv_path, 'ATP', self.read_kwargs)
+        time.sleep(0.01)
+        self.write_csv("7-6(5) 6-3", 15)
+        self.assertIsNone(staging.read_staged(self.csv_path, self.read_kwargs))
+        df = read_source_file(self.csv_path, 'ATP', self.read_kwargs)
+        self.assertEqual(df.loc[0, 'w_ace'], 15)
+        self.assertEqual(staging.read_staged(self.csv_path, self.read_kwargs).loc[0, 'score'], "7-6(5) 6-3")
+
+    def test_touched_source_keeps_staged_copy(self):
+        """A new mtime with identical content is resolved by the content hash."""
+        read_source_file(self.csv_path, 'ATP', self.read_kwargs)
+        stat = os.stat(self.csv_path)
+        os.utime(self.csv_path, (stat.st_atime, stat.st_mtime + 60))
+        self.assertIsNotNone(staging.read_staged(self.csv_path, self.read_kwargs))
+        # The new mtime is stored, so the next run does not hash the file again
+        original_hash_file = staging.hash_file
+        staging.hash_file = None
+        try:
+            self.assertIsNotNone(staging.read_staged(self.csv_path, self.read_kwargs))
+        finally:
+            staging.hash_file = original_hash_file
+
+    def test_different_read_options_are_not_reused(self):
+        """A copy parsed with another dtype plan is not served."""
+        read_source_file(self.csv_path, 'ATP', self.read_kwargs)
+        self.assertIsNone(staging.read_staged(self.csv_path, {'low_memory': False}))
+
+    def test_chunks_match_full_read(self):
+        """Streaming a file in chunks (CSV or staged copy) gives the rows of a full read."""
+        expected = read_source_file(self.csv_path, 'ATP', {'dtype': MATCHES_READ_DTYPES}).drop(columns=['tour'])
+        for _ in range(2):  # first from the staged copy, then from the CSV
+            chunks = list(iter_source_chunks(self.csv_path, 1, MATCHES_READ_DTYPES))
+            self.assertEqual([len(chunk) for chunk in chunks], [1, 1])
+            actual = concat_frames(chunks)
+            pd.testing.assert_frame_equal(actual, expected)
+            staging.USE_STAGING_CACHE = False
+
+    def test_disabled_cache_writes_nothing(self):
+        staging.USE_STAGING_CACHE = False
+        read_source_file(self.csv_path, 'ATP', self.read_kwargs)
+        self.assertFalse(os.path.exists(staging.STAGING_DIR))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+"""
+Unit tests for missing surface inference (fix_missing_surface_data).
+"""
+
+import unittest
+import os
+import io
+import contextlib
+
+# Add parent directory to path for imports
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+
+from load_data.data_transformers import fix_missing_surface_data
+
+
+def infer(rows):
+    df = pd.DataFrame(rows, columns=['tourney_name', 'event_year', 'tourney_level', 'surface'])
+    with contextlib.redirect_stdout(io.StringIO()):
+        return fix_missing_surface_data(df)
+
+
+class TestSurfaceInference(unittest.TestCase):
+    """Each missing surface is filled by the first rule that applies, and the rule is recorded."""
+
+    def test_rules_in_order(self):
+        df = infer([
+            ('Wimbledon', 1990, 'G', None),
+            ('Halle', 2019, 'A', 'Grass'),
+            ('Halle', 2019, 'A', ''),
+            ('Halle', 2020, 'A', None),
+            ('Melbourne', 1980, 'G', None),
+            ('Mystery Cup', 1960, 'A', None),
+            ('Mystery Cup', 2005, 'A', None),
+            ('Indoor Classic', 1995, 'A', None),
+            ('Mystery Cup', None, 'A', None),
+        ])
+        self.assertEqual(df['surface'].tolist(),
+                         ['Grass', 'Grass', 'Grass', 'Grass', 'Hard', 'Grass', 'Hard', 'Carpet', 'Hard'])
+        self.assertEqual(df['surface_source'].astype(str).tolist(),
+                         ['grand_slam', 'recorded', 'tourney_year', 'tourney', 'tourney_level',
+                          'era_default', 'era_default', 'era_default', 'era_default'])
+
+    def test_most_frequent_surface_wins_ties_alphabetically(self):
+        df = infer([
+            ('Cup', 2000, 'A', 'Hard'),
+            ('Cup', 2000, 'A', 'Clay'),
+            ('Cup', 2000, 'A', None),
+            ('Open', 2000, 'A', 'Hard'),
+            ('Open', 2000, 'A', 'Hard'),
+            ('Open', 2000, 'A', 'Clay'),
+            ('Open', 2000, 'A', None),
+        ])
+        self.assertEqual(df.loc[2, 'surface'], 'Clay')
+        self.assertEqual(df.loc[6, 'surface'], 'Hard')
+
+    def test_nothing_missing(self):
+        df = infer([('Halle', 2019, 'A', 'Grass')])
+        self.assertEqual(df['surface_source'].astype(str).tolist(), ['recorded'])
+
+
+if __name__ == '__main__':
+    unittest.main()
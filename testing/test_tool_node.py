@@ -0,0 +1,85 @@
+"""
+Unit tests for the LangGraph tool node.
+"""
+
+import unittest
+import os
+import threading
+
+# Add parent directory to path for imports
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from langchain_core.messages import AIMessage, ToolMessage
+from langchain_core.tools import tool
+
+from agent import AgentState
+from graph.langgraph_builder import LangGraphBuilder
+
+# Both tools wait here until the other one is running; run one after the
+# other, the first wait times out and its call fails
+both_running = threading.Barrier(2)
+
+
+@tool
+def wait_surface(surface: str) -> str:
+    """Map a surface name once the other tool is running."""
+    both_running.wait(timeout=5)
+    return surface.title()
+
+
+@tool
+def wait_round(round_name: str) -> str:
+    """Map a round name once the other tool is running."""
+    both_running.wait(timeout=5)
+    return round_name.upper()
+
+
+@tool
+def upper_round(round_name: str) -> str:
+    """Map a round name."""
+    return round_name.upper()
+
+
+@tool
+def failing_tool(value: str) -> str:
+    """Always fails."""
+    raise ValueError("boom")
+
+
+class TestToolNode(unittest.TestCase):
+    """All tool calls of a turn run concurrently and each gets a ToolMessage."""
+
+    def setUp(self):
+        builder = LangGraphBuilder([wait_surface, wait_round, upper_round, failing_tool], None, None)
+        self.node = builder.create_tool_node()
+        both_running.reset()
+
+    def run_calls(self, *calls, with_ids=True):
+        tool_calls = [{"name": name, "args": args, "id": f"call_{i}" if with_ids else None}
+                      for i, (name, args) in enumerate(calls)]
+        state: AgentState = {"messages": [AIMessage(content="", tool_calls=tool_calls)]}
+        return self.node(state)["messages"]
+
+    def test_all_calls_answered_in_parallel(self):
+        messages = self.run_calls(("wait_surface", {"surface": "clay"}), ("wait_round", {"round_name": "sf"}))
+        self.assertEqual([m.content for m in messages], ["Clay", "SF"])
+        self.assertEqual([m.tool_call_id for m in messages], ["call_0", "call_1"])
+        self.assertTrue(all(isinstance(m, ToolMessage) for m in messages))
+
+    def test_errors_are_reported_per_call(self):
+        messages = self.run_calls(("failing_tool", {"value": "x"}), ("missing_tool", {}),
+                                  ("upper_round", {"round_name": "f"}))
+        self.assertEqual([m.status for m in messages], ["error", "error", "success"])
+        self.assertIn("boom", messages[0].content)
+        self.assertEqual(messages[2].content, "F")
+
+    def test_calls_without_ids_get_unique_ids(self):
+        messages = self.run_calls(("upper_round", {"round_name": "f"}), ("upper_round", {"round_name": "sf"}),
+                                  with_ids=False)
+        self.assertEqual([m.content for m in messages], ["F", "SF"])
+        self.assertEqual(len({m.tool_call_id for m in messages}), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -14,8 +14,10 @@ from tennis_logging.simplified_factory import log_error
 from serve.combined_serve_charts import create_combined_serve_charts
 from return_stats.combined_return_charts import create_combined_return_charts
 from rankings.ranking_timeline_chart import create_ranking_timeline_chart
-from serve.serve_stats import build_year_suffix
+from serve.serve_stats import build_year_suffix, calculate_serve_stats_from_totals
+from return_stats.return_stats import calculate_return_stats_from_totals
 from utils.df_utils import add_player_match_columns
+from constants import PLAYER_SUGGESTION_LIMIT
 
 
 class UIDisplay:
@@ -160,30 +162,52 @@ class UIDisplay:
         # PLAYER SEARCH
         # =============================================================================
         
-        # Get all players for search (already includes "All Players" as first element)
-        all_players = db_service.get_all_players()
+        # Only the top suggestions for the typed text are sent to the widget,
+        # not the full player list (see DatabaseService.search_players)
+        player_query = st.text_input(
+            "Search Player:",
+            key="player_query",
+            placeholder="Type a name (e.g., Federer, Nadal)",
+            help="Type part of a name; accents and small typos are ignored"
+        )
+        player_options = [db_service.ALL_PLAYERS] + db_service.search_players(
+            player_query, limit=PLAYER_SUGGESTION_LIMIT
+        )
         
-        # Use selectbox with search functionality
         selected_player = st.selectbox(
-            "Search Player:",
-            all_players,
+            "Select Player:",
+            player_options,
+            index=1 if player_query and len(player_options) > 1 else 0,
             key="player_select",
-            help="Type to search players (e.g., Federer, Nadal)"
+            help="Best matches first (most matches played)"
         )
         
         # =============================================================================
         # OPPONENT SEARCH
         # =============================================================================
         
+        # Tournaments, year range, surfaces and opponents of the selected player,
+        # all from one query (global lists when no player is selected)
+        player_metadata = db_service.get_player_filter_metadata(selected_player)
+        
         # Get opponent options based on selected player
         if selected_player and selected_player != "All Players":
-            opponent_options = db_service.get_opponents_for_player(selected_player)
+            opponent_options = player_metadata['opponents']
         else:
-            opponent_options = all_players  # Show all players if no player selected
+            # No player selected: suggest opponents from the name index as well
+            opponent_query = st.text_input(
+                "Search Opponent:",
+                key="opponent_query",
+                placeholder="Type a name",
+                help="Type part of a name"
+            )
+            opponent_options = [db_service.ALL_OPPONENTS] + db_service.search_players(
+                opponent_query, limit=PLAYER_SUGGESTION_LIMIT
+            )
         
         # Use selectbox with search functionality
         selected_opponent = st.selectbox(
-            "Search Opponent:",
+            "Search Opponent:" if selected_player and selected_player != "All Players" else "Select Opponent:",
             opponent_options,
             key="opponent_select",
             help="Type to search opponents"
@@ -194,8 +218,7 @@ class UIDisplay:
         # =============================================================================
         
         # Get tournament options based on selected player
-        # get_all_tournaments handles "All Players" case and returns all tournaments when player is None
-        tournament_options = db_service.get_all_tournaments(selected_player)
+        tournament_options = player_metadata['tournaments']
         
         # Use selectbox with search functionality
         selected_tournament = st.selectbox(
@@ -208,11 +231,8 @@ class UIDisplay:
         # =============================================================================
         # YEAR SELECTION (Range Slider)
         # =============================================================================
-        # Get dynamic year range based on selected player
-        if selected_player and selected_player != "All Players":
-            min_year, max_year = db_service.get_player_year_range(selected_player)
-        else:
-            min_year, max_year = (1968, 2024)  # Default range for "All Players"
+        # Get dynamic year range based on selected player ((1968, 2024) for "All Players")
+        min_year, max_year = player_metadata['year_range']
         
         # Check if year range needs to be reset:
         # 1. Player changed, 2. Year range doesn't exist, 3. Current range is invalid
@@ -285,9 +305,8 @@ class UIDisplay:
         # =============================================================================
         # SURFACE SELECTION
         # =============================================================================
-        # Get surface options based on selected player
-        # get_surfaces_for_player returns all surfaces if no player selected
-        surface_options = db_service.get_surfaces_for_player(selected_player)
+        # Get surface options based on selected player (all surfaces if no player selected)
+        surface_options = player_metadata['surfaces']
         
         # Multi-select surface options
         selected_surfaces = st.multiselect(
@@ -328,8 +347,6 @@ class UIDisplay:
             }
             st.session_state.analysis_generated = True
             st.session_state.show_ai_results = False  # Reset AI results to show table
-            # Add cache busting
-            st.session_state.cache_bust = st.session_state.get('cache_bust', 0) + 1
             return True
         
         return False
@@ -353,7 +370,11 @@ class UIDisplay:
         elif st.session_state.get('analysis_generated', False):
             filters = st.session_state.analysis_filters
             
-            # Load filtered match data
+            # Load filtered match data for the charts and RAW tab. A player's
+            # career is loaded in full; unfiltered views are capped (the Matches
+            # tab still pages through every match)
+            player_selected = filters['player'] and filters['player'] != 'All Players'
+            chart_row_limit = None if player_selected else db_service.DEFAULT_QUERY_LIMIT
             df_matches = db_service.get_matches_with_filters(
                 player=filters['player'],
                 opponent=filters['opponent'],
@@ -361,7 +382,7 @@ class UIDisplay:
                 year=filters['year'],
                 surfaces=filters['surfaces'],
                 return_all_columns=True,  # Get all columns for charts/tables Statistics
-                _cache_bust=st.session_state.get('cache_bust', 0)
+                max_rows=chart_row_limit
             )
             
             if df_matches.empty:
@@ -379,13 +400,17 @@ class UIDisplay:
             
             # Render each tab using dedicated methods
             with tab_matches:
-                UIDisplay._render_matches_tab(df_matches)
+                UIDisplay._render_matches_tab(db_service, filters)
+            
+            if chart_row_limit is not None and len(df_matches) >= chart_row_limit:
+                st.info(f"Charts and RAW data use the first {chart_row_limit:,} matches. "
+                        "Select a player for full results; the Matches tab lists every match.")
             
             with tab_serve:
-                UIDisplay._render_serve_tab(df_matches, filters)
+                UIDisplay._render_serve_tab(df_matches, filters, db_service)
             
             with tab_return:
-                UIDisplay._render_return_tab(df_matches, filters)
+                UIDisplay._render_return_tab(df_matches, filters, db_service)
             
             with tab_ranking:
                 UIDisplay._render_ranking_tab(db_service, filters)
@@ -409,8 +434,17 @@ class UIDisplay:
             agent_graph: LangGraph agent instance
         """
         try:
+            # Slots filled while the agent runs: the answer streams in token by token
+            summary_placeholder = st.empty()
+            progress_placeholder = st.empty()
+            response_placeholder = st.empty()
+            
             with st.spinner("AI is analyzing your question..."):
-                query_processor.handle_user_query(st.session_state.ai_query, agent_graph)
+                query_processor.handle_user_query(
+                    st.session_state.ai_query, agent_graph,
+                    response_placeholder=response_placeholder,
+                    progress_placeholder=progress_placeholder
+                )
             
             # Display summary and response if available
             summary = st.session_state.get('ai_query_summary')
@@ -419,12 +453,14 @@ class UIDisplay:
             if response:
                 # Show summary if available (only generated for responses > 5 lines)
                 if summary:
-                    st.markdown("### Summary")
-                    st.info(summary)
+                    with summary_placeholder.container():
+                        st.markdown("### Summary")
+                        st.info(summary)
                 
                 # Show full response
-                st.markdown(response)
+                response_placeholder.markdown(response)
             else:
+                response_placeholder.empty()
                 st.warning("I processed your request but couldn't generate a clear response. Please check the conversation flow below for details.")
                 
                 # Check if this might be a misspelling issue
@@ -452,31 +488,70 @@ class UIDisplay:
         ])
     
     @staticmethod
-    def _render_matches_tab(df_matches):
+    def _render_matches_tab(db_service, filters):
         """
-        Render the Matches tab displaying filtered match data.
+        Render the Matches tab, one page of filtered matches at a time.
+        
+        Pages are read lazily with keyset pagination; the start key of every
+        visited page is kept in session state so Previous is a cached lookup.
         
         Args:
-            df_matches: DataFrame containing match data
+            db_service: DatabaseService instance for querying data
+            filters: Dictionary containing filter values
         """
+        filter_args = dict(
+            player=filters['player'],
+            opponent=filters['opponent'],
+            tournament=filters['tournament'],
+            year=filters['year'],
+            surfaces=filters['surfaces'],
+        )
+        # Start over at page 1 whenever the filters change
+        if st.session_state.get('matches_page_filters') != filter_args:
+            st.session_state.matches_page_filters = filter_args
+            st.session_state.matches_page_keys = [None]
+        page_keys = st.session_state.matches_page_keys
+        page_size = db_service.MATCH_PAGE_SIZE
+        
+        df_page, next_key = db_service.get_matches_page(
+            **filter_args, page_size=page_size, after=page_keys[-1]
+        )
+        total = db_service.count_matches_with_filters(**filter_args)
+        page_number = len(page_keys)
+        first_row = (page_number - 1) * page_size + 1
+        
         # Define display columns for table view
         display_columns = ['event_year', 'tourney_date', 'tourney_name', 
                           'round', 'winner_name', 'loser_name', 'surface', 'score']
         
-        st.dataframe(df_matches[display_columns], width='stretch')
-        if st.button("🗑️ Clear Results", key="clear_matches"):
-            st.session_state.analysis_generated = False
-            st.session_state.analysis_context = {}
-            st.rerun()
+        st.dataframe(df_page[display_columns], width='stretch')
+        st.caption(f"Matches {first_row:,}-{first_row + len(df_page) - 1:,} of {total:,}")
+        
+        col_prev, col_next, col_clear = st.columns(3)
+        with col_prev:
+            if st.button("◀ Previous", key="matches_prev_page", disabled=page_number == 1):
+                page_keys.pop()
+                st.rerun()
+        with col_next:
+            if st.button("Next ▶", key="matches_next_page", disabled=next_key is None):
+                page_keys.append(next_key)
+                st.rerun()
+        with col_clear:
+            if st.button("🗑️ Clear Results", key="clear_matches"):
+                st.session_state.analysis_generated = False
+                st.session_state.analysis_context = {}
+                st.rerun()
     
     @staticmethod
-    def _render_serve_tab(df_matches, filters):
+    def _render_serve_tab(df_matches, filters, db_service=None):
         """
         Render the Serve Statistics tab with charts.
         
         Args:
             df_matches: DataFrame containing match data (already filtered)
             filters: Dictionary containing filter values
+            db_service: Optional DatabaseService used to read the radar chart stats
+                        from the pre-summed player_aggregates table
         """
         # Extract filter values for chart title/display
         player = filters['player'] if filters['player'] != 'All Players' else None
@@ -490,6 +565,13 @@ class UIDisplay:
         # year is already in correct format (int, tuple, or None)
         
         if player:
+            # Aggregates cover year and surface filters; opponent/tournament views
+            # still aggregate the loaded match rows
+            player_stats = None
+            if db_service is not None and not opponent and not tournament:
+                totals = db_service.get_player_aggregates(player, year=year, surfaces=surfaces)
+                player_stats = calculate_serve_stats_from_totals(totals)
+            
             try:
                 # Create and display serve charts using pre-loaded DataFrame
                 timeline_fig, ace_df_timeline_fig, bp_timeline_fig, radar_fig = create_combined_serve_charts(
@@ -498,7 +580,8 @@ class UIDisplay:
                     year=year,
                     opponent=opponent,
                     tournament=tournament,
-                    surfaces=surfaces
+                    surfaces=surfaces,
+                    player_stats=player_stats
                 )
 
                 # Use config parameter for Plotly configuration to show the mode bar
@@ -524,13 +607,15 @@ class UIDisplay:
             st.info("ℹ️ Please select a player to view serve statistics.")
     
     @staticmethod
-    def _render_return_tab(df_matches, filters):
+    def _render_return_tab(df_matches, filters, db_service=None):
         """
         Render the Return Statistics tab with charts.
         
         Args:
             df_matches: DataFrame containing match data (already filtered)
             filters: Dictionary containing filter values
+            db_service: Optional DatabaseService used to read the radar chart stats
+                        from the pre-summed player_aggregates table
         """
         # Extract filter values for chart title/display
         player = filters['player'] if filters['player'] != 'All Players' else None
@@ -544,6 +629,13 @@ class UIDisplay:
         # year is already in correct format (int, tuple, or None)
         
         if player:
+            # Aggregates cover year and surface filters; opponent/tournament views
+            # still aggregate the loaded match rows
+            player_stats = None
+            if db_service is not None and not opponent and not tournament:
+                totals = db_service.get_player_aggregates(player, year=year, surfaces=surfaces)
+                player_stats = calculate_return_stats_from_totals(totals)
+            
             try:
                 # Create and display return charts using pre-loaded DataFrame
                 return_points_timeline_fig, bp_conversion_timeline_fig, radar_fig = create_combined_return_charts(
@@ -552,7 +644,8 @@ class UIDisplay:
                     year=year,
                     opponent=opponent,
                     tournament=tournament,
-                    surfaces=surfaces
+                    surfaces=surfaces,
+                    player_stats=player_stats
                 )
 
                 # Use config parameter for Plotly configuration to show the mode bar
@@ -24,6 +24,10 @@ def add_player_match_columns(df, player_name, case_sensitive=False):
     Returns:
         DataFrame: DataFrame with added columns: is_winner, opponent, result
     """
+    # Already provided by the query (DatabaseService reads them from player_matches)
+    if all(col in df.columns for col in ('is_winner', 'opponent', 'result')):
+        return df
+    
     df = df.copy()
     
     # Calculate is_winner boolean Series
@@ -44,3 +48,35 @@ def add_player_match_columns(df, player_name, case_sensitive=False):
     
     return df
 
+
+
+# Low-cardinality text columns of match query results (stored as categoricals)
+CATEGORY_COLUMNS = (
+    'surface', 'tourney_level', 'round', 'tour', 'tournament_type', 'era',
+    'winner_entry', 'winner_hand', 'winner_ioc',
+    'loser_entry', 'loser_hand', 'loser_ioc',
+)
+
+
+def compact_dtypes(df, category_columns=CATEGORY_COLUMNS):
+    """
+    Shrink a query result in place: float64 to float32, low-cardinality text to categoricals.
+    
+    SQLite returns every numeric column with a NULL (most match stats) as
+    float64 and every text column as Python strings. Counts and percentages
+    lose nothing meaningful in float32, and categoricals store each distinct
+    surface/round/level once.
+    
+    Args:
+        df: DataFrame returned by a database query
+        category_columns: Text columns to convert to categoricals (when present)
+    
+    Returns:
+        DataFrame: The same DataFrame with compact dtypes
+    """
+    for col in df.columns:
+        if df[col].dtype == np.float64:
+            df[col] = df[col].astype(np.float32)
+        elif col in category_columns and not isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].astype('category')
+    return df
@@ -1,18 +1,19 @@
 -- SQL Query: Players with Most Points in Year-End Rankings (ATP)
 -- This query finds players with the highest ranking points in year-end rankings
 -- Year-end rankings are typically published in the last week of December (days 25-31)
+-- Filters use the integer ranking_year / ranking_yyyymmdd columns, and the year-end
+-- condition below matches the partial index idx_atp_rankings_year_end exactly
 
 -- Query 1: Top players by year-end ranking points (all-time)
 -- Filters for last week of December (days 25-31) to capture year-end rankings
 SELECT 
     player_name,
-    strftime('%Y', ranking_date) AS year,
+    ranking_year AS year,
     rank,
     points,
     ranking_date
 FROM atp_rankings
-WHERE strftime('%m', ranking_date) = '12'
-    AND CAST(strftime('%d', ranking_date) AS INTEGER) BETWEEN 25 AND 31
+WHERE ranking_yyyymmdd % 10000 BETWEEN 1225 AND 1231
     AND points IS NOT NULL
 ORDER BY points DESC
 LIMIT 50;
@@ -28,14 +29,13 @@ SELECT
 FROM (
     SELECT 
         player_name,
-        strftime('%Y', ranking_date) AS year,
+        ranking_year AS year,
         rank,
         points,
         ranking_date,
-        ROW_NUMBER() OVER (PARTITION BY strftime('%Y', ranking_date) ORDER BY points DESC, ranking_date DESC) AS rn
+        ROW_NUMBER() OVER (PARTITION BY ranking_year ORDER BY points DESC, ranking_date DESC) AS rn
     FROM atp_rankings
-    WHERE strftime('%m', ranking_date) = '12'
-        AND CAST(strftime('%d', ranking_date) AS INTEGER) BETWEEN 25 AND 31
+    WHERE ranking_yyyymmdd % 10000 BETWEEN 1225 AND 1231
         AND points IS NOT NULL
 )
 WHERE rn = 1
@@ -51,8 +51,7 @@ WITH player_stats AS (
         MIN(rank) AS best_year_end_rank,
         AVG(points) AS avg_year_end_points
     FROM atp_rankings
-    WHERE strftime('%m', ranking_date) = '12'
-        AND CAST(strftime('%d', ranking_date) AS INTEGER) BETWEEN 25 AND 31
+    WHERE ranking_yyyymmdd % 10000 BETWEEN 1225 AND 1231
         AND points IS NOT NULL
     GROUP BY player_name
     HAVING COUNT(*) >= 1
@@ -64,13 +63,12 @@ year_of_max_points AS (
         ps.highest_year_end_points,
         ps.best_year_end_rank,
         ps.avg_year_end_points,
-        strftime('%Y', r.ranking_date) AS year_of_highest_points,
+        r.ranking_year AS year_of_highest_points,
         ROW_NUMBER() OVER (PARTITION BY ps.player_name ORDER BY r.ranking_date DESC) AS rn
     FROM player_stats ps
     JOIN atp_rankings r ON r.player_name = ps.player_name
         AND r.points = ps.highest_year_end_points
-        AND strftime('%m', r.ranking_date) = '12'
-        AND CAST(strftime('%d', r.ranking_date) AS INTEGER) BETWEEN 25 AND 31
+        AND r.ranking_yyyymmdd % 10000 BETWEEN 1225 AND 1231
         AND r.points IS NOT NULL
 )
 SELECT 